@@ -0,0 +1,89 @@
+"""
+Micro-benchmark of the merge of parsing entities in `hydrate_job_with_parsing`
+
+Each entity is searched by name in the list of the job, and appended if it is missing.
+The list is scanned by `find_element_in_list`, or looked up in an `ElementIndex`.
+
+    python benchmarks/find_element_in_list.py
+"""
+from typing import Any, Dict, List
+import random
+import string
+import timeit
+
+from hrflow_connectors.utils.hrflow import ElementIndex, find_element_in_list
+
+ENTITY_COUNTS = [200, 500, 2000]
+RUN_COUNT = 5
+
+
+def generate_entities(entity_count: int, seed: int = 0) -> List[Dict[str, Any]]:
+    """
+    Generate skills with random names, some of them duplicated
+
+    Args:
+        entity_count (int): number of skills
+        seed (int, optional): seed of the random generator. Defaults to 0.
+
+    Returns:
+        List[Dict[str, Any]]: skills
+    """
+    generator = random.Random(seed)
+    names = [
+        "".join(generator.choices(string.ascii_lowercase, k=8))
+        for _ in range(entity_count)
+    ]
+    return [
+        dict(name=generator.choice(names), type="hard", value=None)
+        for _ in range(entity_count)
+    ]
+
+
+def merge_entities(
+    entity_list: List[Dict[str, Any]], use_index: bool = False
+) -> List[Dict[str, Any]]:
+    """
+    De-duplicate the entities by name, as `hydrate_job_with_parsing`
+
+    Args:
+        entity_list (List[Dict[str, Any]]): parsed entities
+        use_index (bool, optional): index the merged list by name. Defaults to False (scan).
+
+    Returns:
+        List[Dict[str, Any]]: merged entities
+    """
+    merged_list = []
+    index = ElementIndex(merged_list, "name") if use_index else None
+    for entity in entity_list:
+        element = find_element_in_list(merged_list, index=index, name=entity["name"])
+        if element is None:
+            merged_list.append(entity)
+            if index is not None:
+                index.add(entity)
+    return merged_list
+
+
+def main():
+    for entity_count in ENTITY_COUNTS:
+        entity_list = generate_entities(entity_count)
+        assert merge_entities(entity_list) == merge_entities(entity_list, use_index=True)
+
+        scan_time = (
+            timeit.timeit(lambda: merge_entities(entity_list), number=RUN_COUNT)
+            / RUN_COUNT
+        )
+        index_time = (
+            timeit.timeit(
+                lambda: merge_entities(entity_list, use_index=True),
+                number=RUN_COUNT,
+            )
+            / RUN_COUNT
+        )
+        print(
+            f"{entity_count} entities: scan {scan_time * 1000:.2f} ms, "
+            f"index {index_time * 1000:.2f} ms ({scan_time / index_time:.0f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -44,7 +44,7 @@ class PullJobsAction(PullJobsBaseAction):
                 get_company_id_request.url = "https://api.breezy.hr/v3/companies"
                 get_company_id_request.auth = self.auth
                 prepared_request = get_company_id_request.prepare()
-                response = session.send(prepared_request)
+                response = self.http_client.send(prepared_request)
                 if not response.ok:
                     raise PullError(response, message="Couldn't get company id")
                 company_list = response.json()
@@ -54,7 +54,6 @@ class PullJobsAction(PullJobsBaseAction):
                         return company["_id"]
 
         # Prepare request
-        session = requests.Session()
         pull_jobs_request = requests.Request()
         pull_jobs_request.method = "GET"
         pull_jobs_request.url = (
@@ -64,7 +63,7 @@ class PullJobsAction(PullJobsBaseAction):
         prepared_request = pull_jobs_request.prepare()
 
         # Send request
-        response = session.send(prepared_request)
+        response = self.http_client.send(prepared_request)
 
         if not response.ok:
             raise PullError(response, message="Failed to get jobs from this endpoint")
@@ -274,7 +273,6 @@ class PushProfileAction(PushProfileBaseAction):
         """
         profile = next(data)
         auth = self.auth
-        session = requests.Session()
 
         def send_request(
             error_message: str,
@@ -302,7 +300,7 @@ class PushProfileAction(PushProfileBaseAction):
             if json is not None:
                 request.json = json
             prepared_request = request.prepare()
-            response = session.send(prepared_request)
+            response = self.http_client.send(prepared_request)
             if not response.ok:
                 raise PushError(response, message=error_message)
             return response
@@ -117,7 +117,7 @@ class PushProfileAction(PushProfileBaseAction):
             attachments_json = []
             for hrflow_attachment in attachment_list:
                 url = hrflow_attachment["public_url"]
-                response = requests.get(url)
+                response = self.http_client.get(url)
                 b64 = base64.b64encode(response.content)
 
                 attachment = {
@@ -156,7 +156,6 @@ class PushProfileAction(PushProfileBaseAction):
         enrich_profile_attachment = profile_body_dict["enrich_profile_attachment"]
 
         # Preparing the request to push the profile
-        session = requests.Session()
         push_profile_request = requests.Request()
         push_profile_request.method = "PUT"
         push_profile_request.url = f"https://{self.subdomain}.bullhornstaffing.com/rest-services/7zwdd0/entity/Candidate"
@@ -165,7 +164,7 @@ class PushProfileAction(PushProfileBaseAction):
         prepared_request = push_profile_request.prepare()
 
         # Send request
-        response = session.send(prepared_request)
+        response = self.http_client.send(prepared_request)
         if not response.ok:
             raise PushError(response)
 
@@ -178,7 +177,6 @@ class PushProfileAction(PushProfileBaseAction):
             education = education.dict()
             # Set the Id of the candidate to enrich to the Id of the candidate whom have just been created
             education["candidate"]["id"] = candidate_id
-            session = requests.Session()
             push_profile_request = requests.Request()
             push_profile_request.method = "PUT"
             push_profile_request.url = f"https://{self.subdomain}.bullhornstaffing.com/rest-services/7zwdd0/entity/CandidateEducation"
@@ -187,7 +185,7 @@ class PushProfileAction(PushProfileBaseAction):
             prepared_request = push_profile_request.prepare()
 
             # Send request for enrichment
-            response = session.send(prepared_request)
+            response = self.http_client.send(prepared_request)
             if not response.ok:
                 raise PushError(response)
 
@@ -196,7 +194,6 @@ class PushProfileAction(PushProfileBaseAction):
             experience = experience.dict()
             # Set the Id of the candidate to enrich to the Id of the candidate whom have just been created
             experience["candidate"]["id"] = candidate_id
-            session = requests.Session()
             push_profile_request = requests.Request()
             push_profile_request.method = "PUT"
             push_profile_request.url = f"https://{self.subdomain}.bullhornstaffing.com/rest-services/7zwdd0/entity/CandidateWorkHistory"
@@ -205,14 +202,13 @@ class PushProfileAction(PushProfileBaseAction):
             prepared_request = push_profile_request.prepare()
 
             # Send request for enrichment
-            response = session.send(prepared_request)
+            response = self.http_client.send(prepared_request)
             if not response.ok:
                 raise PushError(response)
 
         # Preparing the request to enrich attachment
         for attachment in enrich_profile_attachment:
             attachment = attachment.dict()
-            session = requests.Session()
             push_profile_request = requests.Request()
             push_profile_request.method = "PUT"
             push_profile_request.url = f"https://{self.subdomain}.bullhornstaffing.com/rest-services/7zwdd0/file/Candidate/{candidate_id}"
@@ -221,6 +217,6 @@ class PushProfileAction(PushProfileBaseAction):
             prepared_request = push_profile_request.prepare()
 
             # Send request for enrichment
-            response = session.send(prepared_request)
+            response = self.http_client.send(prepared_request)
             if not response.ok:
                 raise PushError(response)
@@ -4,6 +4,7 @@ import requests
 
 from ...core.error import PullError
 from ...core.action import PullJobsBaseAction
+from ...core.json_stream import iter_response_json_array
 from ...utils.schemas import HrflowJob
 from .schemas import CeridianDayforceJobModel
 
@@ -23,19 +24,19 @@ class PullJobsAction(PullJobsBaseAction):
         Returns:
             Iterator[CeridianDayforceJobModel]: a list of jobs dictionaries
         """
-        session = requests.Session()
         pull_jobs_request = requests.Request()
         pull_jobs_request.method = "GET"
         pull_jobs_request.url = f"https://{self.subdomain}.dayforcehcm.com/Api/{self.client_name_space}/V1/JobFeeds"
         prepared_request = pull_jobs_request.prepare()
 
         # Send request
-        response = session.send(prepared_request)
+        response = self.http_client.send(prepared_request, stream=True)
 
         if not response.ok:
             raise PullError(response)
-        job_json_list = response.json()
-        job_obj_iter = map(CeridianDayforceJobModel.parse_obj, job_json_list)
+        # The jobs are decoded one by one while the response is received
+        job_json_iter = iter_response_json_array(response)
+        job_obj_iter = map(CeridianDayforceJobModel.parse_obj, job_json_iter)
         return job_obj_iter
 
     def format(self, data: CeridianDayforceJobModel) -> HrflowJob:
@@ -5,6 +5,7 @@ import requests
 from ...core.auth import OAuth2PasswordCredentialsBody
 from ...core.error import PullError, PushError
 from ...core.action import PullJobsBaseAction, PushProfileBaseAction
+from ...core.json_stream import iter_response_json_array
 from ...utils.hrflow import generate_workflow_response
 from ...utils.schemas import HrflowJob, HrflowProfile
 from .schemas import CrosstalentJob, CrosstalentProfile
@@ -21,7 +22,6 @@ class PullJobsAction(PullJobsBaseAction):
 
     def pull(self) -> Iterator[CrosstalentJob]:
         # Prepare request
-        session = requests.Session()
         pull_jobs_request = requests.Request()
         pull_jobs_request.method = "GET"
         pull_jobs_request.url = f"https://{self.subdomain}.salesforce.com/services/apexrest/crta/HrFlowGetJobOffers/"
@@ -29,12 +29,13 @@ class PullJobsAction(PullJobsBaseAction):
         prepared_request = pull_jobs_request.prepare()
 
         # Send request
-        response = session.send(prepared_request)
+        response = self.http_client.send(prepared_request, stream=True)
 
         if not response.ok:
             raise PullError(response)
-        job_json_list = response.json()
-        job_obj_iter = map(CrosstalentJob.parse_obj, job_json_list)
+        # The jobs are decoded one by one while the response is received
+        job_json_iter = iter_response_json_array(response)
+        job_obj_iter = map(CrosstalentJob.parse_obj, job_json_iter)
 
         return job_obj_iter
 
@@ -335,7 +336,6 @@ class PushProfileAction(PushProfileBaseAction):
         profile = next(data)
 
         # Prepare request
-        session = requests.Session()
         push_profile_request = requests.Request()
         push_profile_request.method = "POST"
         push_profile_request.url = f"https://{self.subdomain}.salesforce.com/services/apexrest/crta/HrFlowCreateProfile"
@@ -344,7 +344,7 @@ class PushProfileAction(PushProfileBaseAction):
         prepared_request = push_profile_request.prepare()
 
         # Send request
-        response = session.send(prepared_request)
+        response = self.http_client.send(prepared_request)
 
         if not response.ok:
             raise PushError(response)
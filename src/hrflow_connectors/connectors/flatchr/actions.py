@@ -43,7 +43,7 @@ class PushProfileAction(PushProfileBaseAction):
                     if attachment["file_name"] == file_name:
                         # Get the base64's resume from its AWS url.
                         url = attachment["public_url"]
-                        response = requests.get(url)
+                        response = self.http_client.get(url)
                         b64 = base64.b64encode(response.content)
                         return b64.decode()
             return None
@@ -233,8 +233,6 @@ class PushProfileAction(PushProfileBaseAction):
         create_profile_body = profile_body_obj["create_profile_body"]
         enrich_profile_body = profile_body_obj["enrich_profile_body"]
 
-        session = requests.Session()
-
         # Prepare create request
         logger.info("Preparing `create profile` request")
         create_profile_request = requests.Request()
@@ -258,11 +256,11 @@ class PushProfileAction(PushProfileBaseAction):
 
         # Send requests
         logger.info("Sending `create profile` request")
-        response = session.send(prepared_create_profile_request)
+        response = self.http_client.send(prepared_create_profile_request)
         if not response.ok:
             raise PushError(response, message="Create profile to Flatchr failed")
 
         logger.info("Sending `enrich profile` request")
-        response = session.send(prepared_enrich_profile_request)
+        response = self.http_client.send(prepared_enrich_profile_request)
         if not response.ok:
             raise PushError(response, message="Enrich Flatchr profile failed")
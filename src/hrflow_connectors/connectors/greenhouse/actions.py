@@ -5,6 +5,7 @@ import requests
 
 from ...core.error import PullError, PushError
 from ...core.action import PullJobsBaseAction, PushProfileBaseAction
+from ...core.json_stream import iter_response_json_array
 from ...utils.logger import get_logger
 from ...utils.clean_text import remove_html_tags
 from ...utils.hrflow import generate_workflow_response
@@ -29,7 +30,6 @@ class PullJobsAction(PullJobsBaseAction):
             Iterator[GreenhouseJobModel]: list of all jobs with their content if available
         """
         # Prepare request
-        session = requests.Session()
         pull_jobs_request = requests.Request()
         pull_jobs_request.method = "GET"
         pull_jobs_request.url = f"https://boards-api.greenhouse.io/v1/boards/{self.board_token}/jobs/?content=true"
@@ -37,7 +37,7 @@ class PullJobsAction(PullJobsBaseAction):
         prepared_request = pull_jobs_request.prepare()
 
         # Send request
-        response = session.send(prepared_request)
+        response = self.http_client.send(prepared_request, stream=True)
 
         if not response.ok:
             raise PullError(
@@ -46,12 +46,9 @@ class PullJobsAction(PullJobsBaseAction):
                 board_token=self.board_token,
             )
 
-        response_dict = response.json()
-        total_info = response_dict["meta"]["total"]
-        logger.info(f"Total jobs found : {total_info}")
-
-        job_json_list = response_dict["jobs"]
-        job_obj_iter = map(GreenhouseJobModel.parse_obj, job_json_list)
+        # The jobs are decoded one by one while the response is received
+        job_json_iter = iter_response_json_array(response, path="jobs")
+        job_obj_iter = map(GreenhouseJobModel.parse_obj, job_json_iter)
         return job_obj_iter
 
     def format(self, data: GreenhouseJobModel) -> HrflowJob:
@@ -218,7 +215,6 @@ class PushProfileAction(PushProfileBaseAction):
         profile = next(data)
 
         # Prepare request
-        session = requests.Session()
         push_profile_request = requests.Request()
         push_profile_request.method = "POST"
         push_profile_request.url = "https://harvest.greenhouse.io/v1/candidates"
@@ -228,7 +224,7 @@ class PushProfileAction(PushProfileBaseAction):
         prepared_request = push_profile_request.prepare()
 
         # Send request
-        response = session.send(prepared_request)
+        response = self.http_client.send(prepared_request)
 
         if not response.ok:
             raise PushError(response)
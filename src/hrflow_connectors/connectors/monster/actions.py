@@ -280,7 +280,6 @@ class PushJobAction(PushJobBaseAction):
         job = next(data)
 
         # Preparing the request to push the job
-        session = requests.Session()
         push_job_request = requests.Request()
         push_job_request.method = "POST"
         push_job_request.url = f"https://{self.subdomain}.monster.com:8443/bgwBroker"
@@ -290,6 +289,6 @@ class PushJobAction(PushJobBaseAction):
         prepared_request = push_job_request.prepare()
 
         # Send request
-        response = session.send(prepared_request)
+        response = self.http_client.send(prepared_request)
         if not response.ok:
             raise PushError(response)
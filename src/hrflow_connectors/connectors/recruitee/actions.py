@@ -5,6 +5,7 @@ import requests
 from ...core.error import PullError, PushError
 from ...core.auth import AuthorizationAuth
 from ...core.action import PullJobsBaseAction, PushProfileBaseAction
+from ...core.json_stream import iter_response_json_array
 from ...utils.hrflow import generate_workflow_response
 from ...utils.logger import get_logger
 from ...utils.clean_text import remove_html_tags
@@ -28,7 +29,6 @@ class PullJobsAction(PullJobsBaseAction):
             Iterator[RecruiteeJobModel]: a list of jobs dictionaries
         """
         # Prepare request
-        session = requests.Session()
         pull_jobs_request = requests.Request()
         pull_jobs_request.method = "GET"
         pull_jobs_request.url = f"https://{self.subdomain}.recruitee.com/api/offers"
@@ -36,7 +36,7 @@ class PullJobsAction(PullJobsBaseAction):
         prepared_request = pull_jobs_request.prepare()
 
         # Send request
-        response = session.send(prepared_request)
+        response = self.http_client.send(prepared_request, stream=True)
 
         if not response.ok:
             raise PullError(
@@ -44,9 +44,9 @@ class PullJobsAction(PullJobsBaseAction):
                 message="Failed to get jobs for company. Check that the subdomain is a valid one.",
                 subdomain=self.subdomain,
             )
-        response_dict = response.json()
-        job_list = response_dict["offers"]
-        job_obj_iter = map(RecruiteJobModel.parse_obj, job_list)
+        # The jobs are decoded one by one while the response is received
+        job_json_iter = iter_response_json_array(response, path="offers")
+        job_obj_iter = map(RecruiteJobModel.parse_obj, job_json_iter)
         return job_obj_iter
 
     def format(self, data: RecruiteJobModel) -> HrflowJob:
@@ -168,7 +168,6 @@ class PushProfileAction(PushProfileBaseAction):
         profile = next(data)
 
         # Prepare request
-        session = requests.Session()
         push_profile_request = requests.Request()
         push_profile_request.method = "POST"
         push_profile_request.url = (
@@ -179,7 +178,7 @@ class PushProfileAction(PushProfileBaseAction):
         prepared_request = push_profile_request.prepare()
 
         # Send request
-        response = session.send(prepared_request)
+        response = self.http_client.send(prepared_request)
 
         if not response.ok:
             raise PushError(response)
@@ -1,11 +1,13 @@
 from typing import Iterator, Dict, Any, Union, Optional
 from pydantic import Field
-import requests
 import datetime
+import itertools
+import requests
 
-from ...core.error import PullError, PushError
+from ...core.error import PushError
 from ...core.auth import OAuth2PasswordCredentialsBody, XAPIKeyAuth
 from ...core.action import PullJobsBaseAction, PushProfileBaseAction
+from ...core.pagination import ODataPaginator
 from ...utils.logger import get_logger
 from ...utils.clean_text import remove_html_tags
 from ...utils.datetime_converter import from_str_to_datetime
@@ -18,8 +20,10 @@ logger = get_logger()
 class PullJobsAction(PullJobsBaseAction):
 
     auth: Union[XAPIKeyAuth, OAuth2PasswordCredentialsBody]
-    top: int = Field(
-        20, description="show only the first n items, value by default = `20`"
+    top: Optional[int] = Field(
+        None,
+        ge=1,
+        description="show only the first n items, value by default = `None` (all the items, page by page)",
     )
     api_server: str = Field(
         ...,
@@ -34,24 +38,23 @@ class PullJobsAction(PullJobsBaseAction):
             Iterator[SAPSuccessFactorsJob]: list of all job requisitions with their content
         """
         # Prepare request
-        session = requests.Session()
         pull_jobs_request = requests.Request()
         pull_jobs_request.method = "GET"
-        pull_jobs_request.url = f"https://{self.api_server}/odata/v2/JobRequisitionLocale?$top={self.top}&expand=jobRequisition"
+        pull_jobs_request.url = f"https://{self.api_server}/odata/v2/JobRequisitionLocale?expand=jobRequisition"
+        if self.top is not None:
+            pull_jobs_request.url += f"&$top={self.top}"
         pull_jobs_request.auth = self.auth
         pull_jobs_request.headers = {"Accept": "application/json"}
-        prepared_request = pull_jobs_request.prepare()
-
-        # Send request
-        response = session.send(prepared_request)
 
-        if not response.ok:
-            raise PullError(response)
-
-        logger.info(f"All jobs have been pulled")
-        response_dict = response.json()
-        job_list = response_dict["d"]["results"]
-        job_obj_iter = map(SAPSuccessFactorsJob.parse_obj, job_list)
+        # The server gives the URL of the next page in `d.__next`
+        paginator = ODataPaginator()
+        page_iter = paginator.iter_pages(
+            self.http_client, pull_jobs_request, error_message="Failed to get jobs"
+        )
+        chained_job_iter = itertools.chain.from_iterable(
+            page["d"]["results"] for page in page_iter
+        )
+        job_obj_iter = map(SAPSuccessFactorsJob.parse_obj, chained_job_iter)
         return job_obj_iter
 
     def format(self, data: SAPSuccessFactorsJob) -> HrflowJob:
@@ -308,7 +311,6 @@ class PushProfileAction(PushProfileBaseAction):
         profile = next(data)
 
         # Prepare request
-        session = requests.Session()
         push_profile_request = requests.Request()
         push_profile_request.method = "POST"
         push_profile_request.url = f"https://{self.api_server}/odata/v2/Candidate"
@@ -317,7 +319,7 @@ class PushProfileAction(PushProfileBaseAction):
         prepared_request = push_profile_request.prepare()
 
         # Send request
-        response = session.send(prepared_request)
+        response = self.http_client.send(prepared_request)
         if self.profile_already_exists in response.content.decode("utf-8"):
             logger.warning("Profile already exists")
         else:
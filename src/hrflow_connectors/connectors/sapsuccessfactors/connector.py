@@ -14,7 +14,7 @@ class SapSuccessfactors(Connector):
         hrflow_client: Hrflow,
         board_key: str,
         api_server: str,
-        top: int,
+        top: Optional[int] = None,
         **kwargs
     ) -> Optional[Dict[str, Any]]:
         """
@@ -33,7 +33,7 @@ class SapSuccessfactors(Connector):
             format_function_name (Optional[str], optional): Function name to format job before pushing. Default value `None`
             hydrate_with_parsing (bool, optional): Enrich the job with parsing. Default value `False`
             archive_deleted_jobs_from_stream (bool, optional): Archive Board jobs when they are no longer in the incoming job stream. Default value `True`
-            top (int, optional): show only the first n items, value by default = `20`. Default value `20`
+            top (Optional[int], optional): show only the first n items. Default value `None` (all the items, page by page)
 
         Returns:
             Optional[Dict[str, Any]]: Workflow response or `None`
@@ -1,11 +1,16 @@
-from typing import Iterator, Dict, Any, Optional
-from pydantic import Field
+from typing import Iterator, Dict, Any, List, Optional
+from pydantic import Field, PrivateAttr
+import datetime
 import itertools
 import requests
 
 from ...core.error import PullError, PushError
 from ...core.action import PullJobsBaseAction, PushProfileBaseAction
+from ...core.ratelimit import set_default_rate_limit
 from ...core.auth import XSmartTokenAuth
+from ...core.filter import FilterSpec, FilterOperator
+from ...core.state import SyncState
+from ...utils.concurrency import ordered_parallel_map, prefetch
 from ...utils.logger import get_logger
 from ...utils.schemas import HrflowJob, HrflowProfile
 from .schemas import SmartrecruitersProfileModel, SmartRecruitersModel
@@ -13,6 +18,9 @@ from .schemas import SmartrecruitersProfileModel, SmartRecruitersModel
 
 logger = get_logger()
 
+# SmartRecruiters quota : 10 requests per second, burst + rate * 1 <= 10
+set_default_rate_limit("api.smartrecruiters.com", rate=9, burst=1)
+
 
 class PullJobsAction(PullJobsBaseAction):
     auth: XSmartTokenAuth
@@ -35,6 +43,85 @@ class PullJobsAction(PullJobsBaseAction):
         10,
         description="Number of elements to return per page. max value is 100. Default value : 10",
     )
+    detail_concurrency: int = Field(
+        1,
+        ge=1,
+        description="Number of full jobs requested in parallel with `GET /jobs/{jobId}`. Default value : `1` (sequential requests)",
+    )
+
+    _incremental_updated_after: Optional[str] = PrivateAttr(None)
+
+    def push_down_filters(self, filters: List[FilterSpec]) -> List[FilterSpec]:
+        """
+        Translate the filters into the query parameters of `GET /jobs`
+
+        * `status` equal to a value -> `job_status`
+        * `postingStatus` equal to a value -> `posting_status`
+        * `updatedOn` greater than (or equal to) a date -> `updated_after`
+
+        A filter is translated only if the matching parameter is not already given.
+
+        Args:
+            filters (List[FilterSpec]): filters given in `filters`
+
+        Returns:
+            List[FilterSpec]: filters not translated, to evaluate on each pulled job
+        """
+        remaining_filters = []
+        for filter_spec in filters:
+            if (
+                filter_spec.field == "status"
+                and filter_spec.operator == FilterOperator.EQUAL
+                and self.job_status is None
+            ):
+                self.job_status = filter_spec.value
+            elif (
+                filter_spec.field == "postingStatus"
+                and filter_spec.operator == FilterOperator.EQUAL
+                and self.posting_status is None
+            ):
+                self.posting_status = filter_spec.value
+            elif (
+                filter_spec.field == "updatedOn"
+                and filter_spec.operator
+                in [FilterOperator.GREATER_THAN, FilterOperator.GREATER_OR_EQUAL]
+                and self.updated_after is None
+            ):
+                updated_after = filter_spec.value
+                if isinstance(updated_after, datetime.datetime):
+                    updated_after = updated_after.isoformat()
+                self.updated_after = updated_after
+            else:
+                remaining_filters.append(filter_spec)
+                continue
+            logger.info(
+                f"Filter on `{filter_spec.field}` sent to SmartRecruiters : {filter_spec.operator.value} `{filter_spec.value}`"
+            )
+        return remaining_filters
+
+    def reset_run_state(self) -> None:
+        super().reset_run_state()
+        self._incremental_updated_after = None
+
+    def apply_incremental_cursor(self, sync_state: SyncState) -> bool:
+        """
+        Pull only the jobs updated since the last successful run with `updatedAfter`
+
+        The cursor is only sent during this run : the `updated_after` field is left unchanged.
+        If `updated_after` is already given, it is kept and the pull is not restricted by the sync state.
+
+        Args:
+            sync_state (SyncState): sync state of the previous runs
+
+        Returns:
+            bool: `True` if `updated_after` has been set from the sync state
+        """
+        if self.updated_after is not None:
+            logger.info(f"`updated_after` is already set to `{self.updated_after}`")
+            return False
+        self._incremental_updated_after = sync_state.last_run_at.isoformat()
+        logger.info(f"Pulling the jobs updated after `{self._incremental_updated_after}`")
+        return True
 
     def pull(self) -> Iterator[SmartRecruitersModel]:
         """
@@ -44,7 +131,6 @@ class PullJobsAction(PullJobsBaseAction):
             Iterator[SmartRecruitersModel]: an iterator of jobs
         """
         # Prepare request
-        session = requests.Session()
         pull_jobs_request = requests.Request()
         pull_jobs_request.method = "GET"
         pull_jobs_request.url = "https://api.smartrecruiters.com/jobs"
@@ -54,7 +140,10 @@ class PullJobsAction(PullJobsBaseAction):
         # If param value is `None`, `requests` ignores the param
         pull_jobs_params = dict()
         pull_jobs_params["q"] = self.query
-        pull_jobs_params["updatedAfter"] = self.updated_after
+        updated_after = self.updated_after
+        if updated_after is None:
+            updated_after = self._incremental_updated_after
+        pull_jobs_params["updatedAfter"] = updated_after
         pull_jobs_params["postingStatus"] = self.posting_status
         pull_jobs_params["status"] = self.job_status
         pull_jobs_params["limit"] = self.limit
@@ -67,7 +156,7 @@ class PullJobsAction(PullJobsBaseAction):
             while job_list != []:
                 pull_jobs_request.params["pageId"] = next_page_id
                 prepared_request = pull_jobs_request.prepare()
-                response = session.send(prepared_request)
+                response = self.http_client.send(prepared_request)
 
                 if not response.ok:
                     raise PullError(
@@ -85,8 +174,13 @@ class PullJobsAction(PullJobsBaseAction):
                 logger.info(f"{job_number} job(s) got. Total found : {total_found}")
                 yield job_list
 
+        page_iter = get_page()
+        if self.detail_concurrency > 1:
+            # The next page is requested while the full jobs of the current page are requested
+            page_iter = prefetch(page_iter)
+
         # Chain all jobs of each page in an Iterator
-        chained_light_job_iter = itertools.chain.from_iterable(get_page())
+        chained_light_job_iter = itertools.chain.from_iterable(page_iter)
 
         # `all_chained_job_iter` contains data-reduced jobs.
         # This is a feature of the `GET /jobs` search request.
@@ -116,7 +210,7 @@ class PullJobsAction(PullJobsBaseAction):
 
             # send request
             prepared_request = get_job_request.prepare()
-            response = session.send(prepared_request)
+            response = self.http_client.send(prepared_request)
 
             if not response.ok:
                 raise PullError(response, message="Fail to get full job", job_id=job_id)
@@ -125,7 +219,13 @@ class PullJobsAction(PullJobsBaseAction):
 
             return response.json()
 
-        chained_full_job_iter = map(get_full_job, chained_light_job_iter)
+        # The full jobs are requested in parallel, across the page boundaries,
+        # within the rate limit of SmartRecruiters
+        chained_full_job_iter = ordered_parallel_map(
+            get_full_job,
+            chained_light_job_iter,
+            max_workers=self.detail_concurrency,
+        )
         job_obj_iter = map(SmartRecruitersModel.parse_obj, chained_full_job_iter)
 
         return job_obj_iter
@@ -377,7 +477,6 @@ class PushProfileAction(PushProfileBaseAction):
         profile = next(data)
 
         # Prepare request
-        session = requests.Session()
         push_profile_request = requests.Request()
         push_profile_request.method = "POST"
         push_profile_request.url = (
@@ -388,7 +487,7 @@ class PushProfileAction(PushProfileBaseAction):
         prepared_request = push_profile_request.prepare()
 
         # Send request
-        response = session.send(prepared_request)
+        response = self.http_client.send(prepared_request)
 
         if not response.ok:
             raise PushError(response)
@@ -32,6 +32,7 @@ class SmartRecruiters(Connector):
             posting_status (str, optional): Posting status of a job. Available values  PUBLIC, INTERNAL, NOT_PUBLISHED, PRIVATE. Default value `None`
             job_status (str, optional): Status of a job. Available values  CREATED, SOURCING, FILLED, INTERVIEW, OFFER, CANCELLED, ON_HOLD. Default value `None`
             limit (int, optional): Number of elements to return per page. max value is 100. Default value  10. Default value `10`
+            detail_concurrency (int, optional): Number of full jobs requested in parallel with `GET /jobs/{jobId}`. Default value `1`
 
         Returns:
             Optional[Dict[str, Any]]: Workflow response or `None`
@@ -1,9 +1,11 @@
-from typing import Iterator, Dict, Any, Optional
+from typing import Iterator, Dict, Any, List, Optional
 from pydantic import Field
+import itertools
 import requests
 
-from ...core.error import PullError, PushError
+from ...core.error import PushError
 from ...core.action import PullJobsBaseAction, PushProfileBaseAction
+from ...core.pagination import OffsetPaginator
 from ...core.auth import XTaleezAuth
 from ...utils.logger import get_logger
 from ...utils.clean_text import remove_html_tags
@@ -17,36 +19,44 @@ logger = get_logger()
 
 class PullJobsAction(PullJobsBaseAction):
     auth: XTaleezAuth
-    page: int = Field(0, description="Page number. Start at '0'")
+    page: int = Field(0, ge=0, description="Number of the first page pulled. Start at '0'")
     page_size: int = Field(
         100, description="Page size. Max size of the list returned. Max value : 100"
     )
 
     def pull(self) -> Iterator[TaleezJobModel]:
         """
-        Pull jobs from a Taleez jobs owner endpoint
+        Pull jobs from a Taleez jobs owner endpoint, page by page from the page `page`
 
         Returns list of all jobs that have been pulled
         """
 
         # Prepare request
-        session = requests.Session()
         pull_jobs_request = requests.Request()
         pull_jobs_request.method = "GET"
-        pull_jobs_request.url = f"https://api.taleez.com/0/jobs?page={self.page}&pageSize={self.page_size}&withDetails=true"
+        pull_jobs_request.url = "https://api.taleez.com/0/jobs"
         pull_jobs_request.auth = self.auth
-        prepared_request = pull_jobs_request.prepare()
-
-        # Send request
-        response = session.send(prepared_request)
-
-        if not response.ok:
-            raise PullError(response, message="Failed to get jobs")
-
-        response_dict = response.json()
-        logger.info(f"Total found: {response_dict['listSize']}")
-        job_list = response_dict["list"]
-        job_obj_iter = map(TaleezJobModel.parse_obj, job_list)
+        pull_jobs_request.params = {"withDetails": "true"}
+
+        paginator = OffsetPaginator(
+            offset_param="page",
+            limit_param="pageSize",
+            limit=self.page_size,
+            start=self.page,
+            count_pages=True,
+            items_path="list",
+            total_path="listSize",
+        )
+        page_iter = paginator.iter_pages(
+            self.http_client, pull_jobs_request, error_message="Failed to get jobs"
+        )
+
+        def get_job_list(page: Dict[str, Any]) -> List[Dict[str, Any]]:
+            logger.info(f"Total found: {page['listSize']}")
+            return page["list"]
+
+        chained_job_iter = itertools.chain.from_iterable(map(get_job_list, page_iter))
+        job_obj_iter = map(TaleezJobModel.parse_obj, chained_job_iter)
 
         return job_obj_iter
 
@@ -195,7 +205,6 @@ class PushProfileAction(PushProfileBaseAction):
         profile = next(data)
 
         # Prepare request
-        session = requests.Session()
         push_profile_request = requests.Request()
         push_profile_request.method = "POST"
         push_profile_request.url = f"https://api.taleez.com/0/candidates"
@@ -204,7 +213,7 @@ class PushProfileAction(PushProfileBaseAction):
         prepared_push_profile_request = push_profile_request.prepare()
 
         # Send request
-        push_profile_response = session.send(prepared_push_profile_request)
+        push_profile_response = self.http_client.send(prepared_push_profile_request)
 
         if not push_profile_response.ok:
             raise PushError(push_profile_response)
@@ -223,7 +232,7 @@ class PushProfileAction(PushProfileBaseAction):
             prepared_add_profile_request = add_profile_request.prepare()
 
             # Send request
-            add_profile_response = session.send(prepared_add_profile_request)
+            add_profile_response = self.http_client.send(prepared_add_profile_request)
 
             if not add_profile_response.ok:
                 raise PushError(add_profile_response, job_id=self.job_id)
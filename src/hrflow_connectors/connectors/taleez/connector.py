@@ -28,7 +28,7 @@ class Taleez(Connector):
             format_function_name (Optional[str], optional): Function name to format job before pushing. Default value `None`
             hydrate_with_parsing (bool, optional): Enrich the job with parsing. Default value `False`
             archive_deleted_jobs_from_stream (bool, optional): Archive Board jobs when they are no longer in the incoming job stream. Default value `True`
-            page (int, optional): Page number. Start at '0'. Default value `0`
+            page (int, optional): Number of the first page pulled, the next pages are pulled until the last one. Start at '0'. Default value `0`
             page_size (int, optional): Page size. Max size of the list returned. Max value  100. Default value `100`
 
         Returns:
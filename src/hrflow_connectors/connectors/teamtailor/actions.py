@@ -1,9 +1,12 @@
-from typing import Iterator, Dict, Any, Optional
+from typing import Iterator, Dict, Any, List, Optional
 from pydantic import Field
+import itertools
 import requests
 
-from ...core.error import PullError, PushError
+from ...core.error import PushError
 from ...core.action import PullJobsBaseAction, PushProfileBaseAction
+from ...core.pagination import LinkPaginator
+from ...core.ratelimit import set_default_rate_limit
 from ...utils.logger import get_logger
 from ...utils.clean_text import remove_html_tags
 from ...utils.hrflow import generate_workflow_response
@@ -13,9 +16,18 @@ from .schemas import TeamtailorJob, TeamtailorCandidateAttribute
 
 logger = get_logger()
 
+# Teamtailor quota : 50 requests per 10 seconds, burst + rate * 10 <= 50
+set_default_rate_limit("api.teamtailor.com", rate=4.5, burst=5)
+
 
 class PullJobsAction(PullJobsBaseAction):
     auth: AuthorizationAuth
+    page_size: int = Field(
+        30,
+        ge=1,
+        le=30,
+        description="Number of jobs per page. Max value : 30. Default value : `30`",
+    )
 
     def pull(self) -> Iterator[TeamtailorJob]:
         """
@@ -24,28 +36,50 @@ class PullJobsAction(PullJobsBaseAction):
             Iterator[TeamtailorJob]: list of all jobs with their content if available
         """
         # Prepare request
-        session = requests.Session()
         pull_jobs_request = requests.Request()
         pull_jobs_request.method = "GET"
         pull_jobs_request.url = "https://api.teamtailor.com/v1/jobs"
         pull_jobs_request.auth = self.auth
         pull_jobs_request.headers = {"X-Api-Version": "20210218"}
-        prepared_request = pull_jobs_request.prepare()
-
-        # Send request
-        response = session.send(prepared_request)
+        # The locations are side-loaded in `included` instead of being requested job by job
+        pull_jobs_request.params = {"include": "location", "page[size]": self.page_size}
+
+        # The JSON:API document gives the URL of the next page in `links.next`
+        paginator = LinkPaginator(next_link_path="links.next")
+        page_iter = paginator.iter_pages(
+            self.http_client,
+            pull_jobs_request,
+            error_message="Failed to get jobs from Teamtailor.",
+        )
 
-        if not response.ok:
-            raise PullError(
-                response,
-                message="Failed to get jobs from Teamtailor.",
-            )
+        def get_job_list(page: Dict[str, Any]) -> List[Dict[str, Any]]:
+            """
+            Get the jobs of a page with their side-loaded location joined by id
 
-        response_dict = response.json()
+            Args:
+                page (Dict[str, Any]): JSON:API document of a page
 
-        job_list = response_dict["data"]
-        job_obj_list = map(TeamtailorJob.parse_obj, job_list)
-        return job_obj_list
+            Returns:
+                List[Dict[str, Any]]: jobs with their `location` attributes, `None` if they have no location
+            """
+            location_by_id = {
+                included["id"]: included["attributes"]
+                for included in page.get("included", [])
+                if included.get("type") == "locations"
+            }
+            job_list = []
+            for job_dict in page["data"]:
+                relationships = job_dict.get("relationships") or dict()
+                location_data = (relationships.get("location") or dict()).get("data")
+                location = None
+                if location_data is not None:
+                    location = location_by_id.get(location_data["id"])
+                job_list.append(dict(job_dict, location=location))
+            return job_list
+
+        chained_job_iter = itertools.chain.from_iterable(map(get_job_list, page_iter))
+        job_obj_iter = map(TeamtailorJob.parse_obj, chained_job_iter)
+        return job_obj_iter
 
     def format(self, data: TeamtailorJob) -> HrflowJob:
         """
@@ -67,51 +101,23 @@ class PullJobsAction(PullJobsBaseAction):
         job["updated_at"] = attribute.get("updated-at")
         job["url"] = data.get("links").get("careersite-job-url")
 
-        # get location request
+        # location
         job["location"] = dict(text=None, lat=None, lng=None)
-
-        def get_location() -> None:
-            """
-            Get_location sends a request to get the job location from its API endpoint
-            """
-            session = requests.Session()
-            pull_job_location_request = requests.Request()
-            pull_job_location_request.method = "GET"
-            id = job["reference"]
-            pull_job_location_request.url = (
-                f"https://api.teamtailor.com/v1/jobs/{id}/location"
+        location = data.get("location")
+        if location is not None:
+            geojson = dict(
+                city=location["city"],
+                country=location["country"],
+                headquarters=location["headquarters"],
+                zip=location["zip"],
+                name=location["name"],
+            )
+            job["location"] = dict(
+                text=location["address"],
+                geojson=geojson,
+                lat=location["lat"],
+                lng=location["long"],
             )
-
-            pull_job_location_request.headers = {"X-Api-Version": "20210218"}
-            pull_job_location_request.auth = self.auth
-            prepared_request = pull_job_location_request.prepare()
-            response = session.send(prepared_request)
-            if not response.ok:
-                raise PullError(
-                    response,
-                    message="Failed to get job location from Teamtailor.",
-                )
-            location = response.json().get("data")
-            if location is not None:
-                location_attribute = location.get("attributes")
-                text = location_attribute["address"]
-                city = location_attribute["city"]
-                country = location_attribute["country"]
-                headquarters = location_attribute["headquarters"]
-                lat = location_attribute["lat"]
-                lng = location_attribute["long"]
-                zip = location_attribute["zip"]
-                name = location_attribute["name"]
-                geojson = dict(
-                    city=city,
-                    country=country,
-                    headquarters=headquarters,
-                    zip=zip,
-                    name=name,
-                )
-                job["location"] = dict(text=text, geojson=geojson, lat=lat, lng=lng)
-
-        get_location()
 
         # sections
         description = remove_html_tags(attribute.get("body"))
@@ -197,8 +203,6 @@ class PushProfileAction(PushProfileBaseAction):
         auth = self.auth
         request_url = "https://api.teamtailor.com/v1/candidates"
 
-        session = requests.Session()
-
         def send_request(
             method: str,
             url: str,
@@ -231,7 +235,7 @@ class PushProfileAction(PushProfileBaseAction):
             if params is not None:
                 request.params = params
             prepared_request = request.prepare()
-            response = session.send(prepared_request)
+            response = self.http_client.send(prepared_request)
             if not response.ok:
                 raise PushError(response, message=error_message)
 
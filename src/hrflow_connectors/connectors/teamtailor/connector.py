@@ -25,6 +25,7 @@ class Teamtailor(Connector):
             format_function_name (Optional[str], optional): Function name to format job before pushing. Default value `None`
             hydrate_with_parsing (bool, optional): Enrich the job with parsing. Default value `False`
             archive_deleted_jobs_from_stream (bool, optional): Archive Board jobs when they are no longer in the incoming job stream. Default value `True`
+            page_size (int, optional): Number of jobs per page, with their locations. Max value  30. Default value `30`
         Returns:
             Optional[Dict[str, Any]]: Workflow response or `None`
         """
@@ -22,10 +22,24 @@ class TeamtailorJobAttribute(BaseModel):
     end_date: Optional[str] = Field(None, alias="end-date")
 
 
+class TeamtailorLocationAttribute(BaseModel):
+    address: Optional[str]
+    city: Optional[str]
+    country: Optional[str]
+    headquarters: Optional[bool]
+    lat: Optional[float]
+    long: Optional[float]
+    zip: Optional[str]
+    name: Optional[str]
+
+
 class TeamtailorJob(BaseModel):
     attributes: TeamtailorJobAttribute
     links: Optional[dict]
     id: Any
+    location: Optional[TeamtailorLocationAttribute] = Field(
+        None, description="job location, side-loaded with the job"
+    )
 
 
 class TeamtailorCandidateAttribute(BaseModel):
@@ -1,9 +1,12 @@
 from typing import Iterator, Union, Optional
 from pydantic import Field
+import itertools
 import requests
 
 from ...core.error import PullError
 from ...core.action import PullJobsBaseAction, PushProfileBaseAction
+from ...core.pagination import LinkPaginator
+from ...core.ratelimit import set_default_rate_limit
 from ...core.auth import AuthorizationAuth, OAuth2PasswordCredentialsBody
 from ...utils.logger import get_logger
 from ...utils.clean_text import remove_html_tags
@@ -12,6 +15,9 @@ from .schemas import WorkableJobModel, WorkableCandidate
 
 logger = get_logger()
 
+# Workable quota : 10 requests per 10 seconds, burst + rate * 10 <= 10
+set_default_rate_limit("*.workable.com", rate=0.9, burst=1)
+
 
 class PullJobsAction(PullJobsBaseAction):
 
@@ -29,7 +35,6 @@ class PullJobsAction(PullJobsBaseAction):
         """
 
         # Prepare request
-        session = requests.Session()
         pull_jobs_request = requests.Request()
         pull_jobs_request.method = "GET"
         pull_jobs_request.auth = self.auth
@@ -37,22 +42,18 @@ class PullJobsAction(PullJobsBaseAction):
         pull_jobs_request.params = {
             "include_fields": ["description, requirements, benefits, employment_type"]
         }
-        prepared_request = pull_jobs_request.prepare()
-
-        # Send Request
-        response = session.send(prepared_request)
-
-        if not response.ok:
-            raise PullError(
-                response,
-                message="Failed to get jobs. Check that the subdomain is a valid one",
-                subdomain=self.subdomain,
-            )
-
-        response_dict = response.json()
 
-        job_list = response_dict["jobs"]
-        job_obj_iter = map(WorkableJobModel.parse_obj, job_list)
+        # Workable gives the URL of the next page in `paging.next`
+        paginator = LinkPaginator(next_link_path="paging.next")
+        page_iter = paginator.iter_pages(
+            self.http_client,
+            pull_jobs_request,
+            error_message=f"Failed to get jobs. Check that the subdomain `{self.subdomain}` is a valid one",
+        )
+        chained_job_iter = itertools.chain.from_iterable(
+            page["jobs"] for page in page_iter
+        )
+        job_obj_iter = map(WorkableJobModel.parse_obj, chained_job_iter)
         return job_obj_iter
 
     def format(self, data: WorkableJobModel) -> HrflowJob:
@@ -180,7 +181,6 @@ class PushProfileAction(PushProfileBaseAction):
         profile = profile.dict()
 
         # Prepare request
-        session = requests.Session()
         push_profile_request = requests.Request()
         push_profile_request.method = "POST"
         push_profile_request.auth = self.auth
@@ -189,7 +189,7 @@ class PushProfileAction(PushProfileBaseAction):
         prepared_request = push_profile_request.prepare()
 
         # Send Request
-        response = session.send(prepared_request)
+        response = self.http_client.send(prepared_request)
 
         if not response.ok:
             raise PullError(
@@ -1,10 +1,13 @@
 from pydantic import Field
 import xml.etree.ElementTree
-from typing import Iterator
+from typing import BinaryIO, Iterator, List
 import requests
 
 from ...core.error import PullError
 from ...core.action import PullJobsBaseAction
+from ...utils.logger import get_logger
+
+logger = get_logger()
 
 
 class PullJobsAction(PullJobsBaseAction):
@@ -12,10 +15,104 @@ class PullJobsAction(PullJobsBaseAction):
     job_list_xpath: str = Field(
         ..., description="XPath pointing to the job list in the XML stream"
     )
+    stream: bool = Field(
+        False,
+        description="Read the XML stream incrementally instead of loading it in memory. "
+        "`job_list_xpath` must be a path of tag names, e.g. `board/jobs`. Default value : `False`",
+    )
+
+    def get_job_list_path(self) -> List[str]:
+        """
+        Split `job_list_xpath` into the tags leading from the root element to the job list
+
+        Only the paths of tag names separated by `/` are supported in streaming mode, `*` matching any tag.
+
+        Returns:
+            List[str]: tags of the path, empty if the job list is the root element
+        """
+        path = self.job_list_xpath
+        if path.startswith("./"):
+            path = path[2:]
+        if path in ["", "."]:
+            return []
+        tag_list = path.split("/")
+        for tag in tag_list:
+            if tag in ["", ".", ".."] or any(char in tag for char in "[]@()"):
+                raise ValueError(
+                    f"`job_list_xpath` `{self.job_list_xpath}` is not supported in streaming mode : "
+                    "only tag names separated by `/` are supported"
+                )
+        return tag_list
+
+    def iter_jobs(self, xml_stream: BinaryIO) -> Iterator[xml.etree.ElementTree.Element]:
+        """
+        Parse an XML stream incrementally and yield the job elements as soon as they are complete
+
+        The jobs are the children of the first element matching `job_list_xpath`, as with `find`.
+        The yielded jobs and the elements outside the jobs are detached from the tree,
+        so the memory does not grow with the size of the stream.
+
+        Args:
+            xml_stream (BinaryIO): XML stream
+
+        Raises:
+            ValueError: no element matches `job_list_xpath`
+
+        Yields:
+            Iterator[xml.etree.ElementTree.Element]: job elements
+        """
+        job_list_path = self.get_job_list_path()
+        # Depth of the job list element, the root element being at depth `0`
+        job_list_depth = len(job_list_path)
+        element_stack = []
+        # For each element of the stack : is it on the path from the root element to the job list ?
+        on_path_stack = []
+        is_job_list_found = False
+        for event, element in xml.etree.ElementTree.iterparse(
+            xml_stream, events=("start", "end")
+        ):
+            if event == "start":
+                depth = len(element_stack)
+                element_on_path = depth == 0 or (
+                    on_path_stack[-1]
+                    and depth <= job_list_depth
+                    and job_list_path[depth - 1] in ["*", element.tag]
+                )
+                if depth == job_list_depth and element_on_path:
+                    is_job_list_found = True
+                element_stack.append(element)
+                on_path_stack.append(element_on_path)
+                continue
+
+            element_stack.pop()
+            element_on_path = on_path_stack.pop()
+            depth = len(element_stack)
+            if depth == 0:
+                break
+            parent = element_stack[-1]
+            if depth == job_list_depth + 1 and on_path_stack[-1]:
+                # A job is complete
+                parent.remove(element)
+                yield element
+            elif depth == job_list_depth and element_on_path:
+                logger.info("The job list has been read")
+                return
+            elif depth <= job_list_depth:
+                # An element outside of the job list is never read again
+                parent.remove(element)
+
+        if not is_job_list_found:
+            # An empty stream would archive all the jobs of the Board
+            raise ValueError(
+                f"No element matches `job_list_xpath` `{self.job_list_xpath}` in the XML stream"
+            )
 
     def pull(self) -> Iterator[xml.etree.ElementTree.Element]:
+        if self.stream:
+            # Check the path before requesting the stream
+            self.get_job_list_path()
+
         # Prepare request
-        session = requests.Session()
         pull_jobs_request = requests.Request()
         pull_jobs_request.method = "GET"
         pull_jobs_request.url = self.xml_stream_url
@@ -23,14 +120,41 @@ class PullJobsAction(PullJobsBaseAction):
         prepared_request = pull_jobs_request.prepare()
 
         # Send request
-        response = session.send(prepared_request)
+        response = self.http_client.send(prepared_request, stream=self.stream)
 
         if not response.ok:
             raise PullError(response)
 
+        if self.stream:
+            return self.iter_streamed_jobs(response)
+
         xml_stream = response.content
         root_element = xml.etree.ElementTree.fromstring(xml_stream)
         job_list_element = root_element.find(self.job_list_xpath)
         job_list = list(job_list_element)
 
         return job_list
+
+    def iter_streamed_jobs(
+        self, response: requests.Response
+    ) -> Iterator[xml.etree.ElementTree.Element]:
+        """
+        Yield the jobs of a streamed response, read chunk by chunk
+
+        Args:
+            response (requests.Response): response sent with `stream=True`
+
+        Raises:
+            PullError: no element matches `job_list_xpath`
+
+        Yields:
+            Iterator[xml.etree.ElementTree.Element]: job elements
+        """
+        # Decompress the body if it is sent with a `Content-Encoding`
+        response.raw.decode_content = True
+        try:
+            yield from self.iter_jobs(response.raw)
+        except ValueError as error:
+            raise PullError(response, message=str(error))
+        finally:
+            response.close()
@@ -30,6 +30,7 @@ class XML(Connector):
             format_function_name (Optional[str], optional): Function name to format job before pushing. Default value `None`
             hydrate_with_parsing (bool, optional): Enrich the job with parsing. Default value `False`
             archive_deleted_jobs_from_stream (bool, optional): Archive Board jobs when they are no longer in the incoming job stream. Default value `True`
+            stream (bool, optional): Read the XML stream incrementally instead of loading it in memory. Default value `False`
 
         Returns:
             Optional[Dict[str, Any]]: Workflow response or `None`
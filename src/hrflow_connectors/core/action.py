@@ -1,15 +1,39 @@
-from pydantic import BaseModel, Field
-from typing import List, Dict, Any, Iterator, TypeVar, Optional, Union
+from pydantic import BaseModel, Field, PrivateAttr
+from typing import (
+    List,
+    Dict,
+    Any,
+    Callable,
+    Iterator,
+    Iterable,
+    TypeVar,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
+import datetime
 import itertools
+import requests
+import time
 import xml.etree.ElementTree
 import html
 
 from ..core.error import HrflowError
 from ..utils.clean_text import remove_html_tags
-from ..utils.hrflow import find_element_in_list
+from ..utils.hrflow import find_element_in_list, ElementIndex
+from ..utils.hrflow import FINGERPRINT_TAG_NAME
+from ..utils.hrflow import compute_job_fingerprint, get_job_fingerprint
 from ..utils.hrflow import generate_workflow_response
+from ..utils.concurrency import ordered_parallel_map, run_in_executor
+from ..utils.spool import SpooledStream
+from ..utils.batch import chunked
 from ..utils.logger import get_logger
 from ..core.auth import Auth, NoAuth
+from ..core.http import HttpClient, get_default_http_client
+from ..core.state import SyncState, SyncStateStore, SQLiteSyncStateStore
+from ..core.cache import ParsingCache
+from ..core.filter import FilterSpec, apply_filters
 from ..utils.schemas import HrflowJob, HrflowProfile
 
 Hrflow = TypeVar("Hrflow")
@@ -39,11 +63,28 @@ class BaseAction(BaseModel):
         NoAuth(),
         description="Auth instance to identify and communicate with the platform",
     )
+    http_client: HttpClient = Field(
+        default_factory=get_default_http_client,
+        description="HTTP client used to communicate with the platform. Default value : the client shared by all actions",
+    )
 
     logics: List[str] = Field(
         [],
         description="Function names to apply as filter that return a modified item if a condition is fullfilled, if not they remove the item from the list and return None ",
     )
+    filters: List[FilterSpec] = Field(
+        [],
+        description="Declarative filters on the pulled items. The connector sends them to its API when it can, otherwise they are evaluated on each pulled item",
+    )
+    batch_logics: List[str] = Field(
+        [],
+        description="Function names to apply as filter on chunks of items. They take a list of items and return a list of booleans, `True` to keep the item at the same position",
+    )
+    logic_batch_size: int = Field(
+        1000,
+        ge=1,
+        description="Number of items given at once to the `batch_logics` functions. Default value : `1000`",
+    )
     global_scope: Optional[Dict[str, Any]] = Field(
         None, description="A dictionary containing the current scope's global variables"
     )
@@ -54,6 +95,10 @@ class BaseAction(BaseModel):
     format_function_name: Optional[str] = Field(
         None, description="Function name to format job before pushing"
     )
+    function_registry: Dict[str, Callable] = Field(
+        {},
+        description="Functions by name, used to resolve `logics` and `format_function_name` before the scopes",
+    )
 
     workflow_catch: bool = Field(
         True,
@@ -66,12 +111,62 @@ class BaseAction(BaseModel):
         description="Indicates if the action is executable in a workflow pull",
     )
 
+    _functions: Dict[str, Callable] = PrivateAttr({})
+    _remaining_filters: Optional[List[FilterSpec]] = PrivateAttr(None)
+
     def pull(self) -> Iterator[TalentDataType]:
         """
         Pull data
         """
         raise NotImplementedError("`pull` is not implemented")
 
+    def push_down_filters(self, filters: List[FilterSpec]) -> List[FilterSpec]:
+        """
+        Translate filters into the native query parameters of the connector
+
+        This function is called once, before `pull`. A connector overrides it to set the
+        query parameters matching the filters supported by its API.
+        By default, no filter is translated.
+
+        Args:
+            filters (List[FilterSpec]): filters given in `filters`
+
+        Returns:
+            List[FilterSpec]: filters not translated, to evaluate on each pulled item
+        """
+        return filters
+
+    def get_remaining_filters(self) -> List[FilterSpec]:
+        """
+        Get the filters to evaluate on the pulled items
+
+        The filters are pushed down to the connector with `push_down_filters` on the first call.
+        It must be called before `pull`.
+
+        Returns:
+            List[FilterSpec]: filters not translated by the connector
+        """
+        if self._remaining_filters is None:
+            self._remaining_filters = self.push_down_filters(list(self.filters))
+            pushed_down_count = len(self.filters) - len(self._remaining_filters)
+            logger.info(
+                f"Filters pushed down to the connector : {pushed_down_count}, "
+                f"evaluated on the pulled items : {len(self._remaining_filters)}"
+            )
+        return self._remaining_filters
+
+    def apply_filters(self, data: Iterator[TalentDataType]) -> Iterator[TalentDataType]:
+        """
+        Evaluate the filters not translated by the connector on the pulled `data` stream
+
+        Args:
+            data (Iterator[TalentDataType]): pulled data stream
+
+        Returns:
+            Iterator[TalentDataType]: Filtered data stream
+        """
+        return apply_filters(data, self.get_remaining_filters())
+
     def apply_logics(self, data: Iterator[TalentDataType]) -> Iterator[TalentDataType]:
         """
         Apply filters defined in `logics` on the `data` stream
@@ -90,18 +185,101 @@ class BaseAction(BaseModel):
             logger.info(f"Logic functions to apply : {self.logics}")
 
         for logic_function_name in self.logics:
+            logic_function = self.get_function(logic_function_name)
+            mapped_list = map(logic_function, filtered_list)
+            filtered_list = filter(lambda item: item is not None, mapped_list)
+
+        batch_logic_count = len(self.batch_logics)
+        if batch_logic_count > 0:
             logger.info(
-                f"Evaluating the logic function named `{logic_function_name}` ..."
+                f"Batch logic functions to apply on chunks of {self.logic_batch_size} item(s) : {self.batch_logics}"
             )
-            logic_function = eval(
-                logic_function_name, self.global_scope, self.local_scope
+            batch_logic_functions = [
+                self.get_function(batch_logic_function_name)
+                for batch_logic_function_name in self.batch_logics
+            ]
+            filtered_list = self.apply_batch_logics(
+                filtered_list, batch_logic_functions
             )
+        return filtered_list
+
+    def apply_batch_logics(
+        self,
+        data: Iterator[TalentDataType],
+        batch_logic_functions: List[Callable[[List[TalentDataType]], List[bool]]],
+    ) -> Iterator[TalentDataType]:
+        """
+        Apply batch logic functions on chunks of the `data` stream
+
+        The stream is split into lists of `logic_batch_size` items. Each function receives a list
+        and returns a keep-mask : a list of booleans, `True` to keep the item at the same position.
+        The next function only receives the kept items.
+
+        Args:
+            data (Iterator[TalentDataType]): Data stream to filter
+            batch_logic_functions (List[Callable[[List[TalentDataType]], List[bool]]]): batch logic functions
+
+        Yields:
+            Iterator[TalentDataType]: Filtered data stream
+        """
+        for batch in chunked(data, self.logic_batch_size):
+            for batch_logic_function in batch_logic_functions:
+                keep_mask = list(batch_logic_function(batch))
+                if len(keep_mask) != len(batch):
+                    function_name = getattr(
+                        batch_logic_function, "__name__", repr(batch_logic_function)
+                    )
+                    raise ValueError(
+                        f"The batch logic function `{function_name}` returned "
+                        f"{len(keep_mask)} value(s) for {len(batch)} item(s)"
+                    )
+                batch = list(itertools.compress(batch, keep_mask))
+                if not batch:
+                    break
+            yield from batch
+
+    def get_function(self, function_name: str) -> Callable:
+        """
+        Get a function by its name
+
+        The function is searched in `function_registry`, then evaluated in `global_scope` and `local_scope`.
+        The result is cached : a name is resolved once per action.
+
+        Args:
+            function_name (str): function name
+
+        Returns:
+            Callable: function
+        """
+        function = self._functions.get(function_name)
+        if function is not None:
+            return function
+
+        function = self.function_registry.get(function_name)
+        if function is not None:
             logger.info(
-                f"The logic function named `{logic_function_name}` has been evaluated"
+                f"The function named `{function_name}` has been found in the registry"
             )
-            mapped_list = map(logic_function, filtered_list)
-            filtered_list = filter(lambda item: item is not None, mapped_list)
-        return filtered_list
+        else:
+            logger.info(f"Evaluating the function named `{function_name}` ...")
+            function = eval(function_name, self.global_scope, self.local_scope)
+            logger.info(f"The function named `{function_name}` has been evaluated")
+        self._functions[function_name] = function
+        return function
+
+    def get_format_function(self) -> Callable[[TalentDataType], TalentDataType]:
+        """
+        Get the function formatting the data
+
+        It is the external format function named `format_function_name` if it is defined,
+        otherwise the internal `format` function of the class.
+
+        Returns:
+            Callable[[TalentDataType], TalentDataType]: format function
+        """
+        if self.format_function_name is None:
+            return self.format
+        return self.get_function(self.format_function_name)
 
     def format_switcher(self, data: TalentDataType) -> TalentDataType:
         """
@@ -116,7 +294,7 @@ class BaseAction(BaseModel):
           the default behaviour of this function is to return the input data.
 
         WARNING: If you want to map the format function to rewrite a pipeline of an `Action` from a connector,
-        you should use this function, not the `format` of the parent class.
+        you should use this function, or the function returned by `get_format_function`, not the `format` of the parent class.
         If you take `format` from the parent class, then `format_function_name` will be ignored
         and only `format` will be used to format the data.
 
@@ -126,21 +304,7 @@ class BaseAction(BaseModel):
         Returns:
             Dict[str, Any]: Data adapted to the input format of the push function, ready to be sent
         """
-        if self.format_function_name is None:
-            logger.debug("External format function is not defined")
-            logger.debug("Using internal `format` function")
-            return self.format(data)
-        else:
-            logger.debug(
-                f"Evaluating the external format function `{self.format_function_name}` ..."
-            )
-            format_function = eval(
-                self.format_function_name, self.global_scope, self.local_scope
-            )
-            logger.debug(
-                f"The external format function `{self.format_function_name}` has been evaluated"
-            )
-            return format_function(data)
+        return self.get_format_function()(data)
 
     def format(self, data: TalentDataType) -> TalentDataType:
         """
@@ -168,28 +332,105 @@ class BaseAction(BaseModel):
         """
         raise NotImplementedError("`push` is not implemented")
 
-    def execute(self) -> Optional[Dict[str, Any]]:
+    def log_http_retries(self, retry_count_at_start: int) -> None:
         """
-        Execute action
+        Log the number of requests retried by the HTTP client during the run
+
+        The count also includes the retries of the other actions using the same client at the same time.
+
+        Args:
+            retry_count_at_start (int): retry count of the HTTP client at the start of the run
         """
-        logger.info("Start execution")
+        retry_count = self.http_client.get_retry_count() - retry_count_at_start
+        logger.info(f"Number of retried requests during this run : {retry_count}")
 
-        logger.info("Pulling data...")
-        input_data = self.pull()
-        logger.info("Data has been pulled")
+    async def async_pull(self) -> Iterator[TalentDataType]:
+        """
+        Pull data asynchronously
+
+        By default, the synchronous `pull` is run in a thread executor.
+        Override it to pull the data with a native asynchronous client.
+        """
+        return await run_in_executor(self.pull)
+
+    async def async_push(self, data: Iterator[TalentDataType]):
+        """
+        Push data asynchronously
+
+        By default, the synchronous `push` is run in a thread executor.
+        The lazy data stream is consumed in the same thread, so the blocking calls
+        made while pulling and formatting the stream do not block the event loop.
+        Override it to push the data with a native asynchronous client.
+
+        Args:
+            data (List[Union[str, Dict[str, Any]]]): Data to push
+        """
+        await run_in_executor(self.push, data)
+
+    def process(self, input_data: Iterator[TalentDataType]) -> Iterator[TalentDataType]:
+        """
+        Apply the logics and the format function on the pulled data stream
+
+        Args:
+            input_data (Iterator[TalentDataType]): pulled data stream
+
+        Returns:
+            Iterator[TalentDataType]: data stream ready to be pushed
+        """
+        input_data = self.apply_filters(input_data)
 
         logger.info("Applying logics...")
         filtered_data = self.apply_logics(input_data)
         logger.info("Logics have been applied")
 
         logger.info("Mapping format function...")
-        output_data = map(self.format_switcher, filtered_data)
+        output_data = map(self.get_format_function(), filtered_data)
         logger.info("Format function has been mapped")
+        return output_data
+
+    def execute(self) -> Optional[Dict[str, Any]]:
+        """
+        Execute action
+        """
+        logger.info("Start execution")
+        retry_count = self.http_client.get_retry_count()
+        self.get_remaining_filters()
+
+        logger.info("Pulling data...")
+        input_data = self.pull()
+        logger.info("Data has been pulled")
+
+        output_data = self.process(input_data)
 
         logger.info("Pushing data...")
         self.push(output_data)
         logger.info("Data has been pushed")
 
+        self.log_http_retries(retry_count)
+        logger.info("All has been done for this connector !")
+
+    async def async_execute(self) -> Optional[Dict[str, Any]]:
+        """
+        Execute action asynchronously
+
+        The pipeline is the same as `execute`, with the asynchronous hooks `async_pull`
+        and `async_push`. Many actions can then run concurrently in a single event loop.
+        """
+        logger.info("Start asynchronous execution")
+        retry_count = self.http_client.get_retry_count()
+        self.get_remaining_filters()
+
+        logger.info("Pulling data...")
+        input_data = await self.async_pull()
+        logger.info("Data has been pulled")
+
+        output_data = self.process(input_data)
+
+        logger.info("Pushing data...")
+        await self.async_push(output_data)
+        logger.info("Data has been pushed")
+
+        self.log_http_retries(retry_count)
         logger.info("All has been done for this connector !")
 
 
@@ -198,26 +439,17 @@ class PullBaseAction(BaseAction):
     Pull Action
     """
 
-    def execute(self) -> Optional[Dict[str, Any]]:
-        logger.info("Start execution")
-
-        logger.info("Pulling data...")
-        input_data = self.pull()
-        logger.info("Data has been pulled")
+    def process(self, input_data: Iterator[TalentDataType]) -> Iterator[TalentDataType]:
+        input_data = self.apply_filters(input_data)
 
         logger.info("Mapping format function...")
-        formatted_data = map(self.format_switcher, input_data)
+        formatted_data = map(self.get_format_function(), input_data)
         logger.info("Format function has been mapped")
 
         logger.info("Applying logics...")
         filtered_data = self.apply_logics(formatted_data)
         logger.info("Logics have been applied")
-
-        logger.info("Pushing data...")
-        self.push(filtered_data)
-        logger.info("Data has been pushed")
-
-        logger.info("All has been done for this connector !")
+        return filtered_data
 
 
 class PushBaseAction(BaseAction):
@@ -225,26 +457,143 @@ class PushBaseAction(BaseAction):
     Push Action
     """
 
-    def execute(self) -> Optional[Dict[str, Any]]:
-        logger.info("Start execution")
 
-        logger.info("Pulling data...")
-        input_data = self.pull()
-        logger.info("Data has been pulled")
+class ReferenceDiff(BaseModel):
+    """
+    Difference between the job references of a Board and the job references of a stream
+    """
 
-        logger.info("Applying logics...")
-        filtered_data = self.apply_logics(input_data)
-        logger.info("Logics have been applied")
+    to_archive: List[str] = Field(
+        [], description="References in the Board which are no longer in the stream"
+    )
+    to_add: List[str] = Field(
+        [], description="References in the stream which are not in the Board yet"
+    )
+    to_update: List[str] = Field(
+        [], description="References both in the Board and in the stream"
+    )
 
-        logger.info("Mapping format function...")
-        formatted_data = map(self.format_switcher, filtered_data)
-        logger.info("Format function has been mapped")
+    @classmethod
+    def from_references(
+        cls, board_references: Iterable[str], stream_references: Iterable[str]
+    ) -> "ReferenceDiff":
+        """
+        Compute the difference between Board references and stream references
 
-        logger.info("Pushing data...")
-        self.push(formatted_data)
-        logger.info("Data has been pushed")
+        The comparison relies on hashed sets, so it runs in linear time.
+        The order of appearance of the references is kept in each list.
 
-        logger.info("All has been done for this connector !")
+        >>> diff = ReferenceDiff.from_references(["REF1", "REF4"], ["REF1", "REF2"])
+        >>> diff.to_archive, diff.to_add, diff.to_update
+        (['REF4'], ['REF2'], ['REF1'])
+
+        Args:
+            board_references (Iterable[str]): references in the Board
+            stream_references (Iterable[str]): references in the stream
+
+        Returns:
+            ReferenceDiff: computed difference
+        """
+        board_reference_list = list(dict.fromkeys(board_references))
+        stream_reference_list = list(dict.fromkeys(stream_references))
+        board_reference_set = set(board_reference_list)
+        stream_reference_set = set(stream_reference_list)
+
+        to_archive = [
+            reference
+            for reference in board_reference_list
+            if reference not in stream_reference_set
+        ]
+        to_add = [
+            reference
+            for reference in stream_reference_list
+            if reference not in board_reference_set
+        ]
+        to_update = [
+            reference
+            for reference in stream_reference_list
+            if reference in board_reference_set
+        ]
+        return cls(to_archive=to_archive, to_add=to_add, to_update=to_update)
+
+
+class BoardJob(BaseModel):
+    """
+    Job of a Board, as indexed in the Board snapshot
+    """
+
+    key: Optional[str] = Field(None, description="Identification key of the job")
+    archived_at: Optional[str] = Field(
+        None, description="Archive date of the job. `None` for unarchived jobs"
+    )
+    fingerprint: Optional[str] = Field(
+        None, description="Fingerprint of the job content"
+    )
+
+
+class BoardSnapshot(BaseModel):
+    """
+    In-memory index of the jobs of a Board by reference
+    """
+
+    jobs: Dict[str, BoardJob] = Field({}, description="Board jobs by reference")
+
+    @classmethod
+    def from_job_pages(
+        cls, job_pages: Iterable[Iterable[Dict[str, Any]]]
+    ) -> "BoardSnapshot":
+        """
+        Build the snapshot from pages of jobs returned by the Hrflow search
+
+        Args:
+            job_pages (Iterable[Iterable[Dict[str, Any]]]): pages of jobs
+
+        Returns:
+            BoardSnapshot: Board snapshot
+        """
+        jobs = dict()
+        for job_dict in itertools.chain.from_iterable(job_pages):
+            reference = job_dict.get("reference")
+            if reference is not None:
+                jobs[reference] = BoardJob(
+                    key=job_dict.get("key"),
+                    archived_at=job_dict.get("archived_at"),
+                    fingerprint=get_job_fingerprint(job_dict),
+                )
+        return cls(jobs=jobs)
+
+    def get(self, reference: str) -> Optional[BoardJob]:
+        """
+        Get a job of the snapshot
+
+        Args:
+            reference (str): job reference
+
+        Returns:
+            Optional[BoardJob]: job or `None` if the reference is not in the snapshot
+        """
+        return self.jobs.get(reference)
+
+    def references(self) -> Iterator[str]:
+        """
+        Get all references of the snapshot
+
+        Returns:
+            Iterator[str]: references
+        """
+        return iter(self.jobs)
+
+
+class ArchiveSummary(BaseModel):
+    """
+    Summary of the archive stage of a run
+    """
+
+    archived: List[str] = Field([], description="References of the archived jobs")
+    unarchived: List[str] = Field([], description="References of the un-archived jobs")
+    failed: List[str] = Field(
+        [], description="References of the jobs whose archiving or un-archiving failed"
+    )
 
 
 class PullJobsBaseAction(PullBaseAction):
@@ -256,15 +605,120 @@ class PullJobsBaseAction(PullBaseAction):
         ..., description="Board key where the jobs to be added will be stored"
     )
     hydrate_with_parsing: bool = Field(False, description="Enrich the job with parsing")
+    hydration_concurrency: int = Field(
+        1,
+        ge=1,
+        description="Number of jobs hydrated with parsing in parallel. Default value : `1` (sequential hydration)",
+    )
+    hydration_max_in_flight: Optional[int] = Field(
+        None,
+        ge=1,
+        description="Number of jobs hydrated ahead of the push. Default value : `2 * hydration_concurrency`",
+    )
+    parsing_cache: Optional[ParsingCache] = Field(
+        default_factory=ParsingCache,
+        description="Cache of the parsing results by text, `None` to disable it. Default value : `ParsingCache()` (memory only)",
+    )
     archive_deleted_jobs_from_stream: bool = Field(
         True,
         description="Archive Board jobs when they are no longer in the incoming job stream",
     )
+    board_page_size: int = Field(
+        30,
+        ge=1,
+        description="Number of jobs per page when listing the Board. Default value : `30`",
+    )
+    board_page_concurrency: int = Field(
+        1,
+        ge=1,
+        description="Number of Board pages fetched in parallel. Default value : `1` (sequential listing)",
+    )
+    push_concurrency: int = Field(
+        1,
+        ge=1,
+        description="Number of jobs indexed in parallel in the Board. Default value : `1` (sequential push)",
+    )
+    push_max_in_flight: Optional[int] = Field(
+        None,
+        ge=1,
+        description="Maximum number of indexing requests in flight. Default value : `2 * push_concurrency`",
+    )
+    stream_max_items_in_memory: int = Field(
+        10000,
+        ge=0,
+        description="Number of stream jobs kept in memory while the Board is reconciled, the next ones are spilled to disk. Default value : `10000`",
+    )
+
+    archive_concurrency: int = Field(
+        1,
+        ge=1,
+        description="Number of jobs archived or un-archived in parallel. Default value : `1` (sequential archiving)",
+    )
+    archive_max_attempts: int = Field(
+        3,
+        ge=1,
+        description="Maximum number of attempts to archive or un-archive a job when Hrflow fails temporarily. Default value : `3`",
+    )
+    archive_retry_delay: float = Field(
+        1.0,
+        ge=0,
+        description="Delay in seconds before the first retry, doubled after each attempt. Default value : `1.0`",
+    )
+
+    use_board_snapshot: bool = Field(
+        False,
+        description="List the Board once and check the listed job references in memory. A reference missing from the listing, e.g. a new job, is still requested to Hrflow. Default value : `False`",
+    )
+    detect_job_changes: bool = Field(
+        False,
+        description="Store a fingerprint of the job content in its tags, skip unchanged jobs and edit changed jobs already in the Board. Default value : `False`",
+    )
+
+    incremental: bool = Field(
+        False,
+        description="Use the sync state of the previous runs to pull only the jobs updated since the last successful run, when the connector supports it. Default value : `False`",
+    )
+    sync_state_store: SyncStateStore = Field(
+        default_factory=SQLiteSyncStateStore,
+        description="Backend storing the sync state used by the incremental mode. Default value : `SQLiteSyncStateStore()`",
+    )
+
+    _reference_diff: Optional[ReferenceDiff] = PrivateAttr(None)
+    _board_snapshot: Optional[BoardSnapshot] = PrivateAttr(None)
+    _sync_state: Optional[SyncState] = PrivateAttr(None)
+    _previous_fingerprints: Dict[str, str] = PrivateAttr({})
+    _run_started_at: Optional[datetime.datetime] = PrivateAttr(None)
+    _stream_references: Optional[List[str]] = PrivateAttr(None)
+    _archive_summary: ArchiveSummary = PrivateAttr(default_factory=ArchiveSummary)
+    _unarchive_results: Dict[str, bool] = PrivateAttr({})
+    _archived_board_references: Set[str] = PrivateAttr(set())
+
+    def reset_run_state(self) -> None:
+        """
+        Forget the state of the previous run
+
+        The Board snapshot, the reference diff, the stream references and the archive summary
+        describe a single run. They are reset at the start of each execution,
+        so an action executed twice does not reuse the data of its first run.
+        """
+        self._reference_diff = None
+        self._board_snapshot = None
+        self._sync_state = None
+        self._previous_fingerprints = dict()
+        self._run_started_at = None
+        self._stream_references = None
+        self._archive_summary = ArchiveSummary()
+        self._unarchive_results = dict()
+        self._archived_board_references = set()
 
     def get_all_job_pages_from_board(self) -> Iterator[Iterator[Dict[str, Any]]]:
         """
         Get all job pages from Board
 
+        The first page gives the number of pages. When `board_page_concurrency` is greater than `1`,
+        the next pages are fetched by a bounded pool of workers, and yielded in the order of the pages.
+        The listing stops at the first empty page.
+
         Yields:
             Iterator[Iterator[Dict[str, Any]]]: Iterator of job Iterator. For example: List of job list.
         """
@@ -273,7 +727,7 @@ class PullJobsBaseAction(PullBaseAction):
         def get_jobs_page(page: int) -> Dict[str, Any]:
             logger.info(f"Getting page `{page}` from `{self.board_key}` board")
             response = self.hrflow_client.job.searching.list(
-                board_keys=[self.board_key], limit=30, page=page
+                board_keys=[self.board_key], limit=self.board_page_size, page=page
             )
             if response["code"] >= 400:
                 raise HrflowError(response, "Search Jobs failed")
@@ -287,12 +741,21 @@ class PullJobsBaseAction(PullBaseAction):
         logger.info(f"Number of jobs got in page `1` : {job_count}")
         yield job_list
 
-        for page in range(2, max_page + 1):
-            job_page = get_jobs_page(page=page)
+        logger.info(
+            f"Getting the next pages with {self.board_page_concurrency} worker(s)"
+        )
+        job_page_iter = ordered_parallel_map(
+            get_jobs_page,
+            range(2, max_page + 1),
+            max_workers=self.board_page_concurrency,
+        )
+        for page, job_page in enumerate(job_page_iter, start=2):
             job_list = job_page["data"]["jobs"]
             job_count = len(job_list)
             logger.info(f"Number of jobs got in page `{page}` : {job_count}")
             if len(job_page["data"]["jobs"]) == 0:
+                # The pages in flight are cancelled by closing the iterator
+                job_page_iter.close()
                 return
             yield job_list
 
@@ -317,7 +780,14 @@ class PullJobsBaseAction(PullBaseAction):
             Yields:
                 Iterator[Dict[str, Any]]: Iteractor of references
             """
-            get_reference_from_job = lambda job: job.get("reference")
+
+            def get_reference_from_job(job: Dict[str, Any]) -> Optional[str]:
+                reference = job.get("reference")
+                if reference is not None and job.get("archived_at") is not None:
+                    # Un-archived in the archive stage if it is back in the stream
+                    self._archived_board_references.add(reference)
+                return reference
+
             return map(get_reference_from_job, job_list)
 
         def none_filter(data: Optional[str]) -> bool:
@@ -332,6 +802,10 @@ class PullJobsBaseAction(PullBaseAction):
             """
             return data is not None
 
+        if self.use_board_snapshot:
+            logger.info("Getting the references from the Board snapshot")
+            return self.get_board_snapshot().references()
+
         all_job_pages_iter = self.get_all_job_pages_from_board()
         logger.info("Mapping a function to extract references from list of job")
         all_reference_pages_iter = map(get_reference_from_job_list, all_job_pages_iter)
@@ -342,15 +816,123 @@ class PullJobsBaseAction(PullBaseAction):
         logger.info("Iterator containing all references is ready !")
         return clean_iter
 
-    def push(self, data: Iterator[TalentDataType]):
-        for job in data:
-            reference = job.reference
-            logger.debug(
-                f"Pushing a job ref=`{reference}` to Hrflow Board `{self.board_key}`"
-            )
-            response = self.hrflow_client.job.indexing.add_json(
-                board_key=self.board_key, job_json=job.dict()
+    def get_sync_scope(self) -> str:
+        """
+        Get the identifier of the sync state of this action
+
+        Returns:
+            str: connector and Board identifier
+        """
+        return f"{self.__class__.__module__}.{self.__class__.__name__}:{self.board_key}"
+
+    def load_sync_state(self) -> bool:
+        """
+        Load the sync state of the previous runs and prepare the incremental pull
+
+        Returns:
+            bool: `True` if the pull is restricted to the jobs updated since the last run
+        """
+        scope = self.get_sync_scope()
+        logger.info(f"Loading the sync state of `{scope}`...")
+        self._run_started_at = datetime.datetime.now(datetime.timezone.utc)
+        self._sync_state = self.sync_state_store.load(scope)
+        self._previous_fingerprints = dict(self._sync_state.fingerprints)
+
+        last_run_at = self._sync_state.last_run_at
+        if last_run_at is None:
+            logger.info("No previous successful run, pulling the whole stream")
+            return False
+
+        logger.info(f"Last successful run at `{last_run_at.isoformat()}`")
+        is_incremental = self.apply_incremental_cursor(self._sync_state)
+        logger.info(f"The pull is incremental : {is_incremental}")
+        return is_incremental
+
+    def apply_incremental_cursor(self, sync_state: SyncState) -> bool:
+        """
+        Restrict the pull to the jobs updated since the last successful run
+
+        Connectors whose API can filter the jobs by update date should override this function,
+        for example by sending `sync_state.last_run_at` as an `updatedAfter` request parameter.
+        The cursor must only be used by the current run : it is reset with `reset_run_state`.
+        By default, the connector cannot pull incrementally and the whole stream is pulled.
+
+        Args:
+            sync_state (SyncState): sync state of the previous runs
+
+        Returns:
+            bool: `True` if the pull is restricted to the jobs updated since the last run
+        """
+        return False
+
+    def save_sync_state(self) -> None:
+        """
+        Save the sync state at the end of a successful run
+        """
+        if self._sync_state is None:
+            return
+        self._sync_state.last_run_at = self._run_started_at
+        scope = self.get_sync_scope()
+        logger.info(f"Saving the sync state of `{scope}`...")
+        self.sync_state_store.save(scope, self._sync_state)
+
+    def get_board_snapshot(self) -> BoardSnapshot:
+        """
+        Get the snapshot of the Board
+
+        The snapshot is built once per action from `get_all_job_pages_from_board`.
+
+        Returns:
+            BoardSnapshot: Board snapshot
+        """
+        if self._board_snapshot is None:
+            logger.info(f"Building the snapshot of Hrflow Board `{self.board_key}`...")
+            self._board_snapshot = BoardSnapshot.from_job_pages(
+                self.get_all_job_pages_from_board()
             )
+            job_count = len(self._board_snapshot.jobs)
+            logger.info(f"Board snapshot has been built with {job_count} job(s)")
+        return self._board_snapshot
+
+    def push_job(self, job: TalentDataType) -> Dict[str, Any]:
+        """
+        Index a single job in the Board
+
+        Args:
+            job (TalentDataType): job to index
+
+        Returns:
+            Dict[str, Any]: Hrflow indexing response
+        """
+        reference = job.reference
+        logger.debug(
+            f"Pushing a job ref=`{reference}` to Hrflow Board `{self.board_key}`"
+        )
+        return self.hrflow_client.job.indexing.add_json(
+            board_key=self.board_key, job_json=job.dict()
+        )
+
+    def push(self, data: Iterator[TalentDataType]):
+        """
+        Push jobs to the Board
+
+        When `push_concurrency` is greater than `1`, the indexing requests are sent
+        by a bounded pool of workers. The errors are still reported in the order of the stream :
+        the first job of the stream whose indexing failed raises the `HrflowError`.
+
+        Args:
+            data (Iterator[TalentDataType]): jobs to push
+        """
+        logger.info(
+            f"Pushing jobs with {self.push_concurrency} worker(s) to Hrflow Board `{self.board_key}`"
+        )
+        response_iter = ordered_parallel_map(
+            self.push_job,
+            data,
+            max_workers=self.push_concurrency,
+            max_in_flight=self.push_max_in_flight,
+        )
+        for response in response_iter:
             if response["code"] >= 400:
                 raise HrflowError(response, "Index Job failed")
 
@@ -397,14 +979,9 @@ class PullJobsBaseAction(PullBaseAction):
             return HrflowJob.parse_obj(job)
 
         # Parse the `cleaned`
-        logger.debug("Parsing the cleaned text...")
-        response = self.hrflow_client.document.parsing.post(text=cleaned_str)
-        if response["code"] >= 400:
-            raise HrflowError(response, "Parsing failed")
-        logger.debug("Text has been parsed")
-
-        entity_list = response["data"]["ents"]
-        parsed_text = response["data"]["text"]
+        parsing_data = self.parse_text(cleaned_str)
+        entity_list = parsing_data["ents"]
+        parsed_text = parsing_data["text"]
         entity_count = len(entity_list)
         logger.debug(f"Number of entity found by parsing : {entity_count}")
 
@@ -421,6 +998,12 @@ class PullJobsBaseAction(PullBaseAction):
                 )
                 job[field_name] = []
 
+        ## Index the elements of each field by name, so each entity is merged in constant time
+        field_to_index = {
+            field_name: ElementIndex(job[field_name], "name")
+            for field_name in field_to_init
+        }
+
         ## Map parsing labels with job fields
         logger.debug("Mapping parsing label with job fields")
         label_to_job_field = dict(
@@ -438,19 +1021,23 @@ class PullJobsBaseAction(PullBaseAction):
             if label in ["Course", "Task", "Certification", "Language"]:
                 element_to_add = dict(name=selection, value=None)
                 # If element to add is unique. To avoid doublon.
+                field_name = label_to_job_field[label]
                 if (
                     find_element_in_list(
-                        element_list=job[label_to_job_field[label]], name=selection
+                        element_list=job[field_name],
+                        index=field_to_index[field_name],
+                        name=selection,
                     )
                     is None
                 ):
                     logger.debug(
-                        f"Add the field `{label_to_job_field[label]}` with the name `{selection}`"
+                        f"Add the field `{field_name}` with the name `{selection}`"
                     )
-                    job[label_to_job_field[label]].append(element_to_add)
+                    job[field_name].append(element_to_add)
+                    field_to_index[field_name].add(element_to_add)
                 else:
                     logger.debug(
-                        f"The field `{label_to_job_field[label]}` with the name `{selection}` is already added"
+                        f"The field `{field_name}` with the name `{selection}` is already added"
                     )
             elif label in ["Skill", "HardSkill", "SoftSkill"]:
                 label_to_skill_type = dict(
@@ -460,13 +1047,18 @@ class PullJobsBaseAction(PullBaseAction):
                 skill = dict(name=selection, type=skill_type, value=None)
                 # If element to add is unique. To avoid doublon.
                 if (
-                    find_element_in_list(element_list=job["skills"], name=selection)
+                    find_element_in_list(
+                        element_list=job["skills"],
+                        index=field_to_index["skills"],
+                        name=selection,
+                    )
                     is None
                 ):
                     logger.debug(
                         f"Add the skill `{skill_type}` with the name `{selection}`"
                     )
                     job["skills"].append(skill)
+                    field_to_index["skills"].add(skill)
                 else:
                     logger.debug(
                         f"The skill `{skill_type}` with the name `{selection}` is already added"
@@ -476,12 +1068,45 @@ class PullJobsBaseAction(PullBaseAction):
         job_obj = HrflowJob.parse_obj(job)
         return job_obj
 
+    def parse_text(self, text: str) -> Dict[str, Any]:
+        """
+        Parse a text with Hrflow
+
+        The result is read from `parsing_cache` when the same text has already been parsed.
+
+        Args:
+            text (str): text to parse
+
+        Returns:
+            Dict[str, Any]: parsing result with the entities `ents` and the parsed `text`
+        """
+        if self.parsing_cache is not None:
+            parsing_data = self.parsing_cache.get(text)
+            if parsing_data is not None:
+                logger.debug("The parsing of this text is in the cache")
+                return parsing_data
+
+        logger.debug("Parsing the cleaned text...")
+        response = self.hrflow_client.document.parsing.post(text=text)
+        if response["code"] >= 400:
+            raise HrflowError(response, "Parsing failed")
+        logger.debug("Text has been parsed")
+
+        parsing_data = response["data"]
+        if self.parsing_cache is not None:
+            self.parsing_cache.set(text, parsing_data)
+        return parsing_data
+
     def check_reference_in_board(self, job: TalentDataType) -> bool:
         """
         Check if a job reference is in the Board.
         If the job reference is not in the Board, return `True` to add the job.
         Otherwise return `False` and if job is archived, this function unarchives it.
 
+        With `detect_job_changes`, the job is edited (and hydrated) only if its fingerprint
+        differs from the one stored in the Board. Thus, a job already in the Board whose content
+        has changed is edited, while an unchanged job is never edited nor parsed again.
+
         Args:
             job (Dict[str, Any]): job object
 
@@ -497,6 +1122,108 @@ class PullJobsBaseAction(PullBaseAction):
             logger.debug("This job reference is `None`. Thus, it is not in the Board")
             return True
 
+        job_in_board = self.find_job_in_board(reference)
+        if job_in_board is None:
+            return True
+
+        is_unchanged = False
+        if self.detect_job_changes:
+            fingerprint = get_job_fingerprint(job.dict())
+            previous_fingerprint = job_in_board.fingerprint
+            if previous_fingerprint is None:
+                previous_fingerprint = self._previous_fingerprints.get(reference)
+            is_unchanged = (
+                fingerprint is not None and fingerprint == previous_fingerprint
+            )
+            logger.debug(f"Job content is unchanged : {is_unchanged}")
+
+        archived_at = job_in_board.archived_at
+        if archived_at is None:
+            # Job is not archived
+            logger.debug("Job is not archived")
+            if not self.detect_job_changes or is_unchanged:
+                return False
+        else:
+            # Job is archived
+            logger.debug(f"Job is archived since `{archived_at}`")
+            is_unarchived = self._unarchive_results.get(reference)
+            if is_unarchived is None:
+                logger.debug("Un-archiving the job in Hrflow")
+                is_unarchived = self.set_job_archive(reference, is_archive=0)
+                self.add_to_archive_summary(
+                    reference, is_archive=0, success=is_unarchived
+                )
+            else:
+                logger.debug(
+                    "The archive stage has already tried to un-archive the job"
+                )
+            if not is_unarchived:
+                return False
+            if is_unchanged:
+                logger.debug("Job content is unchanged, the job is not edited")
+                return False
+
+        # Hydrate job with parsing if it is necessary
+        if self.hydrate_with_parsing:
+            job = self.hydrate_job_with_parsing(job)
+
+        # Edit job
+        job_key = job_in_board.key
+        logger.debug(f"Editing the job key=`{job_key}`")
+        edit_response = self.hrflow_client.job.indexing.edit(
+            board_key=self.board_key, key=job_key, job_json=job.dict()
+        )
+        if edit_response["code"] >= 400:
+            error_message = edit_response["message"]
+            logger.warning(f"Fail to edit the job `{reference}` : {error_message}")
+        return False
+
+    def add_fingerprint_tag(self, job: TalentDataType) -> TalentDataType:
+        """
+        Add the fingerprint of the job content in its tags
+
+        Args:
+            job (TalentDataType): job to tag
+
+        Returns:
+            TalentDataType: job with the tag `hrflow_connectors_fingerprint`
+        """
+        job_dict = job.dict()
+        tags = [
+            tag
+            for tag in job_dict.get("tags") or []
+            if tag.get("name") != FINGERPRINT_TAG_NAME
+        ]
+        fingerprint = compute_job_fingerprint(job_dict)
+        tags.append(dict(name=FINGERPRINT_TAG_NAME, value=fingerprint))
+        job_dict["tags"] = tags
+
+        reference = job_dict.get("reference")
+        if self._sync_state is not None and reference is not None:
+            self._sync_state.fingerprints[reference] = fingerprint
+        return HrflowJob.parse_obj(job_dict)
+
+    def find_job_in_board(self, reference: str) -> Optional[BoardJob]:
+        """
+        Find a job in the Board by its reference
+
+        The Board snapshot is consulted first when `use_board_snapshot` is enabled.
+        A reference missing from the snapshot is requested to Hrflow,
+        because the Board listing may not contain all archived jobs :
+        each new job of the stream still costs a request.
+
+        Args:
+            reference (str): job reference
+
+        Returns:
+            Optional[BoardJob]: job in the Board or `None` if the reference is not in the Board
+        """
+        if self.use_board_snapshot:
+            job_in_board = self.get_board_snapshot().get(reference)
+            if job_in_board is not None:
+                logger.debug("The Board snapshot got this job reference")
+                return job_in_board
+
         logger.debug("Sending a GET Indexing request to Hrflow...")
         response = self.hrflow_client.job.indexing.get(
             board_key=self.board_key, reference=reference
@@ -505,50 +1232,17 @@ class PullJobsBaseAction(PullBaseAction):
         if response_code >= 400 and "Unable to find object: job" in response["message"]:
             # Job with this reference is not in the Board
             logger.debug("Hrflow does not find this job reference")
-            return True
+            return None
         elif response_code >= 400:
             raise HrflowError(response, "Get Job failed")
-        elif response_code == 200:
-            logger.debug("Hrflow got this job in the Board")
-            job_in_board = response["data"]
-            archived_at = job_in_board.get("archived_at")
-            if archived_at is None:
-                # Job is not archived
-                logger.debug("Job is not archived")
-                return False
-            else:
-                # Job is archived
-                logger.debug(f"Job is archived since `{archived_at}`")
-                logger.debug("Un-archiving the job in Hrflow")
-                archive_response = self.hrflow_client.job.indexing.archive(
-                    self.board_key, reference=reference, is_archive=0
-                )
-                if archive_response["code"] >= 400:
-                    error_message = archive_response["message"]
-                    logger.warning(
-                        f"Fail to un-archive the job `{reference}` : {error_message}"
-                    )
-                else:
-                    # Get job key
-                    job_response = response["data"]
-                    job_key = job_response["key"]
-
-                    # Hydrate job with parsing if it is necessary
-                    if self.hydrate_with_parsing:
-                        job = self.hydrate_job_with_parsing(job)
-
-                    # Edit job
-                    logger.debug(f"Editing the job key=`{job_key}`")
-                    edit_response = self.hrflow_client.job.indexing.edit(
-                        board_key=self.board_key, key=job_key, job_json=job.dict()
-                    )
-                    if edit_response["code"] >= 400:
-                        error_message = edit_response["message"]
-                        logger.warning(
-                            f"Fail to edit the job `{reference}` : {error_message}"
-                        )
-                return False
-        return False
+
+        logger.debug("Hrflow got this job in the Board")
+        job_in_board = response["data"]
+        return BoardJob(
+            key=job_in_board.get("key"),
+            archived_at=job_in_board.get("archived_at"),
+            fingerprint=get_job_fingerprint(job_in_board),
+        )
 
     def get_all_references_from_stream(self) -> Iterator[str]:
         """
@@ -559,14 +1253,16 @@ class PullJobsBaseAction(PullBaseAction):
         """
         logger.info(f"Getting all references from the stream...")
 
+        if self._stream_references is not None:
+            logger.info(f"Using the references collected while spooling the stream")
+            return iter(self._stream_references)
+
         logger.info(f"Pulling all references from the stream")
         input_data = self.pull()
 
-        logger.info(f"Formating all references from the stream")
-        formatted_data = map(self.format_switcher, input_data)
-
-        logger.info(f"Applying logics to all references from the stream")
-        filtered_data = self.apply_logics(formatted_data)
+        # Same pipeline as the push : filters, format function and logics
+        logger.info(f"Processing all references from the stream")
+        filtered_data = self.process(input_data)
 
         logger.info(f"Keeping only reference from the stream")
         references_iter = map(lambda job: job.reference, filtered_data)
@@ -578,72 +1274,384 @@ class PullJobsBaseAction(PullBaseAction):
         logger.info(f"All references from the stream have been got")
         return references_without_none_iter
 
-    def check_deletion_references_from_stream(self):
+    def get_reference_diff(self) -> ReferenceDiff:
+        """
+        Get the difference between the references of the Board and the references of the stream
+
+        The difference is computed once per action and reused by the next calls.
+
+        Returns:
+            ReferenceDiff: difference with the references `to_archive`, `to_add` and `to_update`
+        """
+        if self._reference_diff is None:
+            logger.info("Computing the difference between Board and stream references")
+            self._reference_diff = ReferenceDiff.from_references(
+                board_references=self.get_all_references_from_board(),
+                stream_references=self.get_all_references_from_stream(),
+            )
+            logger.info(
+                f"References to archive : {len(self._reference_diff.to_archive)}, "
+                f"to add : {len(self._reference_diff.to_add)}, "
+                f"to update : {len(self._reference_diff.to_update)}"
+            )
+        return self._reference_diff
+
+    def check_deletion_references_from_stream(self) -> ReferenceDiff:
         """
         Check the deletion of references from stream
 
         if reference in Board is missing in Stream
         Then archive the job with this reference
+
+        The archived jobs of the Board which are back in the stream are un-archived
+        in the same stage, before the push : their archive date is read in the Board listing,
+        with or without the Board snapshot. All these decisions are executed by `run_archive_stage`.
+        An archived job missing from the Board listing is un-archived during the push.
+
+        Returns:
+            ReferenceDiff: difference between Board and stream references
         """
         logger.info("Checking the deletion of references from stream...")
-        all_references_from_board_list = list(self.get_all_references_from_board())
-        all_references_from_stream_list = list(self.get_all_references_from_stream())
-        for reference in all_references_from_board_list:
-            if reference not in all_references_from_stream_list:
-                # Archive the job with this reference
-                logger.debug(f"Archiving the job `{reference}`")
+        reference_diff = self.get_reference_diff()
+
+        # The Board has been listed : the archived jobs are known without extra requests
+        archived_references = self.get_archived_board_references()
+        references_to_unarchive = [
+            reference
+            for reference in reference_diff.to_update
+            if reference in archived_references
+        ]
+
+        self.run_archive_stage(
+            references_to_archive=reference_diff.to_archive,
+            references_to_unarchive=references_to_unarchive,
+        )
+        logger.info("The deletion of references from stream has been checked")
+        return reference_diff
+
+    def get_archived_board_references(self) -> Set[str]:
+        """
+        Get the references of the archived jobs found while listing the Board
+
+        Returns:
+            Set[str]: references of the archived jobs
+        """
+        if self._board_snapshot is not None:
+            return {
+                reference
+                for reference, job_in_board in self._board_snapshot.jobs.items()
+                if job_in_board.archived_at is not None
+            }
+        return self._archived_board_references
+
+    def run_archive_stage(
+        self, references_to_archive: List[str], references_to_unarchive: List[str]
+    ) -> ArchiveSummary:
+        """
+        Archive and un-archive jobs of the Board
+
+        The requests are sent by a bounded pool of `archive_concurrency` workers.
+        A failed request does not stop the stage : the job is reported in `failed`.
+
+        Args:
+            references_to_archive (List[str]): references of the jobs to archive
+            references_to_unarchive (List[str]): references of the jobs to un-archive
+
+        Returns:
+            ArchiveSummary: summary of the run, including this stage
+        """
+        decisions = [(reference, 1) for reference in references_to_archive]
+        decisions += [(reference, 0) for reference in references_to_unarchive]
+        logger.info(
+            f"Archive stage : {len(references_to_archive)} job(s) to archive, "
+            f"{len(references_to_unarchive)} job(s) to un-archive "
+            f"with {self.archive_concurrency} worker(s)"
+        )
+
+        def execute_decision(decision: Tuple[str, int]) -> bool:
+            reference, is_archive = decision
+            return self.set_job_archive(reference, is_archive=is_archive)
+
+        success_iter = ordered_parallel_map(
+            execute_decision, decisions, max_workers=self.archive_concurrency
+        )
+        for (reference, is_archive), success in zip(decisions, success_iter):
+            self.add_to_archive_summary(
+                reference, is_archive=is_archive, success=success
+            )
+
+        summary = self._archive_summary
+        logger.info(
+            f"Archive summary : {len(summary.archived)} archived, "
+            f"{len(summary.unarchived)} un-archived, {len(summary.failed)} failed"
+        )
+        return summary
+
+    def set_job_archive(self, reference: str, is_archive: int) -> bool:
+        """
+        Archive or un-archive a job of the Board
+
+        The request is retried up to `archive_max_attempts` times when Hrflow fails temporarily
+        (network error, status `429` or `5xx`), with an exponential backoff.
+
+        Args:
+            reference (str): job reference
+            is_archive (int): `1` to archive the job, `0` to un-archive it
+
+        Returns:
+            bool: the request has succeeded
+        """
+        action_name = "archive" if is_archive else "un-archive"
+        for attempt in range(1, self.archive_max_attempts + 1):
+            logger.debug(f"Sending the request to {action_name} the job `{reference}`")
+            try:
                 archive_response = self.hrflow_client.job.indexing.archive(
-                    self.board_key, reference=reference, is_archive=1
+                    self.board_key, reference=reference, is_archive=is_archive
                 )
-                if archive_response["code"] >= 400:
-                    error_message = archive_response["message"]
-                    logger.warning(
-                        f"Fail to archive the job `{reference}` : {error_message}"
-                    )
+                response_code = archive_response["code"]
+                error_message = archive_response.get("message")
+            except requests.exceptions.RequestException as error:
+                response_code = None
+                error_message = str(error)
 
-        logger.info("The deletion of references from stream has been checked")
+            if response_code is not None and response_code < 400:
+                return True
+
+            is_temporary = (
+                response_code is None or response_code == 429 or response_code >= 500
+            )
+            if not is_temporary or attempt == self.archive_max_attempts:
+                logger.warning(
+                    f"Fail to {action_name} the job `{reference}` : {error_message}"
+                )
+                return False
+
+            delay = self.archive_retry_delay * 2 ** (attempt - 1)
+            logger.debug(
+                f"Attempt {attempt}/{self.archive_max_attempts} to {action_name} the job `{reference}` "
+                f"has failed, retrying in {delay}s : {error_message}"
+            )
+            time.sleep(delay)
+        return False
+
+    def add_to_archive_summary(
+        self, reference: str, is_archive: int, success: bool
+    ) -> None:
+        """
+        Record the result of an archive decision in the summary of the run
+
+        Args:
+            reference (str): job reference
+            is_archive (int): `1` if the job was archived, `0` if it was un-archived
+            success (bool): the request has succeeded
+        """
+        if not is_archive:
+            self._unarchive_results[reference] = success
+        if not success:
+            self._archive_summary.failed.append(reference)
+        elif is_archive:
+            self._archive_summary.archived.append(reference)
+        else:
+            self._archive_summary.unarchived.append(reference)
+
+    def get_archive_summary(self) -> ArchiveSummary:
+        """
+        Get the summary of the archived and un-archived jobs of the run
+
+        Returns:
+            ArchiveSummary: summary
+        """
+        return self._archive_summary
+
+    def spool_stream(self, data: Iterator[TalentDataType]) -> SpooledStream:
+        """
+        Read the whole stream once and keep it in a spooled buffer
+
+        The references of the jobs are collected during the same pass,
+        so `get_all_references_from_stream` does not need to pull the stream a second time.
+
+        Args:
+            data (Iterator[TalentDataType]): formatted and filtered jobs
+
+        Returns:
+            SpooledStream: buffer containing all the jobs of the stream
+        """
+        logger.info("Spooling the stream and collecting its references...")
+        spooled_stream = SpooledStream(
+            max_items_in_memory=self.stream_max_items_in_memory
+        )
+        stream_references = []
+        for job in data:
+            spooled_stream.append(job)
+            reference = getattr(job, "reference", None)
+            if reference is not None:
+                stream_references.append(reference)
+        self._stream_references = stream_references
+        logger.info(
+            f"{len(spooled_stream)} job(s) spooled, {len(stream_references)} reference(s) collected"
+        )
+        return spooled_stream
+
+    def prepare_execution(self) -> bool:
+        """
+        Prepare a run : reset the run state, push the filters down and load the sync state
+
+        Returns:
+            bool: the stream is incremental, so the deleted jobs cannot be detected
+        """
+        self.reset_run_state()
+
+        # The filters are pushed down first : they take precedence over the incremental cursor
+        self.get_remaining_filters()
+
+        logger.info(f"Incremental mode : {self.incremental}")
+        is_partial_stream = False
+        if self.incremental:
+            is_partial_stream = self.load_sync_state()
+        return is_partial_stream
+
+    def reconcile_stream(
+        self, input_data: Iterator[TalentDataType], is_partial_stream: bool
+    ) -> Tuple[Iterator[TalentDataType], Optional[SpooledStream]]:
+        """
+        Format the pulled stream and archive the Board jobs which are no longer in it
+
+        Args:
+            input_data (Iterator[TalentDataType]): pulled data stream
+            is_partial_stream (bool): the stream is incremental
+
+        Returns:
+            Tuple[Iterator[TalentDataType], Optional[SpooledStream]]: formatted and filtered jobs,
+                and the spooled buffer to close after the push, if the stream has been spooled
+        """
+        filtered_data = self.process(input_data)
+
+        spooled_stream = None
+        logger.info(
+            f"Archive the deleted jobs from stream : {self.archive_deleted_jobs_from_stream}"
+        )
+        if self.archive_deleted_jobs_from_stream and is_partial_stream:
+            # Jobs not updated since the last run are missing from the stream
+            logger.warning(
+                "The stream is incremental, the deleted jobs cannot be detected and are not archived"
+            )
+        elif self.archive_deleted_jobs_from_stream:
+            # The stream is pulled once : it feeds both the reconciliation and the push
+            spooled_stream = self.spool_stream(filtered_data)
+            filtered_data = iter(spooled_stream)
+            self.check_deletion_references_from_stream()
+        return filtered_data, spooled_stream
 
     def execute(self) -> Optional[Dict[str, Any]]:
         """
         Execute action
         """
         logger.info("Start execution")
+        retry_count = self.http_client.get_retry_count()
+        is_partial_stream = self.prepare_execution()
 
         logger.info("Pulling data...")
         input_data = self.pull()
         logger.info("Data has been pulled")
 
-        logger.info("Mapping format function...")
-        formatted_data = map(self.format_switcher, input_data)
-        logger.info("Format function has been mapped")
+        filtered_data, spooled_stream = self.reconcile_stream(
+            input_data, is_partial_stream
+        )
+        try:
+            self.push_stream(filtered_data)
+        finally:
+            if spooled_stream is not None:
+                spooled_stream.close()
 
-        logger.info("Applying logics...")
-        filtered_data = self.apply_logics(formatted_data)
-        logger.info("Logics have been applied")
+        if self.incremental:
+            self.save_sync_state()
 
-        logger.info(
-            f"Archive the deleted jobs from stream : {self.archive_deleted_jobs_from_stream}"
+        self.log_http_retries(retry_count)
+        logger.info("All has been done for this connector !")
+
+    async def async_execute(self) -> Optional[Dict[str, Any]]:
+        """
+        Execute action asynchronously
+
+        The pipeline is the same as `execute`, with the asynchronous hooks `async_pull`
+        and `async_push`. The reconciliation with the Board is synchronous : it is run
+        in a thread executor, so it does not block the event loop.
+        """
+        logger.info("Start asynchronous execution")
+        retry_count = self.http_client.get_retry_count()
+        is_partial_stream = await run_in_executor(self.prepare_execution)
+
+        logger.info("Pulling data...")
+        input_data = await self.async_pull()
+        logger.info("Data has been pulled")
+
+        filtered_data, spooled_stream = await run_in_executor(
+            self.reconcile_stream, input_data, is_partial_stream
         )
-        if self.archive_deleted_jobs_from_stream:
-            self.check_deletion_references_from_stream()
+        try:
+            logger.info("Pushing data...")
+            await self.async_push(self.get_jobs_to_push(filtered_data))
+            logger.info("Data has been pushed")
+        finally:
+            if spooled_stream is not None:
+                spooled_stream.close()
+
+        if self.incremental:
+            await run_in_executor(self.save_sync_state)
+
+        self.log_http_retries(retry_count)
+        logger.info("All has been done for this connector !")
+
+    def get_jobs_to_push(
+        self, filtered_data: Iterator[TalentDataType]
+    ) -> Iterator[TalentDataType]:
+        """
+        Filter and hydrate the jobs of the stream which must be added to the Board
+
+        The jobs already in the Board are edited or un-archived while the stream is consumed.
+
+        Args:
+            filtered_data (Iterator[TalentDataType]): formatted and filtered jobs
+
+        Returns:
+            Iterator[TalentDataType]: jobs to add to the Board
+        """
+        logger.info(f"Detect job changes : {self.detect_job_changes}")
+        if self.detect_job_changes:
+            filtered_data = map(self.add_fingerprint_tag, filtered_data)
 
         logger.info("Filtering the job to push")
         unique_data_to_push = filter(self.check_reference_in_board, filtered_data)
 
         logger.info(f"Hydrate job with parsing : {self.hydrate_with_parsing}")
         if self.hydrate_with_parsing:
-            logger.info("Mapping hydrate_job_with_parsing function...")
-            unique_data_to_push = map(
-                self.hydrate_job_with_parsing, unique_data_to_push
+            # The hydration runs as its own stage : the next jobs are parsed
+            # while the previous ones are indexed, in the order of the stream
+            logger.info(
+                f"Mapping hydrate_job_with_parsing function with {self.hydration_concurrency} worker(s)..."
+            )
+            unique_data_to_push = ordered_parallel_map(
+                self.hydrate_job_with_parsing,
+                unique_data_to_push,
+                max_workers=self.hydration_concurrency,
+                max_in_flight=self.hydration_max_in_flight,
             )
             logger.info("hydrate_job_with_parsing function has been mapped")
+        return unique_data_to_push
+
+    def push_stream(self, filtered_data: Iterator[TalentDataType]):
+        """
+        Filter, hydrate and push the jobs of the stream
+
+        Args:
+            filtered_data (Iterator[TalentDataType]): formatted and filtered jobs
+        """
+        unique_data_to_push = self.get_jobs_to_push(filtered_data)
 
         logger.info("Pushing data...")
         self.push(unique_data_to_push)
         logger.info("Data has been pushed")
 
-        logger.info("All has been done for this connector !")
-
 
 class PushJobBaseAction(PushBaseAction):
 
@@ -669,6 +1677,12 @@ class PushJobBaseAction(PushBaseAction):
             status_code=201, message="Profile successfully pushed"
         )
 
+    async def async_execute(self):
+        await super().async_execute()
+        return generate_workflow_response(
+            status_code=201, message="Profile successfully pushed"
+        )
+
 
 class PushProfileBaseAction(PushBaseAction):
     profile: HrflowProfile = Field(..., description="Profile to push")
@@ -696,6 +1710,12 @@ class PushProfileBaseAction(PushBaseAction):
             status_code=201, message="Profile successfully pushed"
         )
 
+    async def async_execute(self):
+        await super().async_execute()
+        return generate_workflow_response(
+            status_code=201, message="Profile successfully pushed"
+        )
+
 
 class CatchProfileBaseAction(BaseAction):
 
@@ -710,6 +1730,7 @@ class CatchProfileBaseAction(BaseAction):
         Execute action
         """
         logger.info("Start execution")
+        retry_count = self.http_client.get_retry_count()
 
         logger.info("Format request...")
         formatted_data = self.format_switcher(self.request)
@@ -719,11 +1740,20 @@ class CatchProfileBaseAction(BaseAction):
         self.push(formatted_data)
         logger.info("Data has been pushed")
 
+        self.log_http_retries(retry_count)
         logger.info("All has been done for this connector !")
         return generate_workflow_response(
             status_code=201, message="Profile successfully pushed"
         )
 
+    async def async_execute(self):
+        """
+        Execute action asynchronously
+
+        The request is formatted and pushed in a thread executor.
+        """
+        return await run_in_executor(self.execute)
+
     def push(self, data: Dict[str, Any]):
         logger.debug(f"Parsing a profile to Hrflow Source `{self.source_key}`")
         response = self.hrflow_client.profile.parsing.add_file(**data)
@@ -1,7 +1,11 @@
+import json
+import os
 import requests
+import threading
+import time
 import urllib.parse
-from typing import Union, Dict, Any
-from pydantic import BaseModel, Field, SecretStr
+from typing import Union, Dict, Any, Optional, Tuple
+from pydantic import BaseModel, Field, PrivateAttr, SecretStr
 
 from ..core.error import AuthError
 from ..utils.logger import get_logger
@@ -10,6 +14,25 @@ from ..utils.logger import get_logger
 logger = get_logger()
 
 
+def get_expires_in(response_dict: Dict[str, Any]) -> Optional[float]:
+    """
+    Get the lifetime of an access token from the response of a token endpoint
+
+    Args:
+        response_dict (Dict[str, Any]): response of the token endpoint
+
+    Returns:
+        Optional[float]: lifetime in seconds or `None` if it is missing or invalid
+    """
+    expires_in = response_dict.get("expires_in")
+    if expires_in is None:
+        return None
+    try:
+        return float(expires_in)
+    except (TypeError, ValueError):
+        return None
+
+
 class Auth(BaseModel, requests.auth.AuthBase):
     """
     Auth
@@ -43,7 +66,169 @@ class NoAuth(Auth):
     pass
 
 
-class OAuth2PasswordCredentialsBody(Auth):
+class TokenCache:
+    """
+    Thread-safe store of a token, of its expiration and of its refresh token, shared by the copies of an auth
+    """
+
+    def __init__(self):
+        self.token = None
+        self.expires_at = None
+        self.refresh_token = None
+        self.lock = threading.Lock()
+
+
+class CachedTokenAuth(Auth):
+    """
+    Cached Token Auth
+
+    Generic auth signing the requests with a token got from the platform, e.g. an OAuth2 access token.
+    The token is cached until it expires : it is refreshed `token_expiry_margin` seconds before
+    the end of its lifetime, under a lock so concurrent workers share a single refresh.
+    When a request is rejected with `401 Unauthorized`, the token is invalidated
+    and the request is sent again once with a new token.
+    """
+
+    token_expiry_margin: float = Field(
+        60,
+        ge=0,
+        description="Delay in seconds before the expiration of the token to refresh it. Default value : `60`",
+    )
+
+    _token_cache: TokenCache = PrivateAttr()
+
+    def __init__(self, **data: Any):
+        super().__init__(**data)
+        self._token_cache = TokenCache()
+
+    def request_token(self) -> Tuple[str, Optional[float]]:
+        """
+        Request a new token to the platform
+
+        It is called under the lock of the cache.
+
+        Returns:
+            Tuple[str, Optional[float]]: token and its lifetime in seconds (`None` if unknown)
+        """
+        raise NotImplementedError
+
+    def get_authorization_header(self, token: str) -> Dict[str, str]:
+        """
+        Get the header signing a request
+
+        Args:
+            token (str): token
+
+        Returns:
+            Dict[str, str]: authentication header
+        """
+        return {"Authorization": token}
+
+    def get_valid_token(self) -> Optional[str]:
+        """
+        Get the cached token if it can still be used
+
+        The token and its expiration are read once : the returned token is the checked one,
+        and never `None`, even if another worker invalidates the cache at the same time.
+
+        Returns:
+            Optional[str]: token or `None` if no token is cached or if it expires soon
+        """
+        token_cache = self._token_cache
+        token = token_cache.token
+        expires_at = token_cache.expires_at
+        if token is None:
+            return None
+        if expires_at is not None and time.monotonic() >= expires_at:
+            return None
+        return token
+
+    def get_token(self) -> str:
+        """
+        Get the cached token or request a new one
+
+        Returns:
+            str: token
+        """
+        token = self.get_valid_token()
+        if token is not None:
+            return token
+        token_cache = self._token_cache
+        with token_cache.lock:
+            # Another worker may have refreshed the token while this one was waiting for the lock
+            token = self.get_valid_token()
+            if token is not None:
+                return token
+            token, expires_in = self.request_token()
+            expires_at = None
+            if expires_in is not None:
+                # Short-lived tokens are refreshed at the middle of their lifetime
+                expiry_margin = min(self.token_expiry_margin, expires_in / 2)
+                expires_at = time.monotonic() + expires_in - expiry_margin
+            token_cache.token = token
+            token_cache.expires_at = expires_at
+        return token
+
+    def invalidate_token(self, token: str) -> None:
+        """
+        Invalidate a rejected token
+
+        The cache is only cleared if it still holds this token,
+        so a token already refreshed by another worker is kept.
+
+        Args:
+            token (str): rejected token
+        """
+        token_cache = self._token_cache
+        with token_cache.lock:
+            if token_cache.token == token:
+                logger.debug("The token has been rejected, it will be refreshed")
+                token_cache.token = None
+                token_cache.expires_at = None
+
+    def handle_unauthorized(
+        self, response: requests.Response, **kwargs: Any
+    ) -> requests.Response:
+        """
+        Response hook invalidating the token on `401 Unauthorized` and sending the request again
+
+        Args:
+            response (requests.Response): response
+            **kwargs (Any): options of the sent request
+
+        Returns:
+            requests.Response: response, or response of the request sent with a new token
+        """
+        request = response.request
+        if response.status_code != 401 or getattr(request, "_auth_token_retried", False):
+            return response
+
+        self.invalidate_token(request._auth_token)
+
+        # Release the connection before sending the request again
+        response.content
+        response.close()
+
+        retried_request = request.copy()
+        token = self.get_token()
+        retried_request.headers.update(self.get_authorization_header(token))
+        retried_request._auth_token = token
+        retried_request._auth_token_retried = True
+
+        retried_response = response.connection.send(retried_request, **kwargs)
+        retried_response.history.append(response)
+        retried_response.request = retried_request
+        return retried_response
+
+    def __call__(self, request: requests.PreparedRequest) -> requests.PreparedRequest:
+        token = self.get_token()
+        request.headers.update(self.get_authorization_header(token))
+        request._auth_token = token
+        request.register_hook("response", self.handle_unauthorized)
+        return request
+
+
+class OAuth2PasswordCredentialsBody(CachedTokenAuth):
     """
     OAuth2 by using a password and adding credentials in the body of the request used to get the "access token".
     """
@@ -59,7 +244,16 @@ class OAuth2PasswordCredentialsBody(Auth):
         Get access token
 
         Returns:
-            str: Access token
+            str: Access token, cached until it expires
+        """
+        return self.get_token()
+
+    def request_token(self) -> Tuple[str, Optional[float]]:
+        """
+        Request a new access token
+
+        Returns:
+            Tuple[str, Optional[float]]: Access token and its lifetime in seconds
         """
         logger.debug("Getting the access token...")
         payload = dict()
@@ -79,13 +273,11 @@ class OAuth2PasswordCredentialsBody(Auth):
             raise AuthError("OAuth2 failed ! Reason : `{}`".format(response.content))
 
         logger.debug("The access token has been got")
-        return response.json()["access_token"]
+        response_dict = response.json()
+        return response_dict["access_token"], get_expires_in(response_dict)
 
-    def __call__(self, request: requests.PreparedRequest) -> requests.PreparedRequest:
-        access_token = self.get_access_token()
-        auth_header = {"Authorization": f"OAuth {access_token}"}
-        request.headers.update(auth_header)
-        return request
+    def get_authorization_header(self, token: str) -> Dict[str, str]:
+        return {"Authorization": f"OAuth {token}"}
 
 
 class XAPIKeyAuth(Auth):
@@ -127,7 +319,7 @@ class XSmartTokenAuth(XAPIKeyAuth):
     name: str = Field("X-SmartToken", const=True)
 
 
-class OAuth2EmailPasswordBody(Auth):
+class OAuth2EmailPasswordBody(CachedTokenAuth):
     """
     OAuth2 by using a password and email to send to a sginin endpoint used to get the "access token".
     """
@@ -136,7 +328,10 @@ class OAuth2EmailPasswordBody(Auth):
     email: str
     password: SecretStr
 
-    def get_access_token(self):
+    def get_access_token(self) -> str:
+        return self.get_token()
+
+    def request_token(self) -> Tuple[str, Optional[float]]:
 
         payload = dict()
         payload["email"] = self.email
@@ -151,14 +346,8 @@ class OAuth2EmailPasswordBody(Auth):
             raise AuthError("Signin failed ! Reason : `{}`".format(response.content))
 
         logger.debug("The access token has been got")
-        return response.json()["access_token"]
-
-    def __call__(self, request: requests.PreparedRequest) -> requests.PreparedRequest:
-
-        access_token = self.get_access_token()
-        auth_header = {"Authorization": f"{access_token}"}
-        request.headers.update(auth_header)
-        return request
+        response_dict = response.json()
+        return response_dict["access_token"], get_expires_in(response_dict)
 
 
 class XTaleezAuth(XAPIKeyAuth):
@@ -193,9 +382,14 @@ class MonsterBodyAuth(Auth):
         return updatable_object
 
 
-class OAuth2Session(Auth):
+class OAuth2Session(CachedTokenAuth):
     """
     OAuth2 by using a password and adding credentials in the body of the request used to get the "access token".
+
+    The session token got at the end of the flow (auth code, access token, session token) is cached
+    until it expires, as well as the refresh token : a new session is opened with the refresh token
+    instead of logging in again. With `token_store_path`, the tokens are also stored on disk
+    so the next runs reuse them.
     """
 
     auth_code_url: str
@@ -206,6 +400,15 @@ class OAuth2Session(Auth):
     username: str
     password: str
     name: str
+    session_token_lifetime: float = Field(
+        600,
+        gt=0,
+        description="Lifetime of the session token in seconds. Default value : `600`",
+    )
+    token_store_path: Optional[str] = Field(
+        None,
+        description="Path of the file storing the tokens between the runs. Default value : `None` (memory only)",
+    )
 
     def get_auth_code(self):
         params = {
@@ -231,17 +434,144 @@ class OAuth2Session(Auth):
             "client_secret": self.client_secret,
         }
         resp_token = requests.post(self.access_token_url, params=params)
-        return resp_token.json()["access_token"]
+        return self.read_access_token_response(resp_token)
+
+    def refresh_access_token(self, refresh_token: str) -> str:
+        """
+        Get a new access token with a refresh token
+
+        Args:
+            refresh_token (str): refresh token
+
+        Returns:
+            str: access token
+        """
+        params = {
+            "grant_type": "refresh_token",
+            "refresh_token": refresh_token,
+            "client_id": self.client_id,
+            "client_secret": self.client_secret,
+        }
+        resp_token = requests.post(self.access_token_url, params=params)
+        if not resp_token.ok:
+            raise AuthError(
+                "Refreshing the access token failed ! Reason : `{}`".format(resp_token.content)
+            )
+        return self.read_access_token_response(resp_token)
+
+    def read_access_token_response(self, response: requests.Response) -> str:
+        """
+        Read the access token and keep the refresh token of a token response
+
+        Args:
+            response (requests.Response): response of the token endpoint
+
+        Returns:
+            str: access token
+        """
+        response_dict = response.json()
+        refresh_token = response_dict.get("refresh_token")
+        if refresh_token is not None:
+            self._token_cache.refresh_token = refresh_token
+        return response_dict["access_token"]
 
     def get_session_token(self, access_token:str):
         params = {"version": "*", "access_token": access_token}
         session_token = requests.post(self.session_token_url, params=params)
         return session_token.json()["BhRestToken"]
 
-    def __call__(self, request: requests.PreparedRequest) -> requests.PreparedRequest:
-        auth_code = self.get_auth_code()
-        access_token = self.get_access_token(auth_code)
+    def load_token_store(self) -> Optional[Dict[str, Any]]:
+        """
+        Load the tokens stored on disk
+
+        Returns:
+            Optional[Dict[str, Any]]: stored tokens or `None` if there is no valid store
+        """
+        if self.token_store_path is None:
+            return None
+        try:
+            with open(self.token_store_path, "r", encoding="utf-8") as store_file:
+                return json.load(store_file)
+        except (OSError, ValueError):
+            return None
+
+    def save_token_store(self, session_token: Optional[str], expires_at: Optional[float]) -> None:
+        """
+        Store the tokens on disk
+
+        Args:
+            session_token (Optional[str]): session token, `None` if it has been rejected
+            expires_at (Optional[float]): expiration timestamp of the session token
+        """
+        if self.token_store_path is None:
+            return
+        stored_tokens = dict(
+            session_token=session_token,
+            expires_at=expires_at,
+            refresh_token=self._token_cache.refresh_token,
+        )
+        temporary_path = f"{self.token_store_path}.{threading.get_ident()}.tmp"
+        try:
+            # The file is only readable by its owner : it contains credentials
+            file_descriptor = os.open(
+                temporary_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600
+            )
+            with os.fdopen(file_descriptor, "w", encoding="utf-8") as store_file:
+                json.dump(stored_tokens, store_file)
+            os.replace(temporary_path, self.token_store_path)
+        except OSError as error:
+            logger.warning(
+                f"Fail to write the token store `{self.token_store_path}` : {error}"
+            )
+
+    def request_token(self) -> Tuple[str, Optional[float]]:
+        """
+        Get a session token
+
+        A session token stored on disk is reused while it is valid.
+        Otherwise, the access token is got with the refresh token, or by logging in
+        if there is no refresh token or if it has been rejected.
+
+        Returns:
+            Tuple[str, Optional[float]]: session token and its lifetime in seconds
+        """
+        token_cache = self._token_cache
+        stored_tokens = self.load_token_store()
+        if stored_tokens is not None:
+            if token_cache.refresh_token is None:
+                token_cache.refresh_token = stored_tokens.get("refresh_token")
+            session_token = stored_tokens.get("session_token")
+            expires_at = stored_tokens.get("expires_at")
+            if session_token is not None and expires_at is not None:
+                expires_in = expires_at - time.time()
+                if expires_in > self.token_expiry_margin:
+                    logger.debug("The session token has been loaded from the token store")
+                    return session_token, expires_in
+
+        access_token = None
+        if token_cache.refresh_token is not None:
+            logger.debug("Refreshing the access token...")
+            try:
+                access_token = self.refresh_access_token(token_cache.refresh_token)
+            except AuthError as error:
+                logger.warning(f"Fail to refresh the access token, logging in again : {error}")
+                token_cache.refresh_token = None
+        if access_token is None:
+            logger.debug("Logging in...")
+            auth_code = self.get_auth_code()
+            access_token = self.get_access_token(auth_code)
+
         session_token = self.get_session_token(access_token)
-        auth_header = {"BhRestToken": session_token}
-        request.headers.update(auth_header)
-        return request
+        self.save_token_store(session_token, time.time() + self.session_token_lifetime)
+        logger.debug("The session token has been got")
+        return session_token, self.session_token_lifetime
+
+    def invalidate_token(self, token: str) -> None:
+        super().invalidate_token(token)
+        stored_tokens = self.load_token_store()
+        if stored_tokens is not None and stored_tokens.get("session_token") == token:
+            with self._token_cache.lock:
+                self.save_token_store(None, None)
+
+    def get_authorization_header(self, token: str) -> Dict[str, str]:
+        return {self.name: token}
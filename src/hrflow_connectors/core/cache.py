@@ -0,0 +1,158 @@
+from pydantic import BaseModel, Field, PrivateAttr
+from typing import Any, Dict, Optional, Tuple
+import collections
+import hashlib
+import json
+import os
+import threading
+import time
+
+from ..utils.logger import get_logger
+
+logger = get_logger()
+
+
+class ParsingCache(BaseModel):
+    """
+    Content-addressed cache of parsing results
+
+    The results are indexed by the SHA-256 hash of the parsed text.
+    The memory tier is a LRU cache of `max_size` entries.
+    If `directory` is given, the results are also stored on disk, so they are reused by the next runs.
+    The entries older than `ttl` seconds are ignored.
+    """
+
+    max_size: int = Field(
+        1024,
+        ge=0,
+        description="Maximum number of parsing results kept in memory. Default value : `1024`",
+    )
+    ttl: Optional[float] = Field(
+        None,
+        gt=0,
+        description="Time to live of a parsing result in seconds. Default value : `None` (no expiration)",
+    )
+    directory: Optional[str] = Field(
+        None,
+        description="Directory of the on-disk tier. Default value : `None` (memory only)",
+    )
+
+    _entries: Dict[str, Tuple[float, Dict[str, Any]]] = PrivateAttr(
+        default_factory=collections.OrderedDict
+    )
+    _lock: threading.Lock = PrivateAttr(default_factory=threading.Lock)
+
+    @staticmethod
+    def get_key(text: str) -> str:
+        """
+        Get the cache key of a text
+
+        Args:
+            text (str): parsed text
+
+        Returns:
+            str: SHA-256 hash of the text
+        """
+        return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+    def is_expired(self, created_at: float) -> bool:
+        """
+        Check if an entry has expired
+
+        Args:
+            created_at (float): timestamp of the entry
+
+        Returns:
+            bool: entry has expired ?
+        """
+        return self.ttl is not None and time.time() - created_at > self.ttl
+
+    def get_path(self, key: str) -> str:
+        """
+        Get the path of the cache file of a key
+
+        Args:
+            key (str): cache key
+
+        Returns:
+            str: path in the on-disk tier
+        """
+        return os.path.join(self.directory, f"{key}.json")
+
+    def get(self, text: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the parsing result of a text
+
+        Args:
+            text (str): parsed text
+
+        Returns:
+            Optional[Dict[str, Any]]: parsing result or `None` if the text is not in the cache
+        """
+        key = self.get_key(text)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                created_at, data = entry
+                if not self.is_expired(created_at):
+                    self._entries.move_to_end(key)
+                    return data
+                del self._entries[key]
+
+        if self.directory is None:
+            return None
+
+        try:
+            with open(self.get_path(key), "r", encoding="utf-8") as cache_file:
+                entry = json.load(cache_file)
+        except (OSError, ValueError):
+            return None
+
+        created_at = entry["created_at"]
+        if self.is_expired(created_at):
+            return None
+        data = entry["data"]
+        self.set_in_memory(key, created_at, data)
+        return data
+
+    def set(self, text: str, data: Dict[str, Any]) -> None:
+        """
+        Store the parsing result of a text
+
+        Args:
+            text (str): parsed text
+            data (Dict[str, Any]): parsing result
+        """
+        key = self.get_key(text)
+        created_at = time.time()
+        self.set_in_memory(key, created_at, data)
+
+        if self.directory is None:
+            return
+
+        os.makedirs(self.directory, exist_ok=True)
+        path = self.get_path(key)
+        temporary_path = f"{path}.{threading.get_ident()}.tmp"
+        try:
+            with open(temporary_path, "w", encoding="utf-8") as cache_file:
+                json.dump(dict(created_at=created_at, data=data), cache_file)
+            os.replace(temporary_path, path)
+        except OSError as error:
+            logger.warning(f"Fail to write the parsing cache file `{path}` : {error}")
+
+    def set_in_memory(self, key: str, created_at: float, data: Dict[str, Any]) -> None:
+        """
+        Store an entry in the memory tier and evict the least recently used entries
+
+        Args:
+            key (str): cache key
+            created_at (float): timestamp of the entry
+            data (Dict[str, Any]): parsing result
+        """
+        if self.max_size == 0:
+            return
+        with self._lock:
+            self._entries[key] = (created_at, data)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
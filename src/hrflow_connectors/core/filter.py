@@ -0,0 +1,132 @@
+from pydantic import BaseModel, Field
+from typing import Any, Iterator, List, TypeVar
+import datetime
+import enum
+import operator
+
+from ..utils.datetime_converter import from_str_to_datetime, DateFormatError
+from ..utils.logger import get_logger
+
+logger = get_logger()
+
+ItemType = TypeVar("ItemType")
+
+
+class FilterOperator(str, enum.Enum):
+    """
+    Comparison operators of a `FilterSpec`
+    """
+
+    EQUAL = "eq"
+    NOT_EQUAL = "ne"
+    GREATER_THAN = "gt"
+    GREATER_OR_EQUAL = "gte"
+    LESS_THAN = "lt"
+    LESS_OR_EQUAL = "lte"
+    IN = "in"
+    NOT_IN = "not_in"
+    CONTAINS = "contains"
+
+
+_ORDER_OPERATORS = {
+    FilterOperator.GREATER_THAN: operator.gt,
+    FilterOperator.GREATER_OR_EQUAL: operator.ge,
+    FilterOperator.LESS_THAN: operator.lt,
+    FilterOperator.LESS_OR_EQUAL: operator.le,
+}
+
+
+class FilterSpec(BaseModel):
+    """
+    Declarative filter on a field of the pulled items
+
+    A connector can translate it into the native query parameters of its API,
+    so the items are filtered at the source. Otherwise, it is evaluated on each pulled item.
+
+    >>> FilterSpec(field="status", operator="eq", value="SOURCING")
+    >>> FilterSpec(field="department.id", operator="in", value=["123", "456"])
+    """
+
+    field: str = Field(
+        ..., description="Field of the pulled item. Nested fields are separated by `.`"
+    )
+    operator: FilterOperator = Field(
+        FilterOperator.EQUAL, description="Comparison operator. Default value : `eq`"
+    )
+    value: Any = Field(..., description="Value compared with the field of the item")
+
+    def get_field_value(self, item: Any) -> Any:
+        """
+        Get the value of the filtered field in an item
+
+        Args:
+            item (Any): pulled item, a dictionary or an object
+
+        Returns:
+            Any: field value or `None` if the field is missing
+        """
+        value = item
+        for field_name in self.field.split("."):
+            if value is None:
+                return None
+            if isinstance(value, dict):
+                value = value.get(field_name)
+            else:
+                value = getattr(value, field_name, None)
+        return value
+
+    def evaluate(self, item: Any) -> bool:
+        """
+        Evaluate the filter on an item
+
+        A missing field never matches an order comparison (`gt`, `gte`, `lt`, `lte`).
+        A string field compared with a `datetime` value is parsed as an ISO8601 date.
+
+        Args:
+            item (Any): pulled item
+
+        Returns:
+            bool: the item fulfills the filter
+        """
+        field_value = self.get_field_value(item)
+        if self.operator == FilterOperator.EQUAL:
+            return field_value == self.value
+        if self.operator == FilterOperator.NOT_EQUAL:
+            return field_value != self.value
+        if self.operator == FilterOperator.IN:
+            return field_value in self.value
+        if self.operator == FilterOperator.NOT_IN:
+            return field_value not in self.value
+        if field_value is None:
+            return False
+        if self.operator == FilterOperator.CONTAINS:
+            return self.value in field_value
+
+        if isinstance(self.value, datetime.datetime) and isinstance(field_value, str):
+            try:
+                field_value = from_str_to_datetime(field_value)
+            except DateFormatError:
+                return False
+        try:
+            return _ORDER_OPERATORS[self.operator](field_value, self.value)
+        except TypeError:
+            # Values which can not be compared, e.g. naive and aware datetimes
+            return False
+
+
+def apply_filters(data: Iterator[ItemType], filters: List[FilterSpec]) -> Iterator[ItemType]:
+    """
+    Keep the items which fulfill all the filters
+
+    Args:
+        data (Iterator[ItemType]): pulled items
+        filters (List[FilterSpec]): filters to evaluate on each item
+
+    Returns:
+        Iterator[ItemType]: filtered items
+    """
+    if len(filters) == 0:
+        return data
+    return filter(
+        lambda item: all(filter_spec.evaluate(item) for filter_spec in filters), data
+    )
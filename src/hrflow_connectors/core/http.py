@@ -0,0 +1,331 @@
+from pydantic import BaseModel, Field, PrivateAttr
+from typing import Any, List, Optional
+import datetime
+import email.utils
+import random
+import requests
+from requests.adapters import HTTPAdapter
+import threading
+import time
+
+from ..core.ratelimit import get_rate_limiter
+from ..utils.logger import get_logger
+
+logger = get_logger()
+
+
+class RetryPolicy(BaseModel):
+    """
+    Policy to retry the requests which failed temporarily
+
+    A request is retried when the connection fails or when the response status is in `status_forcelist`.
+    Only the `allowed_methods` are retried, except on `429 Too Many Requests` :
+    the request has not been processed, so it is retried whatever its method.
+
+    The delay before the attempt `n + 1` is `backoff_factor * 2 ** (n - 1)` seconds, capped by `max_backoff`.
+    With `jitter`, it is randomly drawn between half of this delay and this delay, so concurrent clients do not retry together.
+    The `Retry-After` header of the response replaces this delay when `respect_retry_after` is enabled.
+    """
+
+    max_attempts: int = Field(
+        4,
+        ge=1,
+        description="Maximum number of attempts of a request, `1` to disable the retries. Default value : `4`",
+    )
+    backoff_factor: float = Field(
+        1.0,
+        ge=0,
+        description="Delay in seconds before the first retry, doubled after each attempt. Default value : `1.0`",
+    )
+    max_backoff: float = Field(
+        60.0,
+        ge=0,
+        description="Maximum delay in seconds between two attempts. Default value : `60.0`",
+    )
+    jitter: bool = Field(
+        True, description="Randomize the delay between two attempts. Default value : `True`"
+    )
+    status_forcelist: List[int] = Field(
+        [429, 500, 502, 503, 504],
+        description="Response status codes to retry. Default value : `[429, 500, 502, 503, 504]`",
+    )
+    allowed_methods: List[str] = Field(
+        ["GET", "HEAD", "OPTIONS"],
+        description="HTTP methods to retry. `PUT` and `DELETE` create or delete records on some APIs. "
+        'Default value : `["GET", "HEAD", "OPTIONS"]` (the read-only methods)',
+    )
+    respect_retry_after: bool = Field(
+        True,
+        description="Wait for the delay given by the `Retry-After` header. Default value : `True`",
+    )
+
+    def is_retryable_method(self, request: requests.PreparedRequest) -> bool:
+        """
+        Check if the method of a request can be retried
+
+        Args:
+            request (requests.PreparedRequest): request
+
+        Returns:
+            bool: the request can be retried
+        """
+        return request.method.upper() in [method.upper() for method in self.allowed_methods]
+
+    def is_retryable_response(
+        self, request: requests.PreparedRequest, response: requests.Response
+    ) -> bool:
+        """
+        Check if a response must be retried
+
+        Args:
+            request (requests.PreparedRequest): request
+            response (requests.Response): response
+
+        Returns:
+            bool: the request must be retried
+        """
+        if response.status_code not in self.status_forcelist:
+            return False
+        return response.status_code == 429 or self.is_retryable_method(request)
+
+    def get_retry_after(self, response: Optional[requests.Response]) -> Optional[float]:
+        """
+        Get the delay given by the `Retry-After` header of a response
+
+        Args:
+            response (Optional[requests.Response]): response
+
+        Returns:
+            Optional[float]: delay in seconds or `None` if the header is missing or invalid
+        """
+        if response is None or not self.respect_retry_after:
+            return None
+        retry_after = response.headers.get("Retry-After")
+        if retry_after is None:
+            return None
+        try:
+            return max(0.0, float(retry_after))
+        except ValueError:
+            pass
+        # HTTP-date, e.g. `Wed, 21 Oct 2015 07:28:00 GMT`
+        try:
+            retry_date = email.utils.parsedate_to_datetime(retry_after)
+        except (TypeError, ValueError):
+            return None
+        if retry_date.tzinfo is None:
+            retry_date = retry_date.replace(tzinfo=datetime.timezone.utc)
+        now = datetime.datetime.now(datetime.timezone.utc)
+        return max(0.0, (retry_date - now).total_seconds())
+
+    def get_delay(self, attempt: int, response: Optional[requests.Response] = None) -> float:
+        """
+        Get the delay before the next attempt
+
+        Args:
+            attempt (int): number of the failed attempt, starting at `1`
+            response (Optional[requests.Response], optional): response of the failed attempt. Defaults to None.
+
+        Returns:
+            float: delay in seconds
+        """
+        retry_after = self.get_retry_after(response)
+        if retry_after is not None:
+            return retry_after
+        delay = min(self.max_backoff, self.backoff_factor * 2 ** (attempt - 1))
+        if self.jitter:
+            delay = random.uniform(delay / 2, delay)
+        return delay
+
+
+class RetryCounter:
+    """
+    Thread-safe counter of retried requests, shared by the copies of a client
+    """
+
+    def __init__(self):
+        self.value = 0
+        self._lock = threading.Lock()
+
+    def increment(self) -> None:
+        with self._lock:
+            self.value += 1
+
+
+class HttpClient(BaseModel):
+    """
+    Long-lived HTTP client shared by the actions
+
+    The client owns a `requests.Session` with a connection pool per host,
+    so consecutive requests to the same host reuse the open connections
+    instead of repeating the TCP and TLS handshakes.
+    The session is created with the client and shared by its copies.
+
+    The requests wait for the rate limiter of their host, if any (see `core.ratelimit`),
+    and the requests which fail temporarily are retried according to `retry_policy`.
+    """
+
+    pool_connections: int = Field(
+        10,
+        ge=1,
+        description="Number of hosts whose connection pool is kept. Default value : `10`",
+    )
+    pool_maxsize: int = Field(
+        10,
+        ge=1,
+        description="Maximum number of connections kept alive per host. Default value : `10`",
+    )
+    keep_alive: bool = Field(
+        True,
+        description="Keep the connections open between requests. Default value : `True`",
+    )
+    timeout: Optional[float] = Field(
+        60,
+        gt=0,
+        description="Timeout in seconds to connect and to wait for the response, `None` to wait forever. Default value : `60`",
+    )
+
+    retry_policy: RetryPolicy = Field(
+        default_factory=RetryPolicy,
+        description="Policy to retry the requests which failed temporarily. Default value : `RetryPolicy()`",
+    )
+
+    _session: requests.Session = PrivateAttr()
+    _retry_counter: RetryCounter = PrivateAttr()
+
+    def __init__(self, **data: Any):
+        super().__init__(**data)
+        self._session = self.create_session()
+        self._retry_counter = RetryCounter()
+
+    def create_session(self) -> requests.Session:
+        """
+        Create the session and mount the pooled adapters
+
+        Returns:
+            requests.Session: session
+        """
+        logger.debug(
+            f"Creating an HTTP session with {self.pool_connections} pool(s) of {self.pool_maxsize} connection(s)"
+        )
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=self.pool_connections, pool_maxsize=self.pool_maxsize
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+
+    def send(self, request: requests.PreparedRequest, **kwargs: Any) -> requests.Response:
+        """
+        Send a prepared request
+
+        >>> prepared_request = requests.Request("GET", "https://api.test/jobs").prepare()
+        >>> response = http_client.send(prepared_request)
+
+        Args:
+            request (requests.PreparedRequest): prepared request
+            **kwargs (Any): options of `requests.Session.send`. The default `timeout` is the one of the client.
+
+        Returns:
+            requests.Response: response
+        """
+        kwargs.setdefault("timeout", self.timeout)
+        if not self.keep_alive:
+            request.headers.setdefault("Connection", "close")
+
+        retry_policy = self.retry_policy
+        rate_limiter = get_rate_limiter(request.url)
+        attempt = 1
+        while True:
+            if rate_limiter is not None:
+                delay = rate_limiter.acquire()
+                if delay > 0:
+                    logger.debug(f"Request delayed by {delay:.2f}s by the rate limiter")
+            try:
+                response = self._session.send(request, **kwargs)
+            except (requests.ConnectionError, requests.Timeout) as error:
+                if attempt >= retry_policy.max_attempts or not retry_policy.is_retryable_method(
+                    request
+                ):
+                    raise
+                response = None
+                reason = repr(error)
+            else:
+                if attempt >= retry_policy.max_attempts or not retry_policy.is_retryable_response(
+                    request, response
+                ):
+                    return response
+                reason = f"status {response.status_code}"
+
+            delay = retry_policy.get_delay(attempt, response)
+            if response is not None:
+                # Release the connection before waiting
+                response.close()
+            self._retry_counter.increment()
+            logger.warning(
+                f"Attempt {attempt}/{retry_policy.max_attempts} of `{request.method} {request.url}` "
+                f"has failed ({reason}), retrying in {delay:.1f}s"
+            )
+            time.sleep(delay)
+            attempt += 1
+
+    def request(self, method: str, url: str, **kwargs: Any) -> requests.Response:
+        """
+        Build and send a request
+
+        Args:
+            method (str): HTTP method
+            url (str): URL
+            **kwargs (Any): options of `requests.Request` (`params`, `json`, `headers`, `auth`...)
+
+        Returns:
+            requests.Response: response
+        """
+        prepared_request = requests.Request(method, url, **kwargs).prepare()
+        return self.send(prepared_request)
+
+    def get(self, url: str, **kwargs: Any) -> requests.Response:
+        """
+        Send a GET request
+
+        Args:
+            url (str): URL
+            **kwargs (Any): options of `requests.Request` (`params`, `headers`, `auth`...)
+
+        Returns:
+            requests.Response: response
+        """
+        return self.request("GET", url, **kwargs)
+
+    def get_retry_count(self) -> int:
+        """
+        Get the number of retried requests since the creation of the client
+
+        Returns:
+            int: number of retries
+        """
+        return self._retry_counter.value
+
+    def close(self) -> None:
+        """
+        Close the open connections
+        """
+        self._session.close()
+
+
+_default_http_client: Optional[HttpClient] = None
+_default_http_client_lock = threading.Lock()
+
+
+def get_default_http_client() -> HttpClient:
+    """
+    Get the HTTP client shared by the actions of the process
+
+    Returns:
+        HttpClient: default HTTP client, created on the first call
+    """
+    global _default_http_client
+    with _default_http_client_lock:
+        if _default_http_client is None:
+            _default_http_client = HttpClient()
+        return _default_http_client
@@ -0,0 +1,189 @@
+from typing import Any, Iterable, Iterator, Optional, Union
+import codecs
+import json
+import requests
+
+from ..utils.logger import get_logger
+
+logger = get_logger()
+
+WHITESPACE = " \t\n\r"
+DELIMITERS = WHITESPACE + ",:]}"
+
+
+class JsonStreamReader:
+    """
+    Reader of a JSON document received chunk by chunk
+
+    The buffer only holds the text which has not been read yet,
+    so the memory is bounded by the largest value read at once.
+    """
+
+    def __init__(self, chunks: Iterable[Union[bytes, str]], encoding: Optional[str] = None):
+        """
+        JSON stream reader
+
+        Args:
+            chunks (Iterable[Union[bytes, str]]): chunks of the document, e.g. `response.iter_content()`
+            encoding (Optional[str], optional): encoding of the bytes chunks. Defaults to UTF-8.
+        """
+        self.chunk_iter = iter(chunks)
+        if encoding is None or codecs.lookup(encoding).name == "utf-8":
+            # Ignore the byte order mark
+            encoding = "utf-8-sig"
+        self.decoder = codecs.getincrementaldecoder(encoding)()
+        self.json_decoder = json.JSONDecoder()
+        self.buffer = ""
+        self.position = 0
+        self.is_exhausted = False
+
+    def read_more(self) -> bool:
+        """
+        Append the next chunk to the buffer
+
+        Returns:
+            bool: `False` if the document has been entirely read
+        """
+        if self.is_exhausted:
+            return False
+        # Drop the text already read
+        self.buffer = self.buffer[self.position :]
+        self.position = 0
+        for chunk in self.chunk_iter:
+            if isinstance(chunk, bytes):
+                chunk = self.decoder.decode(chunk)
+            if chunk:
+                self.buffer += chunk
+                return True
+        self.buffer += self.decoder.decode(b"", final=True)
+        self.is_exhausted = True
+        return True
+
+    def peek(self) -> Optional[str]:
+        """
+        Skip the whitespaces and get the next character without reading it
+
+        Returns:
+            Optional[str]: next character or `None` at the end of the document
+        """
+        while True:
+            while self.position < len(self.buffer) and self.buffer[self.position] in WHITESPACE:
+                self.position += 1
+            if self.position < len(self.buffer):
+                return self.buffer[self.position]
+            if not self.read_more():
+                return None
+
+    def expect(self, characters: str) -> str:
+        """
+        Read the next character, which must be one of `characters`
+
+        Args:
+            characters (str): expected characters
+
+        Returns:
+            str: read character
+        """
+        character = self.peek()
+        if character is None or character not in characters:
+            raise json.JSONDecodeError(
+                f"Expecting one of `{characters}`", self.buffer, self.position
+            )
+        self.position += 1
+        return character
+
+    def read_value(self) -> Any:
+        """
+        Read the next JSON value
+
+        Returns:
+            Any: decoded value
+        """
+        self.peek()
+        while True:
+            try:
+                value, end = self.json_decoder.raw_decode(self.buffer, self.position)
+            except json.JSONDecodeError:
+                # The value may be incomplete
+                if not self.read_more():
+                    raise
+                continue
+            # A value which is not followed by a delimiter may be incomplete,
+            # e.g. the number `4` of `4.5` when the buffer ends with `4.`
+            is_delimited = end < len(self.buffer) and self.buffer[end] in DELIMITERS
+            if not is_delimited and not self.is_exhausted:
+                self.read_more()
+                continue
+            self.position = end
+            return value
+
+
+def iter_json_array(
+    chunks: Iterable[Union[bytes, str]], path: str = "", encoding: Optional[str] = None
+) -> Iterator[Any]:
+    """
+    Decode the items of a JSON array as soon as they are received
+
+    The array is the document itself, or is found by the keys of `path` in the nested objects.
+    The values before the array are skipped and the document is not read after it.
+
+    >>> list(iter_json_array([b'{"jobs": [{"id"', b': 1}, {"id": 2}], "meta": {}}'], path="jobs"))
+    [{'id': 1}, {'id': 2}]
+
+    Args:
+        chunks (Iterable[Union[bytes, str]]): chunks of the document, e.g. `response.iter_content()`
+        path (str, optional): keys leading to the array, separated by `.`. Defaults to "" (the document).
+        encoding (Optional[str], optional): encoding of the bytes chunks. Defaults to UTF-8.
+
+    Yields:
+        Iterator[Any]: items of the array
+    """
+    reader = JsonStreamReader(chunks, encoding=encoding)
+    key_list = path.split(".") if path else []
+    for key in key_list:
+        reader.expect("{")
+        if reader.peek() == "}":
+            raise KeyError(key)
+        while True:
+            current_key = reader.read_value()
+            reader.expect(":")
+            if current_key == key:
+                break
+            # Skip the value of another key
+            reader.read_value()
+            if reader.expect(",}") == "}":
+                raise KeyError(key)
+
+    reader.expect("[")
+    item_count = 0
+    if reader.peek() == "]":
+        reader.position += 1
+    else:
+        while True:
+            yield reader.read_value()
+            item_count += 1
+            if reader.expect(",]") == "]":
+                break
+    logger.debug(f"{item_count} item(s) read from the JSON array `{path}`")
+
+
+def iter_response_json_array(
+    response: requests.Response, path: str = "", chunk_size: int = 64 * 1024
+) -> Iterator[Any]:
+    """
+    Decode the items of a JSON array in a response sent with `stream=True`, as soon as they are received
+
+    The body is decoded as UTF-8, the encoding of JSON, whatever the encoding guessed by `requests`.
+
+    Args:
+        response (requests.Response): streamed response
+        path (str, optional): keys leading to the array, separated by `.`. Defaults to "" (the body).
+        chunk_size (int, optional): size of the chunks read from the socket. Defaults to 64 KiB.
+
+    Yields:
+        Iterator[Any]: items of the array
+    """
+    try:
+        yield from iter_json_array(response.iter_content(chunk_size=chunk_size), path=path)
+    finally:
+        response.close()
@@ -0,0 +1,324 @@
+from pydantic import BaseModel, Field
+from typing import Any, Dict, Iterator, Optional
+from urllib.parse import urljoin
+import copy
+import requests
+
+from ..core.error import PullError
+from ..core.http import HttpClient
+from ..utils.concurrency import prefetch
+from ..utils.logger import get_logger
+
+logger = get_logger()
+
+
+def get_path_value(data: Any, path: str) -> Any:
+    """
+    Get a value in a JSON document by its path
+
+    >>> get_path_value({"paging": {"next": "https://..."}}, "paging.next")
+    'https://...'
+
+    Args:
+        data (Any): JSON document
+        path (str): keys separated by `.`
+
+    Returns:
+        Any: value or `None` if the path does not exist
+    """
+    for key in path.split("."):
+        if not isinstance(data, dict):
+            return None
+        data = data.get(key)
+    return data
+
+
+class Paginator(BaseModel):
+    """
+    Pagination strategy of an API
+
+    The paginator sends the first request, then builds the request of each next page
+    from the previous response, until the last page. The pages are streamed lazily :
+    the next page is only requested when the current one is consumed, or while it is
+    consumed with `prefetch_next_page`.
+
+    >>> paginator = LinkPaginator(next_link_path="paging.next")
+    >>> for page in paginator.iter_pages(http_client, pull_jobs_request):
+    ...     job_list = page["jobs"]
+    """
+
+    prefetch_next_page: bool = Field(
+        True,
+        description="Request the next page in the background while the current page is processed. Default value : `True`",
+    )
+    max_pages: Optional[int] = Field(
+        None,
+        ge=1,
+        description="Maximum number of pages. Default value : `None` (all the pages)",
+    )
+
+    def get_first_request(self, request: requests.Request) -> requests.Request:
+        """
+        Get the request of the first page
+
+        Args:
+            request (requests.Request): request given by the connector
+
+        Returns:
+            requests.Request: request of the first page
+        """
+        return request
+
+    def get_next_request(
+        self,
+        request: requests.Request,
+        response: requests.Response,
+        page: Dict[str, Any],
+    ) -> Optional[requests.Request]:
+        """
+        Get the request of the next page
+
+        Args:
+            request (requests.Request): request of the current page
+            response (requests.Response): response of the current page
+            page (Dict[str, Any]): JSON content of the current page
+
+        Returns:
+            Optional[requests.Request]: request of the next page or `None` if the current page is the last one
+        """
+        raise NotImplementedError
+
+    def fetch_pages(
+        self,
+        http_client: HttpClient,
+        request: requests.Request,
+        error_message: str = "Failed to get page",
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Request the pages one after the other
+
+        Args:
+            http_client (HttpClient): HTTP client sending the requests
+            request (requests.Request): request of the first page
+            error_message (str, optional): message of the `PullError` raised on a failed page.
+                Defaults to "Failed to get page".
+
+        Yields:
+            Iterator[Dict[str, Any]]: JSON content of each page
+        """
+        page_request = self.get_first_request(request)
+        page_number = 1
+        while page_request is not None:
+            prepared_request = page_request.prepare()
+            response = http_client.send(prepared_request)
+            if not response.ok:
+                raise PullError(
+                    response,
+                    message=error_message,
+                    page_number=page_number,
+                    url=prepared_request.url,
+                )
+            logger.info(f"Get page {page_number} : `{prepared_request.url}`")
+            page = response.json()
+            yield page
+
+            if self.max_pages is not None and page_number >= self.max_pages:
+                logger.info(f"The maximum number of pages ({self.max_pages}) is reached")
+                return
+            page_request = self.get_next_request(page_request, response, page)
+            page_number += 1
+
+    def iter_pages(
+        self,
+        http_client: HttpClient,
+        request: requests.Request,
+        error_message: str = "Failed to get page",
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Stream all the pages, with the prefetch of the next page if enabled
+
+        Args:
+            http_client (HttpClient): HTTP client sending the requests
+            request (requests.Request): request of the first page
+            error_message (str, optional): message of the `PullError` raised on a failed page.
+                Defaults to "Failed to get page".
+
+        Returns:
+            Iterator[Dict[str, Any]]: JSON content of each page
+        """
+        page_iter = self.fetch_pages(http_client, request, error_message=error_message)
+        if self.prefetch_next_page:
+            page_iter = prefetch(page_iter)
+        return page_iter
+
+
+def copy_request(request: requests.Request, **params: Any) -> requests.Request:
+    """
+    Copy a request and update its query parameters
+
+    Args:
+        request (requests.Request): request to copy
+        **params (Any): query parameters to set
+
+    Returns:
+        requests.Request: new request
+    """
+    new_request = copy.copy(request)
+    new_request.params = dict(request.params or dict(), **params)
+    return new_request
+
+
+class CursorPaginator(Paginator):
+    """
+    Pagination by a cursor : each page gives the cursor of the next page, sent as a query parameter
+
+    >>> CursorPaginator(cursor_param="pageId", cursor_path="nextPageId")
+    """
+
+    cursor_param: str = Field(..., description="Query parameter of the cursor")
+    cursor_path: str = Field(
+        ..., description="Path of the next cursor in the page. Nested keys are separated by `.`"
+    )
+    items_path: Optional[str] = Field(
+        None,
+        description="Path of the items in the page, to stop at the first empty page. Default value : `None`",
+    )
+
+    def get_next_request(
+        self,
+        request: requests.Request,
+        response: requests.Response,
+        page: Dict[str, Any],
+    ) -> Optional[requests.Request]:
+        if self.items_path is not None and not get_path_value(page, self.items_path):
+            return None
+        next_cursor = get_path_value(page, self.cursor_path)
+        if next_cursor is None or next_cursor == "":
+            return None
+        return copy_request(request, **{self.cursor_param: next_cursor})
+
+
+class OffsetPaginator(Paginator):
+    """
+    Pagination by an offset and a limit sent as query parameters
+
+    The offset is counted in items, or in pages with `count_pages`.
+    The last page is the one with less than `limit` items, or the one reaching `total_path`.
+
+    >>> OffsetPaginator(offset_param="page", limit_param="pageSize", limit=100, count_pages=True, items_path="list")
+    """
+
+    offset_param: str = Field(..., description="Query parameter of the offset")
+    limit_param: str = Field(..., description="Query parameter of the page size")
+    limit: int = Field(..., ge=1, description="Number of items per page")
+    start: int = Field(0, ge=0, description="Offset of the first page. Default value : `0`")
+    count_pages: bool = Field(
+        False,
+        description="The offset is a page number instead of a number of items. Default value : `False`",
+    )
+    items_path: str = Field(
+        ..., description="Path of the items in the page. Nested keys are separated by `.`"
+    )
+    total_path: Optional[str] = Field(
+        None,
+        description="Path of the total number of items in the page. Default value : `None`",
+    )
+
+    def get_first_request(self, request: requests.Request) -> requests.Request:
+        return copy_request(
+            request, **{self.offset_param: self.start, self.limit_param: self.limit}
+        )
+
+    def get_next_request(
+        self,
+        request: requests.Request,
+        response: requests.Response,
+        page: Dict[str, Any],
+    ) -> Optional[requests.Request]:
+        items = get_path_value(page, self.items_path) or []
+        if len(items) < self.limit:
+            return None
+
+        offset = request.params[self.offset_param]
+        next_offset = offset + 1 if self.count_pages else offset + self.limit
+        if self.total_path is not None:
+            total = get_path_value(page, self.total_path)
+            next_item_index = next_offset * self.limit if self.count_pages else next_offset
+            if total is not None and next_item_index >= int(total):
+                return None
+        return copy_request(request, **{self.offset_param: next_offset})
+
+
+class LinkPaginator(Paginator):
+    """
+    Pagination by the URL of the next page
+
+    The URL is read in the `Link` header of the response (`rel="next"`),
+    or in the page at `next_link_path`, e.g. `links.next` in a JSON:API document.
+    It already contains the query parameters of the next page.
+
+    >>> LinkPaginator()  # Link header
+    >>> LinkPaginator(next_link_path="paging.next")
+    """
+
+    next_link_path: Optional[str] = Field(
+        None,
+        description="Path of the next page URL in the page. Default value : `None` (`Link` header)",
+    )
+
+    def get_next_link(
+        self, response: requests.Response, page: Dict[str, Any]
+    ) -> Optional[str]:
+        """
+        Get the URL of the next page
+
+        Args:
+            response (requests.Response): response of the current page
+            page (Dict[str, Any]): JSON content of the current page
+
+        Returns:
+            Optional[str]: URL of the next page or `None`
+        """
+        if self.next_link_path is None:
+            return response.links.get("next", {}).get("url")
+        return get_path_value(page, self.next_link_path)
+
+    def get_next_request(
+        self,
+        request: requests.Request,
+        response: requests.Response,
+        page: Dict[str, Any],
+    ) -> Optional[requests.Request]:
+        next_link = self.get_next_link(response, page)
+        if not next_link:
+            return None
+        next_url = urljoin(response.url, next_link)
+        if next_url == response.url:
+            logger.warning(f"The next page is the current page `{next_url}`, stop paginating")
+            return None
+        next_request = copy.copy(request)
+        next_request.url = next_url
+        # The query parameters are in the next URL
+        next_request.params = dict()
+        return next_request
+
+
+class ODataPaginator(LinkPaginator):
+    """
+    Server-driven pagination of an OData service
+
+    The URL of the next page is `d.__next` in OData v2 and `@odata.nextLink` in OData v4.
+    """
+
+    next_link_path: Optional[str] = Field(
+        "d.__next",
+        description="Path of the next page URL in the page. Default value : `d.__next` (OData v2)",
+    )
+
+    def get_next_link(
+        self, response: requests.Response, page: Dict[str, Any]
+    ) -> Optional[str]:
+        next_link = super().get_next_link(response, page)
+        if next_link is None:
+            next_link = page.get("@odata.nextLink")
+        return next_link
@@ -0,0 +1,171 @@
+from typing import Dict, Optional
+from urllib.parse import urlsplit
+import asyncio
+import threading
+import time
+
+from ..utils.logger import get_logger
+
+logger = get_logger()
+
+
+class TokenBucket:
+    """
+    Token-bucket rate limiter
+
+    The bucket holds up to `burst` tokens and is refilled with `rate` tokens per second.
+    A request consumes a token : when the bucket is empty, it waits for the next token.
+    Thus, the throughput is at most `rate` requests per second on average, with bursts of `burst` requests.
+
+    The waiting times are reserved under a lock, so the bucket can be shared by threads and
+    asynchronous tasks : the requests are spaced evenly instead of waking up together.
+
+    >>> bucket = TokenBucket(rate=10, burst=5)
+    >>> bucket.acquire()  # in a thread
+    >>> await bucket.async_acquire()  # in an asynchronous task
+    """
+
+    def __init__(self, rate: float, burst: int = 1):
+        """
+        Token bucket
+
+        Args:
+            rate (float): number of requests per second
+            burst (int, optional): maximum number of requests sent at once. Defaults to 1.
+        """
+        if rate <= 0:
+            raise ValueError("`rate` must be greater than 0")
+        if burst < 1:
+            raise ValueError("`burst` must be greater than or equal to 1")
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """
+        Reserve a token
+
+        Returns:
+            float: delay in seconds to wait before sending the request
+        """
+        with self._lock:
+            now = time.monotonic()
+            elapsed = now - self._updated_at
+            self._tokens = min(float(self.burst), self._tokens + elapsed * self.rate)
+            self._updated_at = now
+            # The token is taken now : a negative balance is the debt of the waiting requests
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+    def acquire(self) -> float:
+        """
+        Wait for a token in the current thread
+
+        Returns:
+            float: waited delay in seconds
+        """
+        delay = self.reserve()
+        if delay > 0:
+            time.sleep(delay)
+        return delay
+
+    async def async_acquire(self) -> float:
+        """
+        Wait for a token without blocking the event loop
+
+        Returns:
+            float: waited delay in seconds
+        """
+        delay = self.reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return delay
+
+
+_rate_limiters: Dict[str, TokenBucket] = dict()
+_rate_limiters_lock = threading.Lock()
+
+
+def set_rate_limit(host: str, rate: float, burst: int = 1) -> TokenBucket:
+    """
+    Limit the rate of the requests sent to a host by all the HTTP clients of the process
+
+    >>> set_rate_limit("api.smartrecruiters.com", rate=5, burst=5)
+
+    Args:
+        host (str): host name, e.g. `api.smartrecruiters.com`. `*.workable.com` limits all the subdomains
+            which have no rate limit of their own.
+        rate (float): number of requests per second
+        burst (int, optional): maximum number of requests sent at once. Defaults to 1.
+
+    Returns:
+        TokenBucket: rate limiter of the host
+    """
+    rate_limiter = TokenBucket(rate=rate, burst=burst)
+    with _rate_limiters_lock:
+        _rate_limiters[host.lower()] = rate_limiter
+    logger.debug(f"Rate limit of `{host}` : {rate} request(s) per second, burst of {burst}")
+    return rate_limiter
+
+
+def set_default_rate_limit(host: str, rate: float, burst: int = 1) -> TokenBucket:
+    """
+    Limit the rate of the requests sent to a host, unless a rate limit is already set
+
+    The connectors use it to declare the quota of their API, which the user can override with `set_rate_limit`.
+
+    Args:
+        host (str): host name
+        rate (float): number of requests per second
+        burst (int, optional): maximum number of requests sent at once. Defaults to 1.
+
+    Returns:
+        TokenBucket: rate limiter of the host
+    """
+    with _rate_limiters_lock:
+        rate_limiter = _rate_limiters.get(host.lower())
+    if rate_limiter is not None:
+        return rate_limiter
+    return set_rate_limit(host, rate=rate, burst=burst)
+
+
+def remove_rate_limit(host: str) -> None:
+    """
+    Remove the rate limit of a host
+
+    Args:
+        host (str): host name
+    """
+    with _rate_limiters_lock:
+        _rate_limiters.pop(host.lower(), None)
+
+
+def get_rate_limiter(url: str) -> Optional[TokenBucket]:
+    """
+    Get the rate limiter of the host of a URL
+
+    Args:
+        url (str): request URL
+
+    Returns:
+        Optional[TokenBucket]: rate limiter or `None` if the host is not limited
+    """
+    host = urlsplit(url).hostname
+    if host is None:
+        return None
+    host = host.lower()
+    # The exact host, then the wildcards of its parent domains : `*.workable.com`
+    candidate_hosts = [host]
+    domain_parts = host.split(".")
+    for index in range(1, len(domain_parts) - 1):
+        candidate_hosts.append("*." + ".".join(domain_parts[index:]))
+    with _rate_limiters_lock:
+        for candidate_host in candidate_hosts:
+            rate_limiter = _rate_limiters.get(candidate_host)
+            if rate_limiter is not None:
+                return rate_limiter
+    return None
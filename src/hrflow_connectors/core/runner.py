@@ -0,0 +1,97 @@
+from typing import Any, List, Optional
+import asyncio
+
+from ..core.action import BaseAction
+from ..utils.logger import get_logger
+
+logger = get_logger()
+
+
+async def async_execute_actions(
+    actions: List[BaseAction],
+    max_concurrency: Optional[int] = None,
+    return_exceptions: bool = False,
+) -> List[Any]:
+    """
+    Execute many actions concurrently in the running event loop
+
+    >>> results = await async_execute_actions([action_1, action_2], max_concurrency=10)
+
+    Args:
+        actions (List[BaseAction]): actions to execute
+        max_concurrency (Optional[int], optional): maximum number of actions executed at the same time.
+            Defaults to None (no limit).
+        return_exceptions (bool, optional): return the exception of a failed action in the results
+            instead of raising it. Defaults to False.
+
+    Returns:
+        List[Any]: results of `async_execute`, in the order of `actions`
+    """
+    if max_concurrency is not None and max_concurrency < 1:
+        raise ValueError("`max_concurrency` must be greater than or equal to 1")
+
+    action_count = len(actions)
+    logger.info(
+        f"Executing {action_count} action(s) with a maximum concurrency of {max_concurrency}"
+    )
+    semaphore = None
+    if max_concurrency is not None:
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def execute(index: int, action: BaseAction) -> Any:
+        if semaphore is not None:
+            async with semaphore:
+                logger.info(f"Start action {index + 1}/{action_count}")
+                return await action.async_execute()
+        logger.info(f"Start action {index + 1}/{action_count}")
+        return await action.async_execute()
+
+    tasks = [
+        asyncio.ensure_future(execute(index, action))
+        for index, action in enumerate(actions)
+    ]
+    try:
+        results = await asyncio.gather(*tasks, return_exceptions=return_exceptions)
+    except Exception:
+        # Stop the other actions instead of leaving them pending
+        for task in tasks:
+            task.cancel()
+        raise
+    failure_count = sum(1 for result in results if isinstance(result, Exception))
+    if failure_count > 0:
+        logger.error(f"{failure_count}/{action_count} action(s) have failed")
+    logger.info(f"{action_count} action(s) have been executed")
+    return list(results)
+
+
+def execute_actions(
+    actions: List[BaseAction],
+    max_concurrency: Optional[int] = None,
+    return_exceptions: bool = False,
+) -> List[Any]:
+    """
+    Execute many actions concurrently in a new event loop
+
+    It is the synchronous entry point of `async_execute_actions`.
+
+    Args:
+        actions (List[BaseAction]): actions to execute
+        max_concurrency (Optional[int], optional): maximum number of actions executed at the same time.
+            Defaults to None (no limit).
+        return_exceptions (bool, optional): return the exception of a failed action in the results
+            instead of raising it. Defaults to False.
+
+    Returns:
+        List[Any]: results of `async_execute`, in the order of `actions`
+    """
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(
+            async_execute_actions(
+                actions,
+                max_concurrency=max_concurrency,
+                return_exceptions=return_exceptions,
+            )
+        )
+    finally:
+        loop.close()
@@ -0,0 +1,159 @@
+from pydantic import BaseModel, Field
+from typing import Any, Dict, Optional
+import contextlib
+import datetime
+import json
+import sqlite3
+import threading
+
+from ..utils.logger import get_logger
+
+logger = get_logger()
+
+
+class SyncState(BaseModel):
+    """
+    State of the synchronization between a connector and a Board
+    """
+
+    last_run_at: Optional[datetime.datetime] = Field(
+        None, description="Start date of the last successful run"
+    )
+    fingerprints: Dict[str, str] = Field(
+        {}, description="Fingerprint of the job content by reference"
+    )
+    cursors: Dict[str, Any] = Field(
+        {}, description="Connector cursors to resume the next pull"
+    )
+
+
+class SyncStateStore(BaseModel):
+    """
+    SyncStateStore
+
+    This generic class will propose a common interface to all sync-state backends.
+    A state is identified by a `scope` which combines the connector and the Board.
+    """
+
+    def load(self, scope: str) -> SyncState:
+        """
+        Load the state of a scope
+
+        Args:
+            scope (str): connector and Board identifier
+
+        Returns:
+            SyncState: stored state or an empty state if the scope is unknown
+        """
+        raise NotImplementedError("`load` is not implemented")
+
+    def save(self, scope: str, state: SyncState) -> None:
+        """
+        Save the state of a scope
+
+        Args:
+            scope (str): connector and Board identifier
+            state (SyncState): state to save
+        """
+        raise NotImplementedError("`save` is not implemented")
+
+
+class InMemorySyncStateStore(SyncStateStore):
+    """
+    In-memory sync-state store
+
+    The states are lost when the process stops. Mainly used for tests.
+    """
+
+    states: Dict[str, SyncState] = Field({}, description="States by scope")
+
+    def load(self, scope: str) -> SyncState:
+        state = self.states.get(scope)
+        if state is None:
+            return SyncState()
+        return state.copy(deep=True)
+
+    def save(self, scope: str, state: SyncState) -> None:
+        self.states[scope] = state.copy(deep=True)
+
+
+_sqlite_lock = threading.Lock()
+
+
+class SQLiteSyncStateStore(SyncStateStore):
+    """
+    SQLite sync-state store
+
+    The states are stored in a local SQLite file, so they persist between runs.
+    """
+
+    path: str = Field(
+        "hrflow_connectors_state.sqlite",
+        description="Path to the SQLite file. Default value : `hrflow_connectors_state.sqlite`",
+    )
+
+    @contextlib.contextmanager
+    def connect(self):
+        """
+        Open a connection to the SQLite file and create the tables if they are missing
+
+        Yields:
+            sqlite3.Connection: connection committed at the end of the block
+        """
+        with _sqlite_lock:
+            connection = sqlite3.connect(self.path)
+            try:
+                connection.execute(
+                    "CREATE TABLE IF NOT EXISTS sync_run "
+                    "(scope TEXT PRIMARY KEY, last_run_at TEXT, cursors TEXT)"
+                )
+                connection.execute(
+                    "CREATE TABLE IF NOT EXISTS sync_fingerprint "
+                    "(scope TEXT, reference TEXT, fingerprint TEXT, "
+                    "PRIMARY KEY (scope, reference))"
+                )
+                yield connection
+                connection.commit()
+            finally:
+                connection.close()
+
+    def load(self, scope: str) -> SyncState:
+        with self.connect() as connection:
+            run_row = connection.execute(
+                "SELECT last_run_at, cursors FROM sync_run WHERE scope = ?", (scope,)
+            ).fetchone()
+            fingerprint_rows = connection.execute(
+                "SELECT reference, fingerprint FROM sync_fingerprint WHERE scope = ?",
+                (scope,),
+            ).fetchall()
+
+        if run_row is None:
+            return SyncState(fingerprints=dict(fingerprint_rows))
+
+        last_run_at, cursors = run_row
+        return SyncState(
+            last_run_at=last_run_at,
+            cursors=json.loads(cursors or "{}"),
+            fingerprints=dict(fingerprint_rows),
+        )
+
+    def save(self, scope: str, state: SyncState) -> None:
+        last_run_at = None
+        if state.last_run_at is not None:
+            last_run_at = state.last_run_at.isoformat()
+        with self.connect() as connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO sync_run (scope, last_run_at, cursors) VALUES (?, ?, ?)",
+                (scope, last_run_at, json.dumps(state.cursors, default=str)),
+            )
+            connection.execute(
+                "DELETE FROM sync_fingerprint WHERE scope = ?", (scope,)
+            )
+            connection.executemany(
+                "INSERT INTO sync_fingerprint (scope, reference, fingerprint) VALUES (?, ?, ?)",
+                (
+                    (scope, reference, fingerprint)
+                    for reference, fingerprint in state.fingerprints.items()
+                ),
+            )
+        logger.debug(f"Sync state of `{scope}` has been saved in `{self.path}`")
@@ -0,0 +1,30 @@
+from typing import Iterable, Iterator, List, TypeVar
+import itertools
+
+ElementType = TypeVar("ElementType")
+
+
+def chunked(iterable: Iterable[ElementType], size: int) -> Iterator[List[ElementType]]:
+    """
+    Split a stream into lists of `size` elements
+
+    The last list contains the remaining elements. The stream is read lazily.
+
+    >>> list(chunked([1, 2, 3, 4, 5], size=2))
+    [[1, 2], [3, 4], [5]]
+
+    Args:
+        iterable (Iterable[ElementType]): input stream
+        size (int): number of elements per list
+
+    Yields:
+        Iterator[List[ElementType]]: lists of elements in the order of the stream
+    """
+    if size < 1:
+        raise ValueError("`size` must be greater than or equal to 1")
+    iterator = iter(iterable)
+    while True:
+        chunk = list(itertools.islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
@@ -0,0 +1,156 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Iterable, Iterator, Optional, TypeVar
+import asyncio
+import collections
+import functools
+import queue
+import threading
+
+from .logger import get_logger
+
+logger = get_logger()
+
+InputType = TypeVar("InputType")
+OutputType = TypeVar("OutputType")
+
+
+def ordered_parallel_map(
+    function: Callable[[InputType], OutputType],
+    iterable: Iterable[InputType],
+    max_workers: int,
+    max_in_flight: Optional[int] = None,
+) -> Iterator[OutputType]:
+    """
+    Apply `function` to each element of `iterable` in a bounded thread pool
+
+    The results are yielded in the order of `iterable`, whatever the order of completion.
+    At most `max_in_flight` calls are submitted and not yet consumed at the same time,
+    so the input stream is read lazily and the memory stays bounded.
+
+    If a call raises an exception, the exception is raised when its result is reached
+    in the output stream. The calls submitted after it are cancelled if they have not started yet.
+
+    >>> list(ordered_parallel_map(lambda x: x * 2, [1, 2, 3], max_workers=2))
+    [2, 4, 6]
+
+    Args:
+        function (Callable[[InputType], OutputType]): function to apply to each element
+        iterable (Iterable[InputType]): input stream
+        max_workers (int): number of worker threads
+        max_in_flight (Optional[int], optional): maximum number of pending calls.
+            Defaults to `2 * max_workers`, or `1` (no thread pool) when `max_workers=1`.
+
+    Yields:
+        Iterator[OutputType]: results in the order of the input stream
+    """
+    if max_workers < 1:
+        raise ValueError("`max_workers` must be greater than or equal to 1")
+    if max_in_flight is None:
+        max_in_flight = 2 * max_workers if max_workers > 1 else 1
+    if max_in_flight < 1:
+        raise ValueError("`max_in_flight` must be greater than or equal to 1")
+
+    if max_workers == 1 and max_in_flight == 1:
+        # No concurrency : avoid the thread pool overhead
+        yield from map(function, iterable)
+        return
+
+    logger.debug(
+        f"Starting a pool of {max_workers} worker(s) with {max_in_flight} call(s) in flight"
+    )
+    pending = collections.deque()
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    try:
+        for element in iterable:
+            pending.append(executor.submit(function, element))
+            if len(pending) >= max_in_flight:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+    finally:
+        for future in pending:
+            future.cancel()
+        executor.shutdown(wait=True)
+
+
+_END_OF_ITERATION = object()
+
+
+def prefetch(iterable: Iterable[InputType], buffer_size: int = 1) -> Iterator[InputType]:
+    """
+    Read `iterable` ahead in a background thread
+
+    While the consumer processes an element, the next `buffer_size` elements are already being produced,
+    e.g. the next page of a listing is requested while the current page is processed.
+
+    An exception raised by `iterable` is raised in the consumer when its position is reached.
+    If the consumer stops early, the background thread stops after its current element.
+
+    >>> list(prefetch(iter([1, 2, 3])))
+    [1, 2, 3]
+
+    Args:
+        iterable (Iterable[InputType]): input stream, read in a single background thread
+        buffer_size (int, optional): maximum number of elements read ahead. Defaults to 1.
+
+    Yields:
+        Iterator[InputType]: elements of `iterable`, in order
+    """
+    if buffer_size < 1:
+        raise ValueError("`buffer_size` must be greater than or equal to 1")
+
+    buffer = queue.Queue(maxsize=buffer_size)
+    stopped = threading.Event()
+
+    def put(item: Any) -> bool:
+        while not stopped.is_set():
+            try:
+                buffer.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def produce() -> None:
+        try:
+            for element in iterable:
+                if not put((element, None)):
+                    return
+        except BaseException as error:
+            put((_END_OF_ITERATION, error))
+            return
+        put((_END_OF_ITERATION, None))
+
+    producer = threading.Thread(target=produce, name="prefetch", daemon=True)
+    producer.start()
+    try:
+        while True:
+            element, error = buffer.get()
+            if error is not None:
+                raise error
+            if element is _END_OF_ITERATION:
+                return
+            yield element
+    finally:
+        stopped.set()
+
+
+async def run_in_executor(
+    function: Callable[..., OutputType], *args: Any, **kwargs: Any
+) -> OutputType:
+    """
+    Run a blocking function in the default thread executor of the running event loop
+
+    It adapts the synchronous code (blocking `requests` calls) to the asynchronous engine
+    without blocking the event loop.
+
+    Args:
+        function (Callable[..., OutputType]): blocking function
+        *args (Any): positional arguments of `function`
+        **kwargs (Any): keyword arguments of `function`
+
+    Returns:
+        OutputType: result of `function`
+    """
+    loop = asyncio.get_event_loop()
+    return await loop.run_in_executor(None, functools.partial(function, *args, **kwargs))
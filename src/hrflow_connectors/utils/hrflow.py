@@ -1,14 +1,107 @@
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from pydantic import BaseModel
+import hashlib
+import json
 from .schemas import HrflowJob, HrflowProfile
 
+FINGERPRINT_TAG_NAME = "hrflow_connectors_fingerprint"
+FINGERPRINT_IGNORED_FIELDS = ["key", "board", "archived_at", "archieved_at", "updated_at"]
+
+# Value of a field which is missing in an element
+_MISSING = object()
+
+
+class ElementIndex:
+    """
+    Index of a list of elements by the values of some fields
+
+    The index is built once in linear time, then each lookup is a dictionary access.
+    When several elements have the same values, the first one is kept,
+    like `find_element_in_list`.
+    The index does not follow the changes of the list : the elements appended
+    to the list must also be added with `add`.
+
+    >>> element_list = [dict(n="a", v=2), dict(n="b", v=3)]
+    >>> index = ElementIndex(element_list, "n")
+    >>> index.find(n="b")
+    ... dict(n="b", v=3)
+    >>> index.find(n="c")
+    ... None
+    """
+
+    def __init__(self, element_list: List[Dict[str, Any]], *field_names: str):
+        """
+        Element index
+
+        Args:
+            element_list (List[Dict[str, Any]]): list of element with differents fields
+            *field_names (str): names of the indexed fields
+        """
+        self.field_names = field_names
+        self._elements: Dict[Tuple, Dict[str, Any]] = dict()
+        self._unhashable_elements: List[Dict[str, Any]] = []
+        for element in element_list:
+            self.add(element)
+
+    def get_key(self, values: Dict[str, Any]) -> Tuple:
+        """
+        Get the index key of some field values
+
+        Args:
+            values (Dict[str, Any]): field values
+
+        Returns:
+            Tuple: values of the indexed fields. A missing field is a `_MISSING` value.
+        """
+        return tuple(values.get(field_name, _MISSING) for field_name in self.field_names)
+
+    def add(self, element: Dict[str, Any]) -> None:
+        """
+        Add an element to the index
+
+        Args:
+            element (Dict[str, Any]): element
+        """
+        key = self.get_key(element)
+        try:
+            self._elements.setdefault(key, element)
+        except TypeError:
+            # Unhashable values (list, dict...) are searched linearly
+            self._unhashable_elements.append(element)
+
+    def find(self, **fields) -> Optional[Dict[str, Any]]:
+        """
+        Find element with some values of the indexed fields
+
+        Args:
+            **fields: values of all the indexed fields
+
+        Returns:
+            Dict[str, Any]: return element. Otherwise, return None.
+        """
+        if set(fields) != set(self.field_names):
+            raise ValueError(
+                f"The fields {sorted(fields)} do not match the indexed fields {sorted(self.field_names)}"
+            )
+        key = self.get_key(fields)
+        try:
+            element = self._elements.get(key)
+        except TypeError:
+            element = None
+        if element is not None:
+            return element
+        return find_element_in_list(self._unhashable_elements, **fields)
+
 
 def find_element_in_list(
-    element_list: List[Dict[str, Any]], **fields
+    element_list: List[Dict[str, Any]], index: Optional[ElementIndex] = None, **fields
 ) -> Optional[Dict[str, Any]]:
     """
     Find element with some fields in list of elements
 
+    If an `index` of `element_list` on exactly the searched fields is given,
+    the lookup takes a constant time. Otherwise, the list is scanned.
+
     >>> element_list = [dict(n="a", v=2), dict(n="b", v=3)]
     >>> find_element_in_list(element_list, n="a")
     ... dict(n="a", v=2)
@@ -16,19 +109,73 @@ def find_element_in_list(
     ... dict(n="b", v=3)
     >>> find_element_in_list(element_list, v=42)
     ... None
+    >>> find_element_in_list(element_list, index=ElementIndex(element_list, "n"), n="a")
+    ... dict(n="a", v=2)
 
     Args:
         element_list (List[Dict[str, Any]]): list of element with differents fields
+        index (Optional[ElementIndex], optional): prebuilt index of `element_list`. Defaults to None.
 
     Returns:
         Dict[str, Any]: return element. Otherwise, return None.
     """
+    if index is not None and set(fields) == set(index.field_names):
+        return index.find(**fields)
     for element in element_list:
         if element.items() >= fields.items():
             return element
     return None
 
 
+def compute_job_fingerprint(job: Dict[str, Any]) -> str:
+    """
+    Compute a fingerprint of the content of a job
+
+    The fingerprint is a SHA-256 hash of a canonical JSON serialization of the job.
+    The fields which do not describe the content (`key`, `board`, archive and update dates)
+    and the fingerprint tag itself are ignored.
+
+    >>> compute_job_fingerprint(dict(name="Dev", reference="REF1")) == compute_job_fingerprint(dict(reference="REF1", name="Dev", key="abc"))
+    True
+
+    Args:
+        job (Dict[str, Any]): job
+
+    Returns:
+        str: fingerprint in hexadecimal
+    """
+    content = {
+        field_name: field_value
+        for field_name, field_value in job.items()
+        if field_name not in FINGERPRINT_IGNORED_FIELDS
+    }
+    tags = content.get("tags")
+    if tags is not None:
+        content["tags"] = [
+            tag for tag in tags if tag.get("name") != FINGERPRINT_TAG_NAME
+        ]
+    canonical_json = json.dumps(
+        content, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str
+    )
+    return hashlib.sha256(canonical_json.encode("utf-8")).hexdigest()
+
+
+def get_job_fingerprint(job: Dict[str, Any]) -> Optional[str]:
+    """
+    Get the fingerprint stored in the tags of a job
+
+    Args:
+        job (Dict[str, Any]): job
+
+    Returns:
+        Optional[str]: fingerprint or `None` if the job has no fingerprint tag
+    """
+    tag = find_element_in_list(job.get("tags") or [], name=FINGERPRINT_TAG_NAME)
+    if tag is None:
+        return None
+    return tag.get("value")
+
+
 def generate_workflow_response(status_code=201, **kwargs) -> Dict[str, Any]:
     """
     Generate CATCH workflow response
@@ -0,0 +1,82 @@
+from typing import Any, Iterator, List, Optional, IO
+import pickle
+import tempfile
+
+from .logger import get_logger
+
+logger = get_logger()
+
+
+class SpooledStream:
+    """
+    Buffer of stream elements that spills to disk above a memory threshold
+
+    The first `max_items_in_memory` elements are kept in memory.
+    The next ones are pickled in a temporary file which is deleted on `close`.
+    Iterating over the buffer returns the elements in their order of insertion.
+
+    >>> with SpooledStream(max_items_in_memory=2) as spool:
+    ...     for element in ["a", "b", "c"]:
+    ...         spool.append(element)
+    ...     list(spool)
+    ['a', 'b', 'c']
+    """
+
+    def __init__(self, max_items_in_memory: int = 10000):
+        """
+        Spooled stream
+
+        Args:
+            max_items_in_memory (int, optional): Number of elements kept in memory before spilling to disk. Defaults to 10000.
+        """
+        if max_items_in_memory < 0:
+            raise ValueError("`max_items_in_memory` must be positive")
+        self.max_items_in_memory = max_items_in_memory
+        self._memory_items: List[Any] = []
+        self._file: Optional[IO[bytes]] = None
+        self._file_item_count = 0
+
+    def append(self, item: Any) -> None:
+        """
+        Add an element at the end of the buffer
+
+        Args:
+            item (Any): element to add. It must be picklable if the buffer spills to disk.
+        """
+        if len(self._memory_items) < self.max_items_in_memory:
+            self._memory_items.append(item)
+            return
+
+        if self._file is None:
+            logger.info(
+                f"More than {self.max_items_in_memory} elements in the stream, spilling to disk"
+            )
+            self._file = tempfile.TemporaryFile()
+        pickle.dump(item, self._file, protocol=pickle.HIGHEST_PROTOCOL)
+        self._file_item_count += 1
+
+    def __len__(self) -> int:
+        return len(self._memory_items) + self._file_item_count
+
+    def __iter__(self) -> Iterator[Any]:
+        yield from self._memory_items
+        if self._file is not None:
+            self._file.seek(0)
+            for _ in range(self._file_item_count):
+                yield pickle.load(self._file)
+
+    def close(self) -> None:
+        """
+        Release the memory and delete the temporary file
+        """
+        self._memory_items = []
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        self._file_item_count = 0
+
+    def __enter__(self) -> "SpooledStream":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
@@ -2,6 +2,8 @@ import pytest
 
 from hrflow_connectors import XSmartTokenAuth
 from hrflow_connectors import SmartRecruiters
+from hrflow_connectors.connectors.smartrecruiters.actions import PullJobsAction
+from hrflow_connectors.core.filter import FilterSpec
 
 
 @pytest.fixture
@@ -19,3 +21,28 @@ def test_PullJobsAction(logger, auth, hrflow_client):
         archive_deleted_jobs_from_stream=False,
         posting_status="PUBLIC",
     )
+
+
+def test_PullJobsAction_push_down_filters(hrflow_client):
+    action = PullJobsAction(
+        auth=XSmartTokenAuth(value="token"),
+        hrflow_client=hrflow_client,
+        board_key="abc",
+        posting_status="INTERNAL",
+        filters=[
+            FilterSpec(field="status", value="SOURCING"),
+            FilterSpec(field="postingStatus", value="PUBLIC"),
+            FilterSpec(field="updatedOn", operator="gte", value="2022-01-01T00:00:00"),
+            FilterSpec(field="department.id", value="123"),
+        ],
+    )
+    remaining_filters = action.get_remaining_filters()
+
+    assert action.job_status == "SOURCING"
+    assert action.updated_after == "2022-01-01T00:00:00"
+    # `posting_status` is already given : the filter is evaluated on the pulled jobs
+    assert action.posting_status == "INTERNAL"
+    assert [filter_spec.field for filter_spec in remaining_filters] == [
+        "postingStatus",
+        "department.id",
+    ]
@@ -1,7 +1,9 @@
 import pytest
+import responses
 
 from hrflow_connectors import AuthorizationAuth
 from hrflow_connectors import Teamtailor
+from hrflow_connectors.connectors.teamtailor.actions import PullJobsAction
 
 
 @pytest.fixture
@@ -15,4 +17,86 @@ def test_PullJobsAction(logger, auth, hrflow_client):
         hrflow_client=hrflow_client("dev-demo"),
         board_key="3fbfb874dc01a22e29abe639193c2cc319074712",
         hydrate_with_parsing=True,
-    )
\ No newline at end of file
+    )
+
+
+def get_teamtailor_job(job_id, location_id):
+    location = None if location_id is None else dict(type="locations", id=location_id)
+    return {
+        "id": job_id,
+        "type": "jobs",
+        "links": {"careersite-job-url": f"https://careers.test/jobs/{job_id}"},
+        "attributes": {
+            "title": f"Job {job_id}",
+            "pitch": None,
+            "body": "<p>Description</p>",
+            "created-at": "2022-01-01T00:00:00.000+01:00",
+            "updated-at": "2022-01-02T00:00:00.000+01:00",
+            "status": "open",
+            "tags": [],
+            "remote-status": "none",
+            "currency": None,
+            "min-salary": None,
+            "max-salary": None,
+            "internal": False,
+        },
+        "relationships": {"location": {"data": location}},
+    }
+
+
+@responses.activate
+def test_PullJobsAction_side_loads_locations_on_all_pages(hrflow_client):
+    jobs_url = "https://api.teamtailor.com/v1/jobs"
+    next_page_url = f"{jobs_url}?include=location&page%5Bnumber%5D=2&page%5Bsize%5D=30"
+    responses.add(
+        responses.GET,
+        jobs_url,
+        json=dict(
+            data=[get_teamtailor_job("1", "10")],
+            included=[
+                {
+                    "id": "10",
+                    "type": "locations",
+                    "attributes": {
+                        "address": "1 rue de Rivoli, Paris",
+                        "city": "Paris",
+                        "country": "France",
+                        "headquarters": True,
+                        "lat": "48.85",
+                        "long": "2.35",
+                        "zip": "75001",
+                        "name": "Paris office",
+                    },
+                }
+            ],
+            links=dict(next=next_page_url),
+        ),
+        match=[
+            responses.matchers.query_param_matcher({"include": "location", "page[size]": "30"})
+        ],
+    )
+    responses.add(
+        responses.GET,
+        jobs_url,
+        json=dict(data=[get_teamtailor_job("2", None)], links=dict()),
+        match=[
+            responses.matchers.query_param_matcher(
+                {"include": "location", "page[number]": "2", "page[size]": "30"}
+            )
+        ],
+    )
+
+    action = PullJobsAction(
+        auth=AuthorizationAuth(value="token"),
+        hrflow_client=hrflow_client(),
+        board_key="abc",
+    )
+    jobs = [action.format(job) for job in action.pull()]
+
+    # One request per page : the formatting does not request the locations
+    assert len(responses.calls) == 2
+    assert [job.reference for job in jobs] == ["1", "2"]
+    assert jobs[0].location.text == "1 rue de Rivoli, Paris"
+    assert jobs[0].location.lat == 48.85
+    assert jobs[0].location.lng == 2.35
+    assert jobs[1].location.text is None
@@ -1,7 +1,11 @@
+import io
+
+import pytest
 import responses
 
 from hrflow_connectors import XML
 from hrflow_connectors.connectors.xml.actions import PullJobsAction
+from hrflow_connectors.core.error import PullError
 from hrflow_connectors.utils.datetime_converter import from_str_to_datetime
 from hrflow_connectors.utils.schemas import HrflowJob
 
@@ -197,3 +201,118 @@ def test_PullJobsAction_pull_generic_xml_stream(logger, hrflow_client):
     assert job_node_3.attrib["data-id"] == "3"
     assert name_3.text == "Painter"
     assert reference_3.text == "pt56"
+
+
+GENERIC_XML_STREAM = """<?xml version="1.0" encoding="UTF-8"?>
+<all>
+    <meta>
+        <update>2021-11-09T15:00:00.999651</update>
+    </meta>
+    <board>
+        <jobs>
+            <job data-id="1">
+                <name>Data scientist</name>
+                <reference>ds42</reference>
+            </job>
+            <job data-id="2">
+                <name>Software Engineer</name>
+                <reference>se18</reference>
+            </job>
+        </jobs>
+        <jobs>
+            <job data-id="3">
+                <name>Painter</name>
+                <reference>pt56</reference>
+            </job>
+        </jobs>
+    </board>
+</all>"""
+
+
+@responses.activate
+@pytest.mark.parametrize("job_list_xpath", ["board/jobs", "./board/jobs", "*/jobs"])
+def test_PullJobsAction_pull_streamed_xml(hrflow_client, job_list_xpath):
+    xml_stream_url = "https://test.test/job/xml_stream"
+    responses.add(responses.GET, xml_stream_url, status=200, body=GENERIC_XML_STREAM)
+
+    action = PullJobsAction(
+        xml_stream_url=xml_stream_url,
+        job_list_xpath=job_list_xpath,
+        hrflow_client=hrflow_client,
+        board_key="abc",
+        stream=True,
+    )
+    job_node_iter = action.pull()
+    job_node_1 = next(job_node_iter)
+    job_node_2 = next(job_node_iter)
+
+    # As with `find`, only the jobs of the first job list are pulled
+    assert list(job_node_iter) == []
+    assert job_node_1.attrib["data-id"] == "1"
+    assert job_node_1.findtext("name") == "Data scientist"
+    assert job_node_2.attrib["data-id"] == "2"
+    assert job_node_2.findtext("reference") == "se18"
+
+
+def test_PullJobsAction_iter_jobs_yields_complete_jobs(hrflow_client):
+    action = PullJobsAction(
+        xml_stream_url="https://test.test/job/xml_stream",
+        job_list_xpath="board/jobs",
+        hrflow_client=hrflow_client,
+        board_key="abc",
+        stream=True,
+    )
+    job_node_iter = action.iter_jobs(io.BytesIO(GENERIC_XML_STREAM.encode("utf-8")))
+    first_job_node = next(job_node_iter)
+    second_job_node = next(job_node_iter)
+
+    # The jobs already pulled stay complete while the next ones are parsed
+    assert list(job_node_iter) == []
+    assert first_job_node.findtext("name") == "Data scientist"
+    assert second_job_node.findtext("name") == "Software Engineer"
+
+
+def test_PullJobsAction_root_job_list(hrflow_client):
+    action = PullJobsAction(
+        xml_stream_url="https://test.test/job/xml_stream",
+        job_list_xpath=".",
+        hrflow_client=hrflow_client,
+        board_key="abc",
+        stream=True,
+    )
+    xml_stream = b"<jobs><job>1</job><job>2</job></jobs>"
+    job_node_list = list(action.iter_jobs(io.BytesIO(xml_stream)))
+    assert [job_node.text for job_node in job_node_list] == ["1", "2"]
+
+
+def test_PullJobsAction_streamed_xpath_not_supported(hrflow_client):
+    action = PullJobsAction(
+        xml_stream_url="https://test.test/job/xml_stream",
+        job_list_xpath="board/jobs[@lang='fr']",
+        hrflow_client=hrflow_client,
+        board_key="abc",
+        stream=True,
+    )
+    with pytest.raises(ValueError):
+        action.pull()
+
+
+@responses.activate
+def test_PullJobsAction_streamed_job_list_not_found(hrflow_client):
+    xml_stream_url = "https://test.test/job/xml_stream"
+    responses.add(responses.GET, xml_stream_url, status=200, body=GENERIC_XML_STREAM)
+
+    action = PullJobsAction(
+        xml_stream_url=xml_stream_url,
+        job_list_xpath="board/offers",
+        hrflow_client=hrflow_client,
+        board_key="abc",
+        stream=True,
+    )
+    # An empty stream would archive all the jobs of the Board
+    with pytest.raises(PullError, match="Failed to pull"):
+        list(action.pull())
+
+    # An empty job list is not an error
+    xml_stream = b"<all><board><offers /></board></all>"
+    assert list(action.iter_jobs(io.BytesIO(xml_stream))) == []
@@ -3,6 +3,7 @@ from hrflow_connectors.core.action import (
     PullBaseAction,
     PushBaseAction,
     PullJobsBaseAction,
+    ReferenceDiff,
     PushProfileBaseAction,
     PushJobBaseAction,
     CatchProfileBaseAction,
@@ -14,9 +15,15 @@ from hrflow_connectors.utils.schemas import (
     HrflowBoard,
 )
 from hrflow_connectors.core.error import HrflowError
+from hrflow_connectors.core.filter import FilterSpec
+import hrflow_connectors.core.action as action_module
+from hrflow_connectors.core.state import InMemorySyncStateStore
+import asyncio
 import pytest
 import requests
 import responses
+import threading
+import time
 from hrflow import Hrflow
 
 ##################
@@ -159,6 +166,121 @@ def test_BaseAction_overwritten_format_with_extern_format_function(hrflow_client
     assert transformed_job == dict(c="aaa", d="aaabbb")
 
 
+def test_BaseAction_apply_batch_logics(hrflow_client, generated_data_list):
+    received_batch_sizes = []
+
+    def keep_element1_with_value1(batch):
+        received_batch_sizes.append(len(batch))
+        return [element.get("element1") == "value1" for element in batch]
+
+    def keep_element2_with_value2(batch):
+        return [element.get("element2") == "value2" for element in batch]
+
+    action = BaseAction(
+        hrflow_client=hrflow_client(),
+        batch_logics=["keep_element1_with_value1", "keep_element2_with_value2"],
+        logic_batch_size=3,
+        global_scope=globals(),
+        local_scope=locals(),
+    )
+    filtered_list = list(action.apply_logics(generated_data_list))
+
+    assert filtered_list == [dict(element1="value1", element2="value2")]
+    assert received_batch_sizes == [3, 1]
+
+
+def test_BaseAction_apply_batch_logics_after_logics(hrflow_client, generated_data_list):
+    def filter_element1_with_value1(element):
+        if element.get("element1") == "value1":
+            return element
+        return None
+
+    def keep_all(batch):
+        assert all(element.get("element1") == "value1" for element in batch)
+        return [True] * len(batch)
+
+    action = BaseAction(
+        hrflow_client=hrflow_client(),
+        logics=["filter_element1_with_value1"],
+        batch_logics=["keep_all"],
+        function_registry=dict(
+            filter_element1_with_value1=filter_element1_with_value1, keep_all=keep_all
+        ),
+    )
+    filtered_list = list(action.apply_logics(generated_data_list))
+
+    assert len(filtered_list) == 2
+
+
+def test_BaseAction_apply_batch_logics_with_wrong_mask(
+    hrflow_client, generated_data_list
+):
+    def wrong_mask(batch):
+        return [True]
+
+    action = BaseAction(
+        hrflow_client=hrflow_client(),
+        batch_logics=["wrong_mask"],
+        function_registry=dict(wrong_mask=wrong_mask),
+    )
+    with pytest.raises(ValueError):
+        list(action.apply_logics(generated_data_list))
+
+
+def test_BaseAction_function_registry(hrflow_client, generated_data_list):
+    def filter_element1_with_value1(element):
+        if element.get("element1") == "value1":
+            return element
+        return None
+
+    def extern_format(data):
+        return data["element2"]
+
+    action = BaseAction(
+        hrflow_client=hrflow_client(),
+        logics=["filter_element1_with_value1"],
+        format_function_name="extern_format",
+        function_registry=dict(
+            filter_element1_with_value1=filter_element1_with_value1,
+            extern_format=extern_format,
+        ),
+    )
+    output_data = action.process(generated_data_list)
+    assert list(output_data) == ["value2", "value1"]
+
+
+def test_BaseAction_functions_are_resolved_once(
+    hrflow_client, generated_data_list, monkeypatch
+):
+    def filter_element1_with_value1(element):
+        if element.get("element1") == "value1":
+            return element
+        return None
+
+    def extern_format(data):
+        return data["element2"]
+
+    evaluated_names = []
+
+    def counting_eval(name, global_scope, local_scope):
+        evaluated_names.append(name)
+        return eval(name, global_scope, local_scope)
+
+    monkeypatch.setattr(action_module, "eval", counting_eval, raising=False)
+    action = BaseAction(
+        hrflow_client=hrflow_client(),
+        logics=["filter_element1_with_value1"],
+        format_function_name="extern_format",
+        global_scope=globals(),
+        local_scope=locals(),
+    )
+    assert list(action.process(generated_data_list)) == ["value2", "value1"]
+    assert action.format_switcher(dict(element2="value3")) == "value3"
+    assert list(action.process(generated_data_list)) == ["value2", "value1"]
+
+    assert evaluated_names == ["filter_element1_with_value1", "extern_format"]
+
+
 @responses.activate
 def test_BaseAction_connect_and_execute(hrflow_client, generated_data_list):
     # Build a connector from `generated_data_list` to `http://test.test/push`
@@ -233,6 +355,63 @@ def test_PullBaseAction_execute(hrflow_client):
     action.execute()
 
 
+def test_PullBaseAction_async_execute(hrflow_client):
+    class MyPullAction(PullBaseAction):
+        def pull(self):
+            return ["pullformat", "pulllogic"]
+
+        def format(self, data):
+            return data.replace("pull", "")
+
+        def push(self, data):
+            pushed_data.extend(data)
+
+    def my_logic(data):
+        if "format" in data:
+            return None
+        else:
+            return data
+
+    pushed_data = []
+    action = MyPullAction(
+        hrflow_client=hrflow_client,
+        logics=["my_logic"],
+        local_scope=locals(),
+        global_scope=globals(),
+    )
+    loop = asyncio.new_event_loop()
+    try:
+        loop.run_until_complete(action.async_execute())
+    finally:
+        loop.close()
+
+    assert pushed_data == ["logic"]
+
+
+def test_PullBaseAction_async_execute_with_async_hooks(hrflow_client):
+    class MyAsyncPullAction(PullBaseAction):
+        async def async_pull(self):
+            await asyncio.sleep(0)
+            return ["pullformat", "pulllogic"]
+
+        def format(self, data):
+            return data.replace("pull", "")
+
+        async def async_push(self, data):
+            await asyncio.sleep(0)
+            pushed_data.extend(data)
+
+    pushed_data = []
+    action = MyAsyncPullAction(hrflow_client=hrflow_client)
+    loop = asyncio.new_event_loop()
+    try:
+        loop.run_until_complete(action.async_execute())
+    finally:
+        loop.close()
+
+    assert pushed_data == ["format", "logic"]
+
+
 ######################
 ### PushBaseAction ###
 ######################
@@ -420,6 +599,38 @@ def test_PullJobsBaseAction_get_all_references_from_board_and_less_job_returned(
     assert all_reference_list == reference_expected
 
 
+@responses.activate
+def test_PullJobsBaseAction_get_all_job_pages_from_board_with_concurrency(
+    hrflow_client, generated_jobs
+):
+    # Pages 1 to 4, the 4th page is empty : the listing stops before it
+    for page in range(1, 6):
+        job_list = generated_jobs(page=page, jobs=50) if page < 4 else []
+        expected_params = dict(
+            board_keys='["abc"]', limit="50", page=str(page), sort_by="created_at"
+        )
+        responses.add(
+            responses.GET,
+            "https://api.hrflow.ai/v1/jobs/searching",
+            status=200,
+            match=[responses.matchers.query_param_matcher(expected_params)],
+            json=generate_hrflow_search_response(job_list, max_page=5),
+        )
+
+    action = PullJobsBaseAction(
+        hrflow_client=hrflow_client(),
+        board_key="abc",
+        hydrate_with_parsing=False,
+        board_page_size=50,
+        board_page_concurrency=3,
+    )
+    job_pages = list(action.get_all_job_pages_from_board())
+
+    assert len(job_pages) == 3
+    for page, job_list in enumerate(job_pages, start=1):
+        assert job_list == generated_jobs(page=page, jobs=50)
+
+
 @pytest.fixture
 def generated_parsing_text_response():
     text = "I love Python\ni speak english"
@@ -464,6 +675,34 @@ def test_PullJobsBaseAction_hydrate_job_with_parsing(
     assert hydrated_job.languages[0] == dict(name="english", value=None)
 
 
+@responses.activate
+def test_PullJobsBaseAction_hydrate_job_with_parsing_cache(
+    hrflow_client, generated_parsing_text_response
+):
+    # Catch request
+    responses.add(
+        responses.POST,
+        "https://api.hrflow.ai/v1/document/parsing",
+        status=200,
+        json=generated_parsing_text_response,
+    )
+
+    # Build Action
+    action = PullJobsBaseAction(hrflow_client=hrflow_client(), board_key="abc")
+    section = dict(name="s", title=None, description="i speak english")
+    job_1 = HrflowJob(reference="REF1", summary="I love Python", sections=[section])
+    job_2 = HrflowJob(reference="REF2", summary="I love Python", sections=[section])
+
+    hydrated_job_1 = action.hydrate_job_with_parsing(job_1)
+    hydrated_job_2 = action.hydrate_job_with_parsing(job_2)
+
+    # The same text is parsed once
+    assert len(responses.calls) == 1
+    assert hydrated_job_1.skills == hydrated_job_2.skills
+    assert hydrated_job_2.reference == "REF2"
+    assert hydrated_job_2.languages[0] == dict(name="english", value=None)
+
+
 @responses.activate
 def test_PullJobsBaseAction_hydrate_job_with_parsing_failure(
     hrflow_client, generated_parsing_text_response
@@ -827,6 +1066,137 @@ def test_PullJobsBaseAction_check_reference_in_board_for_archived_job_in_board_w
     assert not check_response
 
 
+@responses.activate
+def test_PullJobsBaseAction_check_reference_in_board_with_board_snapshot(
+    hrflow_client,
+):
+    # Board listing
+    board_jobs = [
+        dict(key="k1", reference="REF1", archived_at=None),
+        dict(key="k2", reference="REF2", archived_at="2021-12-25T00:00:00"),
+    ]
+    expected_params = dict(
+        board_keys='["abc"]', limit="30", page="1", sort_by="created_at"
+    )
+    responses.add(
+        responses.GET,
+        "https://api.hrflow.ai/v1/jobs/searching",
+        status=200,
+        match=[responses.matchers.query_param_matcher(expected_params)],
+        json=generate_hrflow_search_response(board_jobs, max_page=1),
+    )
+
+    # Un-archive and edit the archived job
+    expected_body = dict(board_key="abc", reference="REF2", is_archive=False)
+    responses.add(
+        responses.PATCH,
+        "https://api.hrflow.ai/v1/job/indexing/archive",
+        status=200,
+        match=[responses.matchers.json_params_matcher(expected_body)],
+        json=dict(code=200, message="Archived"),
+    )
+    expected_body = HrflowJob(key="k2", reference="REF2").dict()
+    expected_body["board_key"] = "abc"
+    responses.add(
+        responses.PUT,
+        "https://api.hrflow.ai/v1/job/indexing",
+        status=200,
+        match=[responses.matchers.json_params_matcher(expected_body)],
+        json=dict(code=200, message="Edited"),
+    )
+
+    # Reference missing from the snapshot
+    expected_params = dict(board_key="abc", reference="REF3")
+    responses.add(
+        responses.GET,
+        "https://api.hrflow.ai/v1/job/indexing",
+        status=400,
+        match=[responses.matchers.query_param_matcher(expected_params)],
+        json=dict(code=400, message="Unable to find object: job"),
+    )
+
+    action = PullJobsBaseAction(
+        hrflow_client=hrflow_client(), board_key="abc", use_board_snapshot=True
+    )
+    assert not action.check_reference_in_board(HrflowJob(reference="REF1"))
+    assert not action.check_reference_in_board(HrflowJob(reference="REF2"))
+    assert action.check_reference_in_board(HrflowJob(reference="REF3"))
+    assert sorted(action.get_all_references_from_board()) == ["REF1", "REF2"]
+
+    # Listing once, archive, edit and a single GET for the unknown reference
+    requested_urls = [call.request.url.split("?")[0] for call in responses.calls]
+    assert requested_urls == [
+        "https://api.hrflow.ai/v1/jobs/searching",
+        "https://api.hrflow.ai/v1/job/indexing/archive",
+        "https://api.hrflow.ai/v1/job/indexing",
+        "https://api.hrflow.ai/v1/job/indexing",
+    ]
+
+
+@responses.activate
+def test_PullJobsBaseAction_check_reference_in_board_with_job_changes(
+    hrflow_client,
+):
+    action = PullJobsBaseAction(
+        hrflow_client=hrflow_client(),
+        board_key="abc",
+        use_board_snapshot=True,
+        detect_job_changes=True,
+    )
+    unchanged_job = action.add_fingerprint_tag(HrflowJob(reference="REF1", name="a"))
+    changed_job = action.add_fingerprint_tag(HrflowJob(reference="REF2", name="b"))
+    archived_job = action.add_fingerprint_tag(HrflowJob(reference="REF3", name="c"))
+
+    # Board listing
+    board_jobs = [
+        dict(key="k1", **unchanged_job.dict(exclude={"key"})),
+        dict(key="k2", **HrflowJob(reference="REF2", name="old").dict(exclude={"key"})),
+        dict(
+            key="k3",
+            archived_at="2021-12-25T00:00:00",
+            **archived_job.dict(exclude={"key"}),
+        ),
+    ]
+    board_jobs[1]["tags"] = [dict(name="hrflow_connectors_fingerprint", value="old")]
+    responses.add(
+        responses.GET,
+        "https://api.hrflow.ai/v1/jobs/searching",
+        status=200,
+        json=generate_hrflow_search_response(board_jobs, max_page=1),
+    )
+
+    # Edit the changed job
+    expected_body = dict(board_key="abc", **changed_job.dict())
+    expected_body["key"] = "k2"
+    responses.add(
+        responses.PUT,
+        "https://api.hrflow.ai/v1/job/indexing",
+        status=200,
+        match=[responses.matchers.json_params_matcher(expected_body)],
+        json=dict(code=200, message="Edited"),
+    )
+
+    # Un-archive the archived job without editing it
+    expected_body = dict(board_key="abc", reference="REF3", is_archive=False)
+    responses.add(
+        responses.PATCH,
+        "https://api.hrflow.ai/v1/job/indexing/archive",
+        status=200,
+        match=[responses.matchers.json_params_matcher(expected_body)],
+        json=dict(code=200, message="Archived"),
+    )
+
+    assert not action.check_reference_in_board(unchanged_job)
+    assert len(responses.calls) == 1
+
+    assert not action.check_reference_in_board(changed_job)
+    assert responses.calls[-1].request.method == "PUT"
+
+    assert not action.check_reference_in_board(archived_job)
+    assert responses.calls[-1].request.method == "PATCH"
+    assert len(responses.calls) == 3
+
+
 def test_PullJobsBaseAction_get_all_references_from_stream(hrflow_client):
     jobs_in_stream = [HrflowJob(reference="REF1"), HrflowJob(reference="REF2")]
     references_in_stream = ["REF1", "REF2"]
@@ -845,6 +1215,15 @@ def test_PullJobsBaseAction_get_all_references_from_stream(hrflow_client):
     references_got = action.get_all_references_from_stream()
     assert list(references_got) == references_in_stream
 
+    # The references are filtered as the pushed jobs
+    action = TestPullJobsAction(
+        hrflow_client=hrflow_client(),
+        board_key="abc",
+        filters=[FilterSpec(field="reference", operator="ne", value="REF2")],
+    )
+    references_got = action.get_all_references_from_stream()
+    assert list(references_got) == ["REF1"]
+
 
 @responses.activate
 def test_PullJobsBaseAction_check_deletion_references_from_stream(hrflow_client):
@@ -872,8 +1251,252 @@ def test_PullJobsBaseAction_check_deletion_references_from_stream(hrflow_client)
     action = TestPullJobsAction(
         hrflow_client=hrflow_client(), board_key="abc", hydrate_with_parsing=False
     )
+    reference_diff = action.check_deletion_references_from_stream()
+    assert reference_diff.to_archive == ["REF4"]
+    assert reference_diff.to_add == ["REF2"]
+    assert reference_diff.to_update == ["REF1"]
+
+    # The difference is computed only once
+    assert action.get_reference_diff() is reference_diff
+
+
+@responses.activate
+def test_PullJobsBaseAction_check_deletion_references_from_stream_with_board_snapshot(
+    hrflow_client,
+):
+    class TestPullJobsAction(PullJobsBaseAction):
+        def get_all_references_from_stream(self):
+            return ["REF1", "REF2", "REF3"]
+
+    # Board listing
+    board_jobs = [
+        dict(key="k1", reference="REF1", archived_at=None),
+        dict(key="k2", reference="REF2", archived_at="2021-12-25T00:00:00"),
+        dict(key="k4", reference="REF4", archived_at=None),
+    ]
+    expected_params = dict(
+        board_keys='["abc"]', limit="30", page="1", sort_by="created_at"
+    )
+    responses.add(
+        responses.GET,
+        "https://api.hrflow.ai/v1/jobs/searching",
+        status=200,
+        match=[responses.matchers.query_param_matcher(expected_params)],
+        json=generate_hrflow_search_response(board_jobs, max_page=1),
+    )
+
+    # Archive the deleted job
+    expected_body = dict(board_key="abc", reference="REF4", is_archive=True)
+    responses.add(
+        responses.PATCH,
+        "https://api.hrflow.ai/v1/job/indexing/archive",
+        status=200,
+        match=[responses.matchers.json_params_matcher(expected_body)],
+        json=dict(code=200, message="Archived"),
+    )
+
+    # Un-archive the job back in the stream, after a temporary failure
+    expected_body = dict(board_key="abc", reference="REF2", is_archive=False)
+    responses.add(
+        responses.PATCH,
+        "https://api.hrflow.ai/v1/job/indexing/archive",
+        status=503,
+        match=[responses.matchers.json_params_matcher(expected_body)],
+        json=dict(code=503, message="Unavailable"),
+    )
+    responses.add(
+        responses.PATCH,
+        "https://api.hrflow.ai/v1/job/indexing/archive",
+        status=200,
+        match=[responses.matchers.json_params_matcher(expected_body)],
+        json=dict(code=200, message="Unarchived"),
+    )
+
+    # Edit the un-archived job
+    expected_body = HrflowJob(key="k2", reference="REF2").dict()
+    expected_body["board_key"] = "abc"
+    responses.add(
+        responses.PUT,
+        "https://api.hrflow.ai/v1/job/indexing",
+        status=200,
+        match=[responses.matchers.json_params_matcher(expected_body)],
+        json=dict(code=200, message="Edited"),
+    )
+
+    action = TestPullJobsAction(
+        hrflow_client=hrflow_client(),
+        board_key="abc",
+        use_board_snapshot=True,
+        archive_concurrency=2,
+        archive_retry_delay=0,
+    )
+    action.check_deletion_references_from_stream()
+
+    archive_summary = action.get_archive_summary()
+    assert archive_summary.archived == ["REF4"]
+    assert archive_summary.unarchived == ["REF2"]
+    assert archive_summary.failed == []
+
+    # The job is not un-archived twice
+    assert not action.check_reference_in_board(HrflowJob(reference="REF2"))
+    requested_methods = [call.request.method for call in responses.calls]
+    assert requested_methods == ["GET", "PATCH", "PATCH", "PATCH", "PUT"]
+
+
+@responses.activate
+def test_PullJobsBaseAction_check_deletion_references_from_stream_unarchives_without_board_snapshot(
+    hrflow_client,
+):
+    class TestPullJobsAction(PullJobsBaseAction):
+        def get_all_references_from_stream(self):
+            return ["REF1", "REF2"]
+
+    # Board listing
+    board_jobs = [
+        dict(key="k1", reference="REF1", archived_at=None),
+        dict(key="k2", reference="REF2", archived_at="2021-12-25T00:00:00"),
+        dict(key="k4", reference="REF4", archived_at=None),
+    ]
+    expected_params = dict(
+        board_keys='["abc"]', limit="30", page="1", sort_by="created_at"
+    )
+    responses.add(
+        responses.GET,
+        "https://api.hrflow.ai/v1/jobs/searching",
+        status=200,
+        match=[responses.matchers.query_param_matcher(expected_params)],
+        json=generate_hrflow_search_response(board_jobs, max_page=1),
+    )
+
+    # Archive the deleted job
+    expected_body = dict(board_key="abc", reference="REF4", is_archive=True)
+    responses.add(
+        responses.PATCH,
+        "https://api.hrflow.ai/v1/job/indexing/archive",
+        status=200,
+        match=[responses.matchers.json_params_matcher(expected_body)],
+        json=dict(code=200, message="Archived"),
+    )
+
+    # Un-archive the job back in the stream
+    expected_body = dict(board_key="abc", reference="REF2", is_archive=False)
+    responses.add(
+        responses.PATCH,
+        "https://api.hrflow.ai/v1/job/indexing/archive",
+        status=200,
+        match=[responses.matchers.json_params_matcher(expected_body)],
+        json=dict(code=200, message="Unarchived"),
+    )
+
+    # The job is still requested to Hrflow without the snapshot
+    expected_params = dict(board_key="abc", reference="REF2")
+    responses.add(
+        responses.GET,
+        "https://api.hrflow.ai/v1/job/indexing",
+        status=200,
+        match=[responses.matchers.query_param_matcher(expected_params)],
+        json=dict(
+            code=200,
+            message="Job details",
+            data=dict(key="k2", archived_at="2021-12-25T00:00:00"),
+        ),
+    )
+
+    # Edit the un-archived job
+    expected_body = HrflowJob(key="k2", reference="REF2").dict()
+    expected_body["board_key"] = "abc"
+    responses.add(
+        responses.PUT,
+        "https://api.hrflow.ai/v1/job/indexing",
+        status=200,
+        match=[responses.matchers.json_params_matcher(expected_body)],
+        json=dict(code=200, message="Edited"),
+    )
+
+    action = TestPullJobsAction(
+        hrflow_client=hrflow_client(), board_key="abc", archive_retry_delay=0
+    )
     action.check_deletion_references_from_stream()
 
+    archive_summary = action.get_archive_summary()
+    assert archive_summary.archived == ["REF4"]
+    assert archive_summary.unarchived == ["REF2"]
+    assert archive_summary.failed == []
+
+    # The job is not un-archived twice
+    assert not action.check_reference_in_board(HrflowJob(reference="REF2"))
+    requested_methods = [call.request.method for call in responses.calls]
+    assert requested_methods == ["GET", "PATCH", "PATCH", "GET", "PUT"]
+
+
+@responses.activate
+def test_PullJobsBaseAction_run_archive_stage_with_failures(hrflow_client):
+    for reference in ["REF1", "REF2", "REF3"]:
+        expected_body = dict(board_key="abc", reference=reference, is_archive=True)
+        responses.add(
+            responses.PATCH,
+            "https://api.hrflow.ai/v1/job/indexing/archive",
+            status=200,
+            match=[responses.matchers.json_params_matcher(expected_body)],
+            json=dict(code=200, message="Archived"),
+        )
+
+    # A client error is not retried
+    expected_body = dict(board_key="abc", reference="REF4", is_archive=True)
+    responses.add(
+        responses.PATCH,
+        "https://api.hrflow.ai/v1/job/indexing/archive",
+        status=400,
+        match=[responses.matchers.json_params_matcher(expected_body)],
+        json=dict(code=400, message="Bad request"),
+    )
+
+    # A server error is retried until the maximum number of attempts
+    expected_body = dict(board_key="abc", reference="REF5", is_archive=False)
+    responses.add(
+        responses.PATCH,
+        "https://api.hrflow.ai/v1/job/indexing/archive",
+        status=500,
+        match=[responses.matchers.json_params_matcher(expected_body)],
+        json=dict(code=500, message="Server error"),
+    )
+
+    action = PullJobsBaseAction(
+        hrflow_client=hrflow_client(),
+        board_key="abc",
+        archive_concurrency=4,
+        archive_max_attempts=2,
+        archive_retry_delay=0,
+    )
+    archive_summary = action.run_archive_stage(
+        references_to_archive=["REF1", "REF2", "REF3", "REF4"],
+        references_to_unarchive=["REF5"],
+    )
+
+    assert archive_summary.archived == ["REF1", "REF2", "REF3"]
+    assert archive_summary.unarchived == []
+    assert archive_summary.failed == ["REF4", "REF5"]
+    assert len(responses.calls) == 6
+
+
+def test_ReferenceDiff_from_references():
+    board_references = ["REF1", "REF2", "REF3", "REF2"]
+    stream_references = iter(["REF3", "REF5", "REF1", "REF5", "REF6"])
+
+    reference_diff = ReferenceDiff.from_references(
+        board_references=board_references, stream_references=stream_references
+    )
+    assert reference_diff.to_archive == ["REF2"]
+    assert reference_diff.to_add == ["REF5", "REF6"]
+    assert reference_diff.to_update == ["REF3", "REF1"]
+
+
+def test_ReferenceDiff_from_references_with_empty_board():
+    reference_diff = ReferenceDiff.from_references([], ["REF1"])
+    assert reference_diff.to_archive == []
+    assert reference_diff.to_add == ["REF1"]
+    assert reference_diff.to_update == []
+
 
 def test_PullJobsBaseAction_execute_with_archiving_and_parsing(hrflow_client):
     class MyPullJobsAction(PullJobsBaseAction):
@@ -914,6 +1537,42 @@ def test_PullJobsBaseAction_execute_with_archiving_and_parsing(hrflow_client):
     action.execute()
 
 
+def test_PullJobsBaseAction_execute_with_concurrent_parsing(hrflow_client):
+    hydration_threads = set()
+
+    class MyPullJobsAction(PullJobsBaseAction):
+        def pull(self):
+            return [f"pull{i}" for i in range(20)]
+
+        def format(self, data):
+            return data.replace("pull", "")
+
+        def check_reference_in_board(self, data):
+            return data != "7"
+
+        def hydrate_job_with_parsing(self, data):
+            hydration_threads.add(threading.current_thread().name)
+            # The first jobs are the slowest to hydrate
+            time.sleep(0.001 * (20 - int(data)))
+            return data + "_after_parsing"
+
+        def push(self, data):
+            data_list = list(data)
+            expected_list = [f"{i}_after_parsing" for i in range(20) if i != 7]
+            assert data_list == expected_list
+
+    action = MyPullJobsAction(
+        hrflow_client=hrflow_client,
+        board_key="abc",
+        hydrate_with_parsing=True,
+        archive_deleted_jobs_from_stream=False,
+        hydration_concurrency=4,
+        hydration_max_in_flight=8,
+    )
+    action.execute()
+    assert threading.current_thread().name not in hydration_threads
+
+
 def test_PullJobsBaseAction_execute_with_archiving_without_parsing(hrflow_client):
     class MyPullJobsAction(PullJobsBaseAction):
         def pull(self):
@@ -993,6 +1652,218 @@ def test_PullJobsBaseAction_execute_without_archiving_and_parsing(hrflow_client)
     action.execute()
 
 
+def test_PullJobsBaseAction_async_execute(hrflow_client):
+    class MyPullJobsAction(PullJobsBaseAction):
+        def pull(self):
+            return ["pullformat", "pullcheckref"]
+
+        def format(self, data):
+            return data.replace("pull", "")
+
+        def check_reference_in_board(self, data):
+            return "checkref" != data
+
+        def push(self, data):
+            pushed_data.extend(data)
+            pushed_in_threads.append(threading.current_thread())
+
+    pushed_data = []
+    pushed_in_threads = []
+    action = MyPullJobsAction(
+        hrflow_client=hrflow_client,
+        board_key="abc",
+        hydrate_with_parsing=False,
+        archive_deleted_jobs_from_stream=False,
+    )
+    loop = asyncio.new_event_loop()
+    try:
+        loop.run_until_complete(action.async_execute())
+    finally:
+        loop.close()
+
+    assert pushed_data == ["format"]
+    # The synchronous pipeline does not run in the event loop thread
+    assert pushed_in_threads != [threading.main_thread()]
+
+
+def test_PullJobsBaseAction_async_execute_with_async_hooks(hrflow_client):
+    class MyAsyncPullJobsAction(PullJobsBaseAction):
+        async def async_pull(self):
+            await asyncio.sleep(0)
+            return [HrflowJob(reference="REF1"), HrflowJob(reference="REF2")]
+
+        def pull(self):
+            assert False
+
+        def get_all_references_from_board(self):
+            return ["REF1", "REF3"]
+
+        def set_job_archive(self, reference, is_archive):
+            archived_references.append(reference)
+            return True
+
+        def check_reference_in_board(self, job):
+            return job.reference != "REF1"
+
+        async def async_push(self, data):
+            await asyncio.sleep(0)
+            pushed_references.extend(job.reference for job in data)
+
+        def push(self, data):
+            assert False
+
+    archived_references = []
+    pushed_references = []
+    action = MyAsyncPullJobsAction(hrflow_client=hrflow_client, board_key="abc")
+    loop = asyncio.new_event_loop()
+    try:
+        loop.run_until_complete(action.async_execute())
+    finally:
+        loop.close()
+
+    assert archived_references == ["REF3"]
+    assert pushed_references == ["REF2"]
+
+
+def test_PullJobsBaseAction_execute_with_archiving_pulls_stream_once(hrflow_client):
+    pull_count = dict(value=0)
+    archived_references = []
+    pushed_references = []
+
+    class MyPullJobsAction(PullJobsBaseAction):
+        def pull(self):
+            pull_count["value"] += 1
+            return [dict(ref="REF1"), dict(ref="REF2"), dict(ref="REF3")]
+
+        def format(self, data):
+            return HrflowJob(reference=data["ref"])
+
+        def get_all_references_from_board(self):
+            return ["REF1", "REF4"]
+
+        def check_reference_in_board(self, job):
+            return True
+
+        def push(self, data):
+            pushed_references.extend(job.reference for job in data)
+
+    class MyHrflowClient:
+        class job:
+            class indexing:
+                @staticmethod
+                def archive(board_key, reference, is_archive):
+                    archived_references.append(reference)
+                    return dict(code=200)
+
+    action = MyPullJobsAction(
+        hrflow_client=MyHrflowClient(),
+        board_key="abc",
+        stream_max_items_in_memory=1,
+    )
+    action.execute()
+
+    assert pull_count["value"] == 1
+    assert archived_references == ["REF4"]
+    assert pushed_references == ["REF1", "REF2", "REF3"]
+
+
+def test_PullJobsBaseAction_execute_twice_resets_run_state(hrflow_client):
+    board = dict(references=["A", "B"])
+    stream = dict(references=["A", "C"])
+    archived_references = []
+    pushed_references = []
+
+    class MyPullJobsAction(PullJobsBaseAction):
+        def pull(self):
+            return [HrflowJob(reference=reference) for reference in stream["references"]]
+
+        def get_all_references_from_board(self):
+            return list(board["references"])
+
+        def check_reference_in_board(self, job):
+            return job.reference not in board["references"]
+
+        def push(self, data):
+            pushed_references.extend(job.reference for job in data)
+
+    class MyHrflowClient:
+        class job:
+            class indexing:
+                @staticmethod
+                def archive(board_key, reference, is_archive):
+                    archived_references.append(reference)
+                    return dict(code=200)
+
+    action = MyPullJobsAction(hrflow_client=MyHrflowClient(), board_key="abc")
+    action.execute()
+    assert archived_references == ["B"]
+    assert pushed_references == ["C"]
+    assert action.get_archive_summary().archived == ["B"]
+
+    # The Board and the stream have changed since the first run
+    board["references"] = ["A", "C"]
+    stream["references"] = ["C"]
+    action.execute()
+    assert archived_references == ["B", "A"]
+    assert pushed_references == ["C"]
+    assert action.get_archive_summary().archived == ["A"]
+
+
+def test_PullJobsBaseAction_execute_incremental(hrflow_client):
+    pulled_after = []
+    checked_deletions = []
+
+    class MyPullJobsAction(PullJobsBaseAction):
+        updated_after: str = None
+
+        def apply_incremental_cursor(self, sync_state):
+            self.updated_after = sync_state.last_run_at.isoformat()
+            return True
+
+        def pull(self):
+            pulled_after.append(self.updated_after)
+            return [HrflowJob(reference="REF1")]
+
+        def check_deletion_references_from_stream(self):
+            checked_deletions.append(True)
+
+        def check_reference_in_board(self, job):
+            return False
+
+        def push(self, data):
+            list(data)
+
+    sync_state_store = InMemorySyncStateStore()
+
+    # First run : full pull
+    action = MyPullJobsAction(
+        hrflow_client=hrflow_client,
+        board_key="abc",
+        incremental=True,
+        sync_state_store=sync_state_store,
+    )
+    action.execute()
+    assert pulled_after == [None]
+    assert checked_deletions == [True]
+
+    scope = action.get_sync_scope()
+    assert scope.endswith("MyPullJobsAction:abc")
+    last_run_at = sync_state_store.load(scope).last_run_at
+    assert last_run_at is not None
+
+    # Second run : incremental pull without archiving
+    action = MyPullJobsAction(
+        hrflow_client=hrflow_client,
+        board_key="abc",
+        incremental=True,
+        sync_state_store=sync_state_store,
+    )
+    action.execute()
+    assert pulled_after == [None, last_run_at.isoformat()]
+    assert checked_deletions == [True]
+    assert sync_state_store.load(scope).last_run_at > last_run_at
+
+
 @responses.activate
 def test_PullJobsBaseAction_push_success(hrflow_client):
     # Mock requests and check data sent
@@ -1112,6 +1983,28 @@ def test_PushProfileBaseAction_execute(hrflow_client):
     assert workflow_response["message"] == "Profile successfully pushed"
 
 
+def test_PushProfileBaseAction_async_execute(hrflow_client):
+    profile = HrflowProfile(key="efg", source=dict(key="abc"))
+
+    class MyPushProfileAction(PushProfileBaseAction):
+        def pull(self):
+            return []
+
+        def push(self, data):
+            return
+
+    action = MyPushProfileAction(hrflow_client=hrflow_client(), profile=profile)
+
+    loop = asyncio.new_event_loop()
+    try:
+        workflow_response = loop.run_until_complete(action.async_execute())
+    finally:
+        loop.close()
+
+    assert workflow_response["status_code"] == 201
+    assert workflow_response["message"] == "Profile successfully pushed"
+
+
 ##########################
 ### PushJobeBaseAction ###
 ##########################
@@ -1307,3 +2200,56 @@ def test_CatchProfileBaseAction_push_success(hrflow_client):
         assert False
     except HrflowError:
         pass
+
+
+@responses.activate
+def test_PullJobsBaseAction_push_with_concurrency(hrflow_client):
+    # Mock requests and check data sent
+    job_list = [HrflowJob(reference=f"REF{i}") for i in range(10)]
+    for job in job_list:
+        expected_body = dict(board_key="abc", **job.dict())
+        match = [responses.matchers.json_params_matcher(expected_body)]
+        responses.add(
+            responses.POST,
+            "https://api.hrflow.ai/v1/job/indexing",
+            status=200,
+            match=match,
+            json=dict(code=200, data=dict(key=job.reference)),
+        )
+
+    # Push data
+    action = PullJobsBaseAction(
+        board_key="abc",
+        hrflow_client=hrflow_client(),
+        push_concurrency=4,
+        push_max_in_flight=6,
+    )
+    action.push(iter(job_list))
+    assert len(responses.calls) == 10
+
+
+@responses.activate
+def test_PullJobsBaseAction_push_with_concurrency_failure(hrflow_client):
+    # Mock requests and check data sent
+    job_list = [HrflowJob(reference=f"REF{i}") for i in range(5)]
+    for job in job_list:
+        status = 400 if job.reference in ["REF2", "REF4"] else 200
+        expected_body = dict(board_key="abc", **job.dict())
+        match = [responses.matchers.json_params_matcher(expected_body)]
+        responses.add(
+            responses.POST,
+            "https://api.hrflow.ai/v1/job/indexing",
+            status=status,
+            match=match,
+            json=dict(code=status, message=job.reference),
+        )
+
+    # Push data
+    action = PullJobsBaseAction(
+        board_key="abc", hrflow_client=hrflow_client(), push_concurrency=5
+    )
+    try:
+        action.push(job_list)
+        assert False
+    except HrflowError as error:
+        assert "REF2" in str(error)
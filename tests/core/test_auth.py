@@ -1,5 +1,7 @@
 import responses
 import requests
+import time
+from concurrent.futures import ThreadPoolExecutor
 from unittest import mock
 
 from hrflow_connectors.core.error import AuthError
@@ -560,4 +562,315 @@ def test_OAuth2Session_call():
     request = requests.Request(method="POST", url="http://test.test/", headers=dict(abc="efg"))
     prepared_request = request.prepare()
     request_with_auth = auth(prepared_request)
-    assert request_with_auth.headers["BhRestToken"] == "session_token"
\ No newline at end of file
+    assert request_with_auth.headers["BhRestToken"] == "session_token"
+
+
+def get_oauth2_password_credentials_auth(**kwargs):
+    return OAuth2PasswordCredentialsBody(
+        access_token_url="https://test.test/services/oauth2/token",
+        client_id="007",
+        client_secret="double0",
+        username="bond",
+        password="jb",
+        **kwargs,
+    )
+
+
+@responses.activate
+def test_OAuth2PasswordCredentialsBody_access_token_is_cached():
+    access_token_url = "https://test.test/services/oauth2/token"
+    responses.add(
+        responses.POST,
+        access_token_url,
+        status=200,
+        json=dict(access_token="ABC.TOKEN.EFD", expires_in=3600),
+    )
+    responses.add(responses.GET, "http://test.test/check_auth", status=200)
+
+    auth = get_oauth2_password_credentials_auth()
+    # The copies made by the pydantic validation share the cache
+    auth_copy = auth.copy()
+
+    session = requests.Session()
+    for signing_auth in [auth, auth, auth_copy]:
+        request = requests.Request(
+            method="GET", url="http://test.test/check_auth", auth=signing_auth
+        )
+        response = session.send(request.prepare())
+        assert response.request.headers["Authorization"] == "OAuth ABC.TOKEN.EFD"
+
+    token_calls = [call for call in responses.calls if call.request.url == access_token_url]
+    assert len(token_calls) == 1
+
+
+@responses.activate
+def test_OAuth2PasswordCredentialsBody_access_token_is_refreshed_before_expiry():
+    access_token_url = "https://test.test/services/oauth2/token"
+    responses.add(
+        responses.POST,
+        access_token_url,
+        status=200,
+        json=dict(access_token="FIRST", expires_in=3600),
+    )
+    responses.add(
+        responses.POST,
+        access_token_url,
+        status=200,
+        json=dict(access_token="SECOND", expires_in=3600),
+    )
+
+    auth = get_oauth2_password_credentials_auth(token_expiry_margin=60)
+    with mock.patch("hrflow_connectors.core.auth.time.monotonic", return_value=1000):
+        assert auth.get_access_token() == "FIRST"
+    # 10 seconds before the margin
+    with mock.patch("hrflow_connectors.core.auth.time.monotonic", return_value=4530):
+        assert auth.get_access_token() == "FIRST"
+    # In the margin
+    with mock.patch("hrflow_connectors.core.auth.time.monotonic", return_value=4550):
+        assert auth.get_access_token() == "SECOND"
+    assert len(responses.calls) == 2
+
+
+def test_OAuth2PasswordCredentialsBody_concurrent_workers_share_a_refresh():
+    class SlowAuth(OAuth2PasswordCredentialsBody):
+        def request_token(self):
+            request_count.append(1)
+            time.sleep(0.05)
+            return "TOKEN", 3600
+
+    request_count = []
+    auth = SlowAuth(
+        access_token_url="https://test.test/services/oauth2/token",
+        client_id="007",
+        client_secret="double0",
+        username="bond",
+        password="jb",
+    )
+
+    with ThreadPoolExecutor(max_workers=5) as executor:
+        access_tokens = list(executor.map(lambda _: auth.get_access_token(), range(10)))
+
+    assert access_tokens == ["TOKEN"] * 10
+    assert len(request_count) == 1
+
+
+def test_OAuth2PasswordCredentialsBody_token_invalidated_during_check():
+    class MyAuth(OAuth2PasswordCredentialsBody):
+        def request_token(self):
+            return "TOKEN", 3600
+
+    auth = MyAuth(
+        access_token_url="https://test.test/services/oauth2/token",
+        client_id="007",
+        client_secret="double0",
+        username="bond",
+        password="jb",
+    )
+    with mock.patch("hrflow_connectors.core.auth.time.monotonic", return_value=1000):
+        assert auth.get_access_token() == "TOKEN"
+
+    def invalidate_while_checking():
+        # Another worker gets a `401 Unauthorized` while the expiration is checked
+        auth.invalidate_token("TOKEN")
+        return 1000
+
+    with mock.patch(
+        "hrflow_connectors.core.auth.time.monotonic", side_effect=invalidate_while_checking
+    ):
+        assert auth.get_access_token() == "TOKEN"
+
+
+@responses.activate
+def test_OAuth2EmailPasswordBody_access_token_is_invalidated_on_401():
+    access_token_url = "https://test.test/services/signon/token"
+    check_auth_url = "http://test.test/check_auth"
+    responses.add(
+        responses.POST, access_token_url, status=200, json=dict(access_token="EXPIRED")
+    )
+    responses.add(
+        responses.POST, access_token_url, status=200, json=dict(access_token="FRESH")
+    )
+    responses.add(
+        responses.GET,
+        check_auth_url,
+        status=401,
+        match=[responses.matchers.header_matcher(dict(Authorization="EXPIRED"))],
+    )
+    responses.add(
+        responses.GET,
+        check_auth_url,
+        status=200,
+        match=[responses.matchers.header_matcher(dict(Authorization="FRESH"))],
+    )
+
+    auth = OAuth2EmailPasswordBody(
+        access_token_url=access_token_url, email="lemzo@hotemail.ww", password="jb"
+    )
+    session = requests.Session()
+    request = requests.Request(method="GET", url=check_auth_url, auth=auth)
+    response = session.send(request.prepare())
+
+    assert response.status_code == 200
+    assert response.request.headers["Authorization"] == "FRESH"
+    assert [past_response.status_code for past_response in response.history] == [401]
+    assert auth.get_access_token() == "FRESH"
+
+
+@responses.activate
+def test_OAuth2EmailPasswordBody_request_is_retried_once_on_401():
+    access_token_url = "https://test.test/services/signon/token"
+    check_auth_url = "http://test.test/check_auth"
+    responses.add(
+        responses.POST, access_token_url, status=200, json=dict(access_token="TOKEN")
+    )
+    responses.add(responses.GET, check_auth_url, status=401)
+
+    auth = OAuth2EmailPasswordBody(
+        access_token_url=access_token_url, email="lemzo@hotemail.ww", password="jb"
+    )
+    session = requests.Session()
+    request = requests.Request(method="GET", url=check_auth_url, auth=auth)
+    response = session.send(request.prepare())
+
+    assert response.status_code == 401
+    check_auth_calls = [call for call in responses.calls if call.request.url == check_auth_url]
+    assert len(check_auth_calls) == 2
+
+
+class CountingOAuth2Session(OAuth2Session):
+    def get_auth_code(self):
+        self.calls.append("auth_code")
+        return "auth_code"
+
+    def get_session_token(self, access_token):
+        self.calls.append(("session_token", access_token))
+        return f"session_token_{len(self.calls)}"
+
+
+def get_counting_oauth2_session(**kwargs):
+    auth = CountingOAuth2Session(
+        auth_code_url="http://test.test/auth_code",
+        access_token_url="http://test.test/access_token",
+        session_token_url="http://test.test/session_token",
+        client_id="client_id",
+        client_secret="client_secret",
+        username="username",
+        password="password",
+        name="BhRestToken",
+        **kwargs,
+    )
+    object.__setattr__(auth, "calls", [])
+    return auth
+
+
+@responses.activate
+def test_OAuth2Session_session_token_is_cached():
+    responses.add(
+        responses.POST,
+        "http://test.test/access_token",
+        status=200,
+        json=dict(access_token="access_token", refresh_token="refresh_token"),
+    )
+    auth = get_counting_oauth2_session()
+
+    for _ in range(3):
+        request = requests.Request(method="POST", url="http://test.test/")
+        request_with_auth = auth(request.prepare())
+        assert request_with_auth.headers["BhRestToken"] == "session_token_2"
+
+    assert auth.calls == ["auth_code", ("session_token", "access_token")]
+
+
+@responses.activate
+def test_OAuth2Session_session_is_opened_with_refresh_token():
+    responses.add(
+        responses.POST,
+        "http://test.test/access_token",
+        status=200,
+        json=dict(access_token="access_token", refresh_token="refresh_token"),
+        match=[responses.matchers.query_param_matcher(dict(
+            grant_type="authorization_code",
+            code="auth_code",
+            client_id="client_id",
+            client_secret="client_secret",
+        ))],
+    )
+    responses.add(
+        responses.POST,
+        "http://test.test/access_token",
+        status=200,
+        json=dict(access_token="refreshed_access_token", refresh_token="new_refresh_token"),
+        match=[responses.matchers.query_param_matcher(dict(
+            grant_type="refresh_token",
+            refresh_token="refresh_token",
+            client_id="client_id",
+            client_secret="client_secret",
+        ))],
+    )
+    auth = get_counting_oauth2_session()
+
+    auth.get_token()
+    auth.invalidate_token("session_token_2")
+    assert auth.get_token() == "session_token_3"
+
+    assert auth.calls == [
+        "auth_code",
+        ("session_token", "access_token"),
+        ("session_token", "refreshed_access_token"),
+    ]
+
+
+@responses.activate
+def test_OAuth2Session_logs_in_again_when_refresh_token_is_rejected():
+    responses.add(
+        responses.POST,
+        "http://test.test/access_token",
+        status=400,
+        match=[responses.matchers.query_param_matcher(dict(
+            grant_type="refresh_token",
+            refresh_token="expired_refresh_token",
+            client_id="client_id",
+            client_secret="client_secret",
+        ))],
+    )
+    responses.add(
+        responses.POST,
+        "http://test.test/access_token",
+        status=200,
+        json=dict(access_token="access_token", refresh_token="refresh_token"),
+    )
+    auth = get_counting_oauth2_session()
+    auth._token_cache.refresh_token = "expired_refresh_token"
+
+    assert auth.get_token() == "session_token_2"
+    assert auth.calls == ["auth_code", ("session_token", "access_token")]
+    assert auth._token_cache.refresh_token == "refresh_token"
+
+
+@responses.activate
+def test_OAuth2Session_token_store(tmp_path):
+    responses.add(
+        responses.POST,
+        "http://test.test/access_token",
+        status=200,
+        json=dict(access_token="access_token", refresh_token="refresh_token"),
+    )
+    token_store_path = str(tmp_path / "bullhorn_tokens.json")
+
+    first_run_auth = get_counting_oauth2_session(token_store_path=token_store_path)
+    assert first_run_auth.get_token() == "session_token_2"
+
+    # The next run reuses the stored session token without any request
+    next_run_auth = get_counting_oauth2_session(token_store_path=token_store_path)
+    assert next_run_auth.get_token() == "session_token_2"
+    assert next_run_auth.calls == []
+
+    # A rejected session token is removed from the store, the refresh token is kept
+    next_run_auth.invalidate_token("session_token_2")
+    last_run_auth = get_counting_oauth2_session(token_store_path=token_store_path)
+    assert last_run_auth.get_token() == "session_token_1"
+    assert last_run_auth.calls == [("session_token", "access_token")]
+    refresh_calls = [
+        call for call in responses.calls if "grant_type=refresh_token" in call.request.url
+    ]
+    assert len(refresh_calls) == 1
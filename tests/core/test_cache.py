@@ -0,0 +1,44 @@
+import time
+
+from hrflow_connectors.core.cache import ParsingCache
+
+
+def test_ParsingCache_get_and_set():
+    cache = ParsingCache()
+    assert cache.get("I love Python") is None
+
+    cache.set("I love Python", dict(ents=[], text="I love Python"))
+    assert cache.get("I love Python") == dict(ents=[], text="I love Python")
+    assert cache.get("I love Java") is None
+
+
+def test_ParsingCache_evicts_least_recently_used():
+    cache = ParsingCache(max_size=2)
+    cache.set("a", dict(text="a"))
+    cache.set("b", dict(text="b"))
+    cache.get("a")
+    cache.set("c", dict(text="c"))
+
+    assert cache.get("a") == dict(text="a")
+    assert cache.get("b") is None
+    assert cache.get("c") == dict(text="c")
+
+
+def test_ParsingCache_ttl(monkeypatch):
+    cache = ParsingCache(ttl=10)
+    cache.set("a", dict(text="a"))
+    assert cache.get("a") == dict(text="a")
+
+    now = time.time()
+    monkeypatch.setattr(time, "time", lambda: now + 20)
+    assert cache.get("a") is None
+
+
+def test_ParsingCache_on_disk(tmp_path):
+    directory = str(tmp_path / "parsing")
+    ParsingCache(directory=directory).set("a", dict(text="a"))
+
+    # A new cache, as in the next run, reads the on-disk tier
+    cache = ParsingCache(directory=directory)
+    assert cache.get("a") == dict(text="a")
+    assert cache.get("b") is None
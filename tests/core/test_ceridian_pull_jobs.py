@@ -0,0 +1,30 @@
+import responses
+
+from hrflow_connectors.connectors.ceridian.actions import PullJobsAction
+
+
+@responses.activate
+def test_PullJobsAction_streams_the_job_feed(hrflow_client):
+    job_feed = [
+        dict(
+            Title=f"Job {reference}",
+            JobDetailsUrl="https://jobs.test",
+            ReferenceNumber=reference,
+        )
+        for reference in range(3)
+    ]
+    responses.add(
+        responses.GET,
+        "https://ustest61-services.dayforcehcm.com/Api/ddn/V1/JobFeeds",
+        json=job_feed,
+    )
+
+    action = PullJobsAction(
+        subdomain="ustest61-services",
+        client_name_space="ddn",
+        hrflow_client=hrflow_client(),
+        board_key="abc",
+    )
+    job_iter = action.pull()
+
+    assert [job.ReferenceNumber for job in job_iter] == [0, 1, 2]
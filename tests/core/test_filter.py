@@ -0,0 +1,92 @@
+import datetime
+import pytest
+
+from hrflow_connectors.core.action import PullBaseAction
+from hrflow_connectors.core.filter import FilterSpec, FilterOperator, apply_filters
+
+
+@pytest.fixture
+def items():
+    return [
+        dict(status="OPEN", department=dict(id="1"), updated_on="2022-01-10T00:00:00"),
+        dict(status="CLOSED", department=dict(id="2"), updated_on="2022-01-20T00:00:00"),
+        dict(status="OPEN", department=None, updated_on=None),
+    ]
+
+
+def test_FilterSpec_evaluate(items):
+    open_filter = FilterSpec(field="status", value="OPEN")
+    assert open_filter.operator == FilterOperator.EQUAL
+    assert [open_filter.evaluate(item) for item in items] == [True, False, True]
+
+    not_open_filter = FilterSpec(field="status", operator="ne", value="OPEN")
+    assert [not_open_filter.evaluate(item) for item in items] == [False, True, False]
+
+    department_filter = FilterSpec(field="department.id", operator="in", value=["2", "3"])
+    assert [department_filter.evaluate(item) for item in items] == [False, True, False]
+
+    contains_filter = FilterSpec(field="status", operator="contains", value="LOS")
+    assert [contains_filter.evaluate(item) for item in items] == [False, True, False]
+
+
+def test_FilterSpec_evaluate_dates(items):
+    string_filter = FilterSpec(
+        field="updated_on", operator="gte", value="2022-01-10T00:00:00"
+    )
+    assert [string_filter.evaluate(item) for item in items] == [True, True, False]
+
+    datetime_filter = FilterSpec(
+        field="updated_on", operator="gt", value=datetime.datetime(2022, 1, 15)
+    )
+    assert [datetime_filter.evaluate(item) for item in items] == [False, True, False]
+
+
+def test_FilterSpec_evaluate_object():
+    class Item:
+        status = "OPEN"
+
+    assert FilterSpec(field="status", value="OPEN").evaluate(Item())
+    assert not FilterSpec(field="missing", operator="lt", value=1).evaluate(Item())
+
+
+def test_apply_filters(items):
+    filters = [
+        FilterSpec(field="status", value="OPEN"),
+        FilterSpec(field="department.id", value="1"),
+    ]
+    assert list(apply_filters(items, filters)) == [items[0]]
+    assert apply_filters(items, []) is items
+
+
+def test_PullBaseAction_execute_with_filters(hrflow_client, items):
+    class MyPullAction(PullBaseAction):
+        def push_down_filters(self, filters):
+            remaining_filters = []
+            for filter_spec in filters:
+                if filter_spec.field == "status":
+                    pushed_down_status.append(filter_spec.value)
+                else:
+                    remaining_filters.append(filter_spec)
+            return remaining_filters
+
+        def pull(self):
+            # The filters have been pushed down before the pull
+            assert pushed_down_status == ["OPEN"]
+            return [item for item in items if item["status"] == "OPEN"]
+
+        def push(self, data):
+            pushed_data.extend(data)
+
+    pushed_down_status = []
+    pushed_data = []
+    action = MyPullAction(
+        hrflow_client=hrflow_client,
+        filters=[
+            FilterSpec(field="status", value="OPEN"),
+            FilterSpec(field="department.id", value="1"),
+        ],
+    )
+    action.execute()
+
+    assert pushed_data == [items[0]]
+    assert pushed_down_status == ["OPEN"]
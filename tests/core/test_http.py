@@ -0,0 +1,184 @@
+import pytest
+import requests
+import responses
+
+from hrflow_connectors.core.action import BaseAction
+from hrflow_connectors.core.http import HttpClient, RetryPolicy, get_default_http_client
+import hrflow_connectors.core.http as http_module
+
+
+@responses.activate
+def test_HttpClient_send():
+    responses.add(responses.GET, "http://test.test/jobs", status=200, json=[1, 2])
+
+    http_client = HttpClient()
+    prepared_request = requests.Request("GET", "http://test.test/jobs").prepare()
+    response = http_client.send(prepared_request)
+
+    assert response.ok
+    assert response.json() == [1, 2]
+
+
+@responses.activate
+def test_HttpClient_get():
+    responses.add(
+        responses.GET,
+        "http://test.test/jobs",
+        status=200,
+        match=[responses.matchers.query_param_matcher(dict(page="2"))],
+    )
+
+    response = HttpClient().get("http://test.test/jobs", params=dict(page=2))
+    assert response.ok
+
+
+@responses.activate
+def test_HttpClient_without_keep_alive():
+    responses.add(responses.GET, "http://test.test/jobs", status=200)
+
+    http_client = HttpClient(keep_alive=False)
+    http_client.get("http://test.test/jobs")
+
+    assert responses.calls[0].request.headers["Connection"] == "close"
+
+
+def test_HttpClient_pool():
+    http_client = HttpClient(pool_connections=3, pool_maxsize=7)
+    adapter = http_client._session.get_adapter("https://api.test/")
+
+    assert adapter._pool_connections == 3
+    assert adapter._pool_maxsize == 7
+
+
+def test_BaseAction_shares_the_default_http_client(hrflow_client):
+    action_1 = BaseAction(hrflow_client=hrflow_client)
+    action_2 = BaseAction(hrflow_client=hrflow_client)
+
+    assert action_1.http_client is get_default_http_client()
+    assert action_1.http_client._session is action_2.http_client._session
+
+
+def test_BaseAction_with_http_client(hrflow_client):
+    http_client = HttpClient(pool_maxsize=20)
+    action = BaseAction(hrflow_client=hrflow_client, http_client=http_client)
+
+    assert action.http_client.pool_maxsize == 20
+    assert action.http_client._session is http_client._session
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    sleep_list = []
+    monkeypatch.setattr(http_module.time, "sleep", sleep_list.append)
+    return sleep_list
+
+
+@responses.activate
+def test_HttpClient_retries_temporary_failures(sleeps):
+    responses.add(responses.GET, "http://test.test/jobs", status=503)
+    responses.add(responses.GET, "http://test.test/jobs", status=502)
+    responses.add(responses.GET, "http://test.test/jobs", status=200)
+
+    http_client = HttpClient(retry_policy=RetryPolicy(backoff_factor=1, jitter=False))
+    response = http_client.get("http://test.test/jobs")
+
+    assert response.status_code == 200
+    assert len(responses.calls) == 3
+    assert sleeps == [1, 2]
+    assert http_client.get_retry_count() == 2
+
+
+@responses.activate
+def test_HttpClient_returns_the_last_response_after_max_attempts(sleeps):
+    responses.add(responses.GET, "http://test.test/jobs", status=500)
+
+    http_client = HttpClient(retry_policy=RetryPolicy(max_attempts=3))
+    response = http_client.get("http://test.test/jobs")
+
+    assert response.status_code == 500
+    assert len(responses.calls) == 3
+    assert len(sleeps) == 2
+
+
+@responses.activate
+def test_HttpClient_honors_retry_after(sleeps):
+    responses.add(
+        responses.POST,
+        "http://test.test/candidates",
+        status=429,
+        headers={"Retry-After": "7"},
+    )
+    responses.add(responses.POST, "http://test.test/candidates", status=201)
+
+    response = HttpClient().request("POST", "http://test.test/candidates")
+
+    # A rate-limited request is retried whatever its method
+    assert response.status_code == 201
+    assert sleeps == [7]
+
+
+@responses.activate
+@pytest.mark.parametrize("method", ["POST", "PUT", "DELETE"])
+def test_HttpClient_does_not_retry_write_methods(sleeps, method):
+    responses.add(method, "http://test.test/candidates", status=500)
+
+    response = HttpClient().request(method, "http://test.test/candidates")
+
+    assert response.status_code == 500
+    assert len(responses.calls) == 1
+    assert sleeps == []
+
+
+@responses.activate
+def test_HttpClient_does_not_retry_client_errors(sleeps):
+    responses.add(responses.GET, "http://test.test/jobs", status=404)
+
+    response = HttpClient().get("http://test.test/jobs")
+
+    assert response.status_code == 404
+    assert sleeps == []
+
+
+@responses.activate
+def test_HttpClient_retries_connection_errors(sleeps):
+    responses.add(
+        responses.GET,
+        "http://test.test/jobs",
+        body=requests.ConnectionError("Connection reset"),
+    )
+    responses.add(responses.GET, "http://test.test/jobs", status=200)
+
+    response = HttpClient().get("http://test.test/jobs")
+    assert response.status_code == 200
+
+    with pytest.raises(requests.ConnectionError):
+        HttpClient(retry_policy=RetryPolicy(max_attempts=1)).get(
+            "http://test.test/unknown"
+        )
+
+
+def test_RetryPolicy_get_delay():
+    retry_policy = RetryPolicy(backoff_factor=2, max_backoff=10, jitter=False)
+    assert [retry_policy.get_delay(attempt) for attempt in range(1, 5)] == [2, 4, 8, 10]
+
+    retry_policy = RetryPolicy(backoff_factor=2, jitter=True)
+    for _ in range(20):
+        assert 2 <= retry_policy.get_delay(2) <= 4
+
+
+def test_RetryPolicy_get_retry_after():
+    retry_policy = RetryPolicy()
+
+    response = requests.Response()
+    response.headers["Retry-After"] = "12"
+    assert retry_policy.get_delay(1, response) == 12
+
+    response.headers["Retry-After"] = "Wed, 21 Oct 2015 07:28:00 GMT"
+    assert retry_policy.get_retry_after(response) == 0
+
+    response.headers["Retry-After"] = "soon"
+    assert retry_policy.get_retry_after(response) is None
+
+    retry_policy = RetryPolicy(respect_retry_after=False)
+    response.headers["Retry-After"] = "12"
+    assert retry_policy.get_retry_after(response) is None
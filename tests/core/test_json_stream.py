@@ -0,0 +1,95 @@
+import json
+
+import pytest
+import requests
+import responses
+
+from hrflow_connectors.core.json_stream import iter_json_array, iter_response_json_array
+
+
+def split_in_chunks(document, chunk_size):
+    encoded_document = document.encode("utf-8")
+    return [
+        encoded_document[index : index + chunk_size]
+        for index in range(0, len(encoded_document), chunk_size)
+    ]
+
+
+DOCUMENT = json.dumps(
+    {
+        "meta": {"total": 3, "tags": ["a", "b"]},
+        "data": {
+            "jobs": [
+                {"id": 1, "name": "Ingénieur", "salary": 12345},
+                {"id": 2, "name": "Data \"scientist\"", "remote": True},
+                {"id": 3, "name": "Painter", "skills": [{"name": "art"}]},
+            ]
+        },
+    },
+    ensure_ascii=False,
+)
+JOB_LIST = json.loads(DOCUMENT)["data"]["jobs"]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 7, 64, 10000])
+def test_iter_json_array_with_path(chunk_size):
+    chunks = split_in_chunks(DOCUMENT, chunk_size)
+    assert list(iter_json_array(chunks, path="data.jobs")) == JOB_LIST
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 10000])
+def test_iter_json_array_root(chunk_size):
+    document = " [1, 23, 4.5e2, \"x\", null, [], {} ] "
+    chunks = split_in_chunks(document, chunk_size)
+    assert list(iter_json_array(chunks)) == [1, 23, 450.0, "x", None, [], {}]
+
+
+def test_iter_json_array_empty():
+    assert list(iter_json_array([b'{"jobs": []}'], path="jobs")) == []
+    assert list(iter_json_array([b"[ ]"])) == []
+
+
+def test_iter_json_array_is_lazy():
+    chunks_read = []
+
+    def get_chunks():
+        for chunk in [b'[{"id": 1},', b' {"id": 2}', b"]"]:
+            chunks_read.append(chunk)
+            yield chunk
+
+    item_iter = iter_json_array(get_chunks())
+    assert next(item_iter) == {"id": 1}
+    # The first item is yielded before the end of the document is received
+    assert len(chunks_read) == 1
+    assert list(item_iter) == [{"id": 2}]
+
+
+def test_iter_json_array_with_byte_order_mark():
+    assert list(iter_json_array([b"\xef\xbb\xbf[1, 2]"])) == [1, 2]
+
+
+def test_iter_json_array_missing_key():
+    with pytest.raises(KeyError):
+        list(iter_json_array([b'{"meta": {"jobs": []}}'], path="jobs"))
+    with pytest.raises(KeyError):
+        list(iter_json_array([b"{}"], path="jobs"))
+
+
+@pytest.mark.parametrize("document", ['{"jobs": [1, 2', '[{"id": 1} {"id": 2}]', '{"jobs": 1}'])
+def test_iter_json_array_invalid_document(document):
+    with pytest.raises(ValueError):
+        list(iter_json_array([document.encode("utf-8")], path="jobs" if "jobs" in document else ""))
+
+
+@responses.activate
+def test_iter_response_json_array():
+    responses.add(
+        responses.GET,
+        "https://api.test/jobs",
+        body=DOCUMENT.encode("utf-8"),
+        content_type="text/plain",
+    )
+    response = requests.get("https://api.test/jobs", stream=True)
+
+    # The body is decoded as UTF-8 even if `requests` guesses another encoding
+    assert list(iter_response_json_array(response, path="data.jobs", chunk_size=5)) == JOB_LIST
@@ -0,0 +1,181 @@
+import pytest
+import requests
+import responses
+
+from hrflow_connectors.core.error import PullError
+from hrflow_connectors.core.http import HttpClient, RetryPolicy
+from hrflow_connectors.core.pagination import (
+    CursorPaginator,
+    LinkPaginator,
+    ODataPaginator,
+    OffsetPaginator,
+    get_path_value,
+)
+
+JOBS_URL = "https://api.test/jobs"
+
+
+@pytest.fixture
+def http_client():
+    return HttpClient(retry_policy=RetryPolicy(max_attempts=1))
+
+
+def get_jobs_request(**params):
+    return requests.Request(method="GET", url=JOBS_URL, params=params)
+
+
+def add_page(json, **params):
+    responses.add(
+        responses.GET,
+        JOBS_URL,
+        json=json,
+        match=[responses.matchers.query_param_matcher(params)],
+    )
+
+
+def test_get_path_value():
+    page = dict(d=dict(__next="https://api.test/next"), items=[1])
+    assert get_path_value(page, "d.__next") == "https://api.test/next"
+    assert get_path_value(page, "items") == [1]
+    assert get_path_value(page, "d.missing") is None
+    assert get_path_value(page, "items.next") is None
+
+
+@responses.activate
+@pytest.mark.parametrize("prefetch_next_page", [True, False])
+def test_CursorPaginator(http_client, prefetch_next_page):
+    add_page(dict(content=[1, 2], nextPageId="a"), limit="2")
+    add_page(dict(content=[3], nextPageId="b"), limit="2", pageId="a")
+    add_page(dict(content=[], nextPageId="c"), limit="2", pageId="b")
+
+    paginator = CursorPaginator(
+        cursor_param="pageId",
+        cursor_path="nextPageId",
+        items_path="content",
+        prefetch_next_page=prefetch_next_page,
+    )
+    pages = list(paginator.iter_pages(http_client, get_jobs_request(limit=2)))
+
+    assert [page["content"] for page in pages] == [[1, 2], [3], []]
+
+
+@responses.activate
+def test_OffsetPaginator_counting_pages(http_client):
+    add_page(dict(list=[1, 2], listSize=5), page="0", pageSize="2", withDetails="true")
+    add_page(dict(list=[3, 4], listSize=5), page="1", pageSize="2", withDetails="true")
+    add_page(dict(list=[5], listSize=5), page="2", pageSize="2", withDetails="true")
+
+    paginator = OffsetPaginator(
+        offset_param="page",
+        limit_param="pageSize",
+        limit=2,
+        count_pages=True,
+        items_path="list",
+    )
+    pages = list(paginator.iter_pages(http_client, get_jobs_request(withDetails="true")))
+
+    assert [page["list"] for page in pages] == [[1, 2], [3, 4], [5]]
+
+
+@responses.activate
+def test_OffsetPaginator_counting_items(http_client):
+    add_page(dict(data=dict(items=[1, 2])), offset="10", limit="2")
+    add_page(dict(data=dict(items=[3, 4])), offset="12", limit="2")
+    add_page(dict(data=dict(items=[])), offset="14", limit="2")
+
+    paginator = OffsetPaginator(
+        offset_param="offset",
+        limit_param="limit",
+        limit=2,
+        start=10,
+        items_path="data.items",
+    )
+    pages = list(paginator.iter_pages(http_client, get_jobs_request()))
+
+    assert [page["data"]["items"] for page in pages] == [[1, 2], [3, 4], []]
+
+
+@responses.activate
+def test_OffsetPaginator_stops_at_total(http_client):
+    add_page(dict(data=dict(items=[1, 2]), total=4), offset="0", limit="2")
+    add_page(dict(data=dict(items=[3, 4]), total=4), offset="2", limit="2")
+
+    paginator = OffsetPaginator(
+        offset_param="offset",
+        limit_param="limit",
+        limit=2,
+        items_path="data.items",
+        total_path="total",
+    )
+    pages = list(paginator.iter_pages(http_client, get_jobs_request()))
+
+    # No request of an empty page after the last item
+    assert len(pages) == 2
+    assert len(responses.calls) == 2
+
+
+@responses.activate
+def test_LinkPaginator_with_link_header(http_client):
+    responses.add(
+        responses.GET,
+        JOBS_URL,
+        json=dict(jobs=[1]),
+        headers=dict(Link='</jobs?page=2>; rel="next"'),
+        match=[responses.matchers.query_param_matcher(dict())],
+    )
+    add_page(dict(jobs=[2]), page="2")
+
+    paginator = LinkPaginator()
+    pages = list(paginator.iter_pages(http_client, get_jobs_request()))
+
+    assert [page["jobs"] for page in pages] == [[1], [2]]
+    # The relative link is resolved from the URL of the current page
+    assert responses.calls[1].request.url == "https://api.test/jobs?page=2"
+
+
+@responses.activate
+def test_LinkPaginator_with_link_in_page(http_client):
+    add_page(dict(jobs=[1], paging=dict(next=f"{JOBS_URL}?since_id=1&limit=1")), limit="1")
+    add_page(dict(jobs=[2], paging=dict(next=None)), since_id="1", limit="1")
+
+    paginator = LinkPaginator(next_link_path="paging.next")
+    pages = list(paginator.iter_pages(http_client, get_jobs_request(limit=1)))
+
+    assert [page["jobs"] for page in pages] == [[1], [2]]
+
+
+@responses.activate
+def test_ODataPaginator(http_client):
+    add_page(dict(d=dict(results=[1], __next=f"{JOBS_URL}?$skiptoken=abc")))
+    add_page(dict(d=dict(results=[2])), **{"$skiptoken": "abc"})
+
+    pages = list(ODataPaginator().iter_pages(http_client, get_jobs_request()))
+
+    assert [page["d"]["results"] for page in pages] == [[1], [2]]
+
+
+@responses.activate
+def test_Paginator_max_pages(http_client):
+    add_page(dict(content=[1], nextPageId="a"))
+    add_page(dict(content=[2], nextPageId="b"), pageId="a")
+
+    paginator = CursorPaginator(cursor_param="pageId", cursor_path="nextPageId", max_pages=1)
+    pages = list(paginator.iter_pages(http_client, get_jobs_request()))
+
+    assert len(pages) == 1
+    assert len(responses.calls) == 1
+
+
+@responses.activate
+def test_Paginator_failed_page(http_client):
+    add_page(dict(content=[1], nextPageId="a"))
+    responses.add(responses.GET, JOBS_URL, status=400, json=dict(error="bad cursor"))
+
+    paginator = CursorPaginator(cursor_param="pageId", cursor_path="nextPageId")
+    page_iter = paginator.iter_pages(
+        http_client, get_jobs_request(), error_message="Failed to get jobs"
+    )
+
+    assert next(page_iter)["content"] == [1]
+    with pytest.raises(PullError, match="Failed to get jobs"):
+        next(page_iter)
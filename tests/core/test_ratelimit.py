@@ -0,0 +1,120 @@
+import asyncio
+import threading
+import time
+
+import pytest
+import responses
+
+from hrflow_connectors.core.http import HttpClient
+from hrflow_connectors.core.ratelimit import (
+    TokenBucket,
+    get_rate_limiter,
+    remove_rate_limit,
+    set_default_rate_limit,
+    set_rate_limit,
+)
+
+
+def test_TokenBucket_burst_then_rate():
+    bucket = TokenBucket(rate=20, burst=3)
+    delays = [bucket.reserve() for _ in range(5)]
+
+    assert delays[:3] == [0, 0, 0]
+    assert delays[3] == pytest.approx(0.05, abs=0.01)
+    assert delays[4] == pytest.approx(0.10, abs=0.01)
+
+
+def test_TokenBucket_shared_by_threads():
+    bucket = TokenBucket(rate=100, burst=1)
+
+    def acquire_many():
+        for _ in range(5):
+            bucket.acquire()
+
+    start = time.monotonic()
+    threads = [threading.Thread(target=acquire_many) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # 20 requests : the first one is free, the next ones are spaced by 10ms
+    assert time.monotonic() - start >= 0.18
+
+
+def test_TokenBucket_async_acquire():
+    bucket = TokenBucket(rate=100, burst=1)
+
+    async def acquire_many():
+        await asyncio.gather(*(bucket.async_acquire() for _ in range(10)))
+
+    start = time.monotonic()
+    loop = asyncio.new_event_loop()
+    try:
+        loop.run_until_complete(acquire_many())
+    finally:
+        loop.close()
+
+    assert time.monotonic() - start >= 0.08
+
+
+def test_TokenBucket_with_invalid_parameters():
+    with pytest.raises(ValueError):
+        TokenBucket(rate=0)
+    with pytest.raises(ValueError):
+        TokenBucket(rate=1, burst=0)
+
+
+def test_rate_limit_registry():
+    try:
+        rate_limiter = set_rate_limit("api.test.test", rate=5)
+        assert get_rate_limiter("https://api.test.test/jobs?page=2") is rate_limiter
+        assert get_rate_limiter("https://API.test.test/jobs") is rate_limiter
+        assert get_rate_limiter("https://other.test.test/jobs") is None
+
+        # A default rate limit does not replace the one set by the user
+        assert set_default_rate_limit("api.test.test", rate=1) is rate_limiter
+
+        # Wildcard on the subdomains
+        wildcard_rate_limiter = set_rate_limit("*.test.test", rate=2)
+        assert get_rate_limiter("https://other.test.test/jobs") is wildcard_rate_limiter
+        assert get_rate_limiter("https://api.test.test/jobs") is rate_limiter
+    finally:
+        remove_rate_limit("api.test.test")
+        remove_rate_limit("*.test.test")
+
+    assert get_rate_limiter("https://api.test.test/jobs") is None
+
+
+@pytest.mark.parametrize(
+    "url, quota, window",
+    [
+        ("https://api.smartrecruiters.com/jobs", 10, 1),
+        ("https://api.teamtailor.com/v1/jobs", 50, 10),
+        ("https://eurostar.workable.com/spi/v3/jobs", 10, 10),
+    ],
+)
+def test_connector_default_rate_limits(url, quota, window):
+    import hrflow_connectors.connectors.smartrecruiters.actions
+    import hrflow_connectors.connectors.teamtailor.actions
+    import hrflow_connectors.connectors.workable.actions
+
+    rate_limiter = get_rate_limiter(url)
+    assert rate_limiter is not None
+    # The requests sent at once and the ones sent during the window respect the quota
+    assert rate_limiter.burst + rate_limiter.rate * window <= quota
+
+
+@responses.activate
+def test_HttpClient_with_rate_limit():
+    responses.add(responses.GET, "http://limited.test/jobs", status=200)
+    try:
+        set_rate_limit("limited.test", rate=50, burst=1)
+        http_client = HttpClient()
+
+        start = time.monotonic()
+        for _ in range(4):
+            http_client.get("http://limited.test/jobs")
+        assert time.monotonic() - start >= 0.05
+    finally:
+        remove_rate_limit("limited.test")
@@ -0,0 +1,82 @@
+from hrflow_connectors.core.action import PullBaseAction
+from hrflow_connectors.core.runner import execute_actions
+import asyncio
+import pytest
+
+
+class SleepingAction(PullBaseAction):
+    name: str
+
+    async def async_pull(self):
+        return [self.name]
+
+    async def async_push(self, data):
+        running_actions.append(self.name)
+        max_running_actions.append(len(running_actions))
+        await asyncio.sleep(0.05)
+        running_actions.remove(self.name)
+        pushed_data.extend(data)
+
+
+class FailingAction(PullBaseAction):
+    async def async_pull(self):
+        raise ValueError("Pull failed")
+
+
+running_actions = []
+max_running_actions = []
+pushed_data = []
+
+
+@pytest.fixture(autouse=True)
+def reset_tracking():
+    running_actions.clear()
+    max_running_actions.clear()
+    pushed_data.clear()
+
+
+def test_execute_actions(hrflow_client):
+    actions = [
+        SleepingAction(hrflow_client=hrflow_client, name=str(i)) for i in range(5)
+    ]
+    results = execute_actions(actions)
+
+    assert results == [None] * 5
+    assert sorted(pushed_data) == ["0", "1", "2", "3", "4"]
+    assert max(max_running_actions) == 5
+
+
+def test_execute_actions_with_max_concurrency(hrflow_client):
+    actions = [
+        SleepingAction(hrflow_client=hrflow_client, name=str(i)) for i in range(5)
+    ]
+    execute_actions(actions, max_concurrency=2)
+
+    assert sorted(pushed_data) == ["0", "1", "2", "3", "4"]
+    assert max(max_running_actions) == 2
+
+
+def test_execute_actions_with_failure(hrflow_client):
+    actions = [
+        SleepingAction(hrflow_client=hrflow_client, name="0"),
+        FailingAction(hrflow_client=hrflow_client),
+    ]
+    with pytest.raises(ValueError):
+        execute_actions(actions)
+
+
+def test_execute_actions_with_failure_returned(hrflow_client):
+    actions = [
+        SleepingAction(hrflow_client=hrflow_client, name="0"),
+        FailingAction(hrflow_client=hrflow_client),
+    ]
+    results = execute_actions(actions, return_exceptions=True)
+
+    assert results[0] is None
+    assert isinstance(results[1], ValueError)
+    assert pushed_data == ["0"]
+
+
+def test_execute_actions_with_invalid_max_concurrency(hrflow_client):
+    with pytest.raises(ValueError):
+        execute_actions([], max_concurrency=0)
@@ -0,0 +1,122 @@
+import json
+import re
+import threading
+import time
+
+import responses
+
+from hrflow_connectors import XSmartTokenAuth
+from hrflow_connectors.connectors.smartrecruiters.actions import PullJobsAction
+from hrflow_connectors.core.state import InMemorySyncStateStore
+
+
+@responses.activate
+def test_PullJobsAction_requests_full_jobs_concurrently(hrflow_client):
+    jobs_url = "https://api.smartrecruiters.com/jobs"
+    pages = [["1", "2", "3"], ["4", "5"], []]
+    for page_index, job_ids in enumerate(pages):
+        page_id = None if page_index == 0 else str(page_index)
+        responses.add(
+            responses.GET,
+            jobs_url,
+            json=dict(
+                totalFound=5,
+                nextPageId=str(page_index + 1),
+                content=[dict(id=job_id) for job_id in job_ids],
+            ),
+            match=[
+                responses.matchers.query_param_matcher(
+                    dict(limit="3", pageId=page_id) if page_id else dict(limit="3")
+                )
+            ],
+        )
+
+    lock = threading.Lock()
+    state = dict(in_flight=0, max_in_flight=0)
+
+    def full_job_callback(request):
+        with lock:
+            state["in_flight"] += 1
+            state["max_in_flight"] = max(state["max_in_flight"], state["in_flight"])
+        # Longer than the spacing of the requests by the default rate limit
+        time.sleep(0.3)
+        with lock:
+            state["in_flight"] -= 1
+        job_id = request.url.rsplit("/", 1)[-1]
+        section = dict(title=None, text=None)
+        full_job = dict(
+            title=f"Job {job_id}",
+            location=dict(),
+            jobAd=dict(
+                sections=dict(
+                    companyDescription=section,
+                    jobDescription=section,
+                    qualifications=section,
+                    additionalInformation=section,
+                )
+            ),
+        )
+        return 200, dict(), json.dumps(full_job)
+
+    responses.add_callback(
+        responses.GET,
+        re.compile(r"https://api\.smartrecruiters\.com/jobs/\d+"),
+        callback=full_job_callback,
+    )
+
+    action = PullJobsAction(
+        auth=XSmartTokenAuth(value="token"),
+        hrflow_client=hrflow_client(),
+        board_key="abc",
+        limit=3,
+        detail_concurrency=4,
+    )
+    jobs = list(action.pull())
+
+    assert [job.title for job in jobs] == [f"Job {job_id}" for job_id in "12345"]
+    assert 1 < state["max_in_flight"] <= 4
+
+
+@responses.activate
+def test_PullJobsAction_incremental_cursor_is_kept_per_run(hrflow_client):
+    responses.add(
+        responses.GET,
+        "https://api.smartrecruiters.com/jobs",
+        json=dict(totalFound=0, nextPageId=None, content=[]),
+    )
+
+    class MyPullJobsAction(PullJobsAction):
+        def push(self, data):
+            list(data)
+
+    sync_state_store = InMemorySyncStateStore()
+    action = MyPullJobsAction(
+        auth=XSmartTokenAuth(value="token"),
+        hrflow_client=hrflow_client(),
+        board_key="abc",
+        incremental=True,
+        archive_deleted_jobs_from_stream=False,
+        sync_state_store=sync_state_store,
+    )
+    scope = action.get_sync_scope()
+
+    # First run : full pull
+    action.execute()
+    first_run_at = sync_state_store.load(scope).last_run_at
+    # Second run : pull since the first run
+    action.execute()
+    second_run_at = sync_state_store.load(scope).last_run_at
+    # Third run : pull since the second run, not since the first one
+    assert action.prepare_execution()
+    list(action.pull())
+
+    updated_after_list = [
+        call.request.params.get("updatedAfter") for call in responses.calls
+    ]
+    assert updated_after_list == [
+        None,
+        first_run_at.isoformat(),
+        second_run_at.isoformat(),
+    ]
+    # The field given by the user is unchanged
+    assert action.updated_after is None
@@ -0,0 +1,50 @@
+import datetime
+import pytest
+
+from hrflow_connectors.core.state import (
+    SyncState,
+    InMemorySyncStateStore,
+    SQLiteSyncStateStore,
+)
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def sync_state_store(request, tmp_path):
+    if request.param == "memory":
+        return InMemorySyncStateStore()
+    return SQLiteSyncStateStore(path=str(tmp_path / "state.sqlite"))
+
+
+def test_SyncStateStore_load_unknown_scope(sync_state_store):
+    state = sync_state_store.load("connector:board")
+    assert state.last_run_at is None
+    assert state.fingerprints == {}
+    assert state.cursors == {}
+
+
+def test_SyncStateStore_save_and_load(sync_state_store):
+    last_run_at = datetime.datetime(2022, 1, 2, 3, 4, 5, tzinfo=datetime.timezone.utc)
+    state = SyncState(
+        last_run_at=last_run_at,
+        fingerprints=dict(REF1="abc", REF2="def"),
+        cursors=dict(page_id="xyz"),
+    )
+    sync_state_store.save("connector:board", state)
+
+    loaded_state = sync_state_store.load("connector:board")
+    assert loaded_state == state
+    assert sync_state_store.load("connector:other_board").last_run_at is None
+
+    # Saving again replaces the fingerprints
+    state.fingerprints = dict(REF3="ghi")
+    sync_state_store.save("connector:board", state)
+    assert sync_state_store.load("connector:board").fingerprints == dict(REF3="ghi")
+
+
+def test_SQLiteSyncStateStore_persists_between_instances(tmp_path):
+    path = str(tmp_path / "state.sqlite")
+    SQLiteSyncStateStore(path=path).save(
+        "connector:board", SyncState(fingerprints=dict(REF1="abc"))
+    )
+    state = SQLiteSyncStateStore(path=path).load("connector:board")
+    assert state.fingerprints == dict(REF1="abc")
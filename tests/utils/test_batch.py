@@ -0,0 +1,27 @@
+import pytest
+
+from hrflow_connectors.utils.batch import chunked
+
+
+def test_chunked():
+    assert list(chunked([1, 2, 3, 4, 5], size=2)) == [[1, 2], [3, 4], [5]]
+    assert list(chunked([1, 2, 3, 4], size=2)) == [[1, 2], [3, 4]]
+    assert list(chunked([], size=2)) == []
+
+
+def test_chunked_is_lazy():
+    consumed = []
+
+    def generate():
+        for element in range(10):
+            consumed.append(element)
+            yield element
+
+    chunk_iter = chunked(generate(), size=3)
+    assert next(chunk_iter) == [0, 1, 2]
+    assert consumed == [0, 1, 2]
+
+
+def test_chunked_with_invalid_size():
+    with pytest.raises(ValueError):
+        list(chunked([1, 2], size=0))
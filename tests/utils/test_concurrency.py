@@ -0,0 +1,106 @@
+import threading
+import time
+
+import pytest
+
+from hrflow_connectors.utils.concurrency import ordered_parallel_map, prefetch
+
+
+def test_ordered_parallel_map_keeps_input_order():
+    def slow_double(value):
+        # The first values are the slowest to complete
+        time.sleep(0.01 * (5 - value))
+        return value * 2
+
+    result = list(ordered_parallel_map(slow_double, range(5), max_workers=5))
+    assert result == [0, 2, 4, 6, 8]
+
+
+def test_ordered_parallel_map_without_concurrency():
+    thread_names = set()
+
+    def record_thread(value):
+        thread_names.add(threading.current_thread().name)
+        return value
+
+    result = list(ordered_parallel_map(record_thread, range(3), max_workers=1))
+    assert result == [0, 1, 2]
+    assert thread_names == {threading.current_thread().name}
+
+
+def test_ordered_parallel_map_bounds_the_calls_in_flight():
+    lock = threading.Lock()
+    state = dict(in_flight=0, max_in_flight=0)
+
+    def track(value):
+        with lock:
+            state["in_flight"] += 1
+            state["max_in_flight"] = max(state["max_in_flight"], state["in_flight"])
+        time.sleep(0.005)
+        with lock:
+            state["in_flight"] -= 1
+        return value
+
+    result = list(ordered_parallel_map(track, range(20), max_workers=8, max_in_flight=3))
+    assert result == list(range(20))
+    assert state["max_in_flight"] <= 3
+
+
+def test_ordered_parallel_map_raises_first_error_in_input_order():
+    def fail_on_odd(value):
+        if value % 2 == 1:
+            # The later failure completes first
+            time.sleep(0.01 * (5 - value))
+            raise ValueError(value)
+        return value
+
+    result = []
+    try:
+        for value in ordered_parallel_map(fail_on_odd, range(5), max_workers=4):
+            result.append(value)
+        assert False
+    except ValueError as error:
+        assert error.args == (1,)
+    assert result == [0]
+
+
+def test_prefetch_reads_ahead_in_background():
+    produced = []
+
+    def produce():
+        for value in range(3):
+            produced.append(value)
+            yield value
+
+    prefetched_iter = prefetch(produce(), buffer_size=1)
+    assert next(prefetched_iter) == 0
+    # The next element is produced while the current one is consumed
+    time.sleep(0.05)
+    assert produced == [0, 1, 2]
+    assert list(prefetched_iter) == [1, 2]
+
+
+def test_prefetch_raises_error_at_its_position():
+    def produce():
+        yield 1
+        raise RuntimeError("page 2")
+
+    prefetched_iter = prefetch(produce())
+    assert next(prefetched_iter) == 1
+    with pytest.raises(RuntimeError, match="page 2"):
+        next(prefetched_iter)
+
+
+def test_prefetch_stops_producer_when_consumer_stops():
+    produced = []
+
+    def produce():
+        for value in range(100):
+            produced.append(value)
+            yield value
+
+    prefetched_iter = prefetch(produce(), buffer_size=2)
+    assert next(prefetched_iter) == 0
+    prefetched_iter.close()
+    time.sleep(0.3)
+    assert len(produced) < 10
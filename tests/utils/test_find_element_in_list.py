@@ -1,4 +1,6 @@
-from hrflow_connectors.utils.hrflow import find_element_in_list
+import pytest
+
+from hrflow_connectors.utils.hrflow import find_element_in_list, ElementIndex
 
 def test_find_element_in_list():
     element_list = [dict(n="a", v=2), dict(n="b", v=3)]
@@ -9,3 +11,38 @@ def test_find_element_in_list():
     assert find_element_in_list(element_list, n=3) == None
     assert find_element_in_list(element_list, n="b", v=42) == None
     assert find_element_in_list(element_list, n="b", v=2) == None
+
+
+def test_find_element_in_list_with_index():
+    element_list = [dict(n="a", v=2), dict(n="b", v=3), dict(n="a", v=4)]
+    index = ElementIndex(element_list, "n")
+    assert find_element_in_list(element_list, index=index, n="a") == dict(n="a", v=2)
+    assert find_element_in_list(element_list, index=index, n="b") == dict(n="b", v=3)
+    assert find_element_in_list(element_list, index=index, n="c") == None
+    # The index does not cover `v`, so the list is scanned
+    assert find_element_in_list(element_list, index=index, v=4) == dict(n="a", v=4)
+
+
+def test_element_index_add():
+    element_list = [dict(n="a", v=2)]
+    index = ElementIndex(element_list, "n")
+    assert index.find(n="b") == None
+
+    element = dict(n="b", v=3)
+    element_list.append(element)
+    index.add(element)
+    assert index.find(n="b") == element
+
+
+def test_element_index_with_missing_and_unhashable_values():
+    element_list = [dict(v=1), dict(n=None, v=2), dict(n=["x"], v=3)]
+    index = ElementIndex(element_list, "n")
+    assert index.find(n=None) == dict(n=None, v=2)
+    assert index.find(n=["x"]) == dict(n=["x"], v=3)
+    assert index.find(n=["y"]) == None
+
+
+def test_element_index_with_wrong_fields():
+    index = ElementIndex([dict(n="a", v=2)], "n")
+    with pytest.raises(ValueError):
+        index.find(v=2)
@@ -0,0 +1,33 @@
+from hrflow_connectors.utils.hrflow import (
+    compute_job_fingerprint,
+    get_job_fingerprint,
+    FINGERPRINT_TAG_NAME,
+)
+
+
+def test_compute_job_fingerprint_ignores_field_order_and_board_fields():
+    job = dict(reference="REF1", name="Developer", tags=[dict(name="a", value="b")])
+    same_job = dict(
+        name="Developer",
+        key="abc",
+        archived_at="2021-12-25T00:00:00",
+        tags=[
+            dict(name="a", value="b"),
+            dict(name=FINGERPRINT_TAG_NAME, value="old"),
+        ],
+        reference="REF1",
+    )
+    assert compute_job_fingerprint(job) == compute_job_fingerprint(same_job)
+
+
+def test_compute_job_fingerprint_changes_with_content():
+    job = dict(reference="REF1", name="Developer")
+    other_job = dict(reference="REF1", name="Python Developer")
+    assert compute_job_fingerprint(job) != compute_job_fingerprint(other_job)
+
+
+def test_get_job_fingerprint():
+    job = dict(tags=[dict(name=FINGERPRINT_TAG_NAME, value="abc")])
+    assert get_job_fingerprint(job) == "abc"
+    assert get_job_fingerprint(dict(tags=None)) is None
+    assert get_job_fingerprint(dict()) is None
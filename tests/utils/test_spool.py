@@ -0,0 +1,29 @@
+from hrflow_connectors.utils.spool import SpooledStream
+from hrflow_connectors.utils.schemas import HrflowJob
+
+
+def test_SpooledStream_in_memory():
+    spooled_stream = SpooledStream(max_items_in_memory=10)
+    for element in ["a", "b", "c"]:
+        spooled_stream.append(element)
+
+    assert len(spooled_stream) == 3
+    assert list(spooled_stream) == ["a", "b", "c"]
+    assert spooled_stream._file is None
+    spooled_stream.close()
+
+
+def test_SpooledStream_spills_to_disk_and_keeps_order():
+    job_list = [HrflowJob(reference=f"REF{i}") for i in range(5)]
+    with SpooledStream(max_items_in_memory=2) as spooled_stream:
+        for job in job_list:
+            spooled_stream.append(job)
+
+        assert len(spooled_stream) == 5
+        assert spooled_stream._file is not None
+        assert list(spooled_stream) == job_list
+        # The buffer can be read several times
+        assert list(spooled_stream) == job_list
+
+    assert len(spooled_stream) == 0
+    assert spooled_stream._file is None